@@ -0,0 +1,170 @@
+"""Dispatch SemanticAnalyzer: tabel visitor per kelas node dibandingkan dengan
+dispatch lama (nama "visit_<Kelas>" + getattr untuk setiap node, generic_visit
+yang memindai __dict__, dan rantai isinstance di analyze_expression), yang
+dibangun ulang di LegacyDispatchAnalyzer.
+
+Program padat ekspresi: shape expressions dan statements dari gen_program,
+ditambah --stmts assignment dengan ekspresi integer/real/boolean selebar
+--width operand. Anotasi type_index/tab_index dan error kedua analyzer
+harus sama.
+
+    python bench/bench_analyzer_dispatch.py [--size 400] [--stmts 2000] [--width 8] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import load_dfa_rules
+from lexer_codegen import tokenize
+from parser2 import Token, parse_tokens
+from ast_nodes import *
+from ast_transformer import ASTTransformer
+from ast_analyzer import T_NOTYPE, SemanticAnalyzer
+from ast_serializer import dumps, loads
+from gen_program import generate as generate_shape
+
+
+class LegacyDispatchAnalyzer(SemanticAnalyzer):
+    def analyze(self, node):
+        if node is None: return T_NOTYPE
+        method_name = f"visit_{node.__class__.__name__}"
+        visitor = getattr(self, method_name, self.generic_visit)
+        return visitor(node)
+
+    def generic_visit(self, node):
+        res = T_NOTYPE
+        if hasattr(node, '__dict__'):
+            for key, value in node.__dict__.items():
+                if isinstance(value, list):
+                    for item in value:
+                        if isinstance(item, AST):
+                            val = self.analyze(item)
+                            if val != T_NOTYPE: res = val
+                elif isinstance(value, AST):
+                    val = self.analyze(value)
+                    if val != T_NOTYPE: res = val
+        return res
+
+    def analyze_expression(self, node):
+        if node is None:
+            return T_NOTYPE
+        if isinstance(node, (NumberNode, CharNode, StringNode, BooleanNode)):
+            if isinstance(node, NumberNode):
+                return self._visit_NumberNode_expr(node)
+            elif isinstance(node, CharNode):
+                return self._visit_CharNode_expr(node)
+            elif isinstance(node, StringNode):
+                return self._visit_StringNode_expr(node)
+            return self._visit_BooleanNode_expr(node)
+        if isinstance(node, FieldAccessNode):
+            return self._visit_FieldAccessNode_expr(node)
+        if isinstance(node, VarNode):
+            return self._visit_VarNode_expr(node)
+        if isinstance(node, CallNode):
+            return self._visit_CallNode_expr(node)
+        if isinstance(node, UnaryOpNode):
+            return self._visit_UnaryOpNode_expr(node)
+        if isinstance(node, BinOpNode):
+            return self._visit_BinOpNode_expr(node)
+        if isinstance(node, SimpleExprNode):
+            return self._visit_SimpleExprNode_expr(node)
+        if isinstance(node, TermNode):
+            return self._visit_TermNode_expr(node)
+        return T_NOTYPE
+
+
+def generate_dense(n_stmts, width, rng):
+    decls = ["variabel", "    a, b, c: integer;", "    x, y: real;", "    p, q: boolean;"]
+    body = ["a := 1", "b := 2", "c := 3", "x := 0.5", "y := 1.5", "p := benar", "q := salah"]
+    for _ in range(n_stmts):
+        kind = rng.randrange(3)
+        if kind == 0:
+            operands = [rng.choice(["a", "b", "c", str(rng.randrange(1, 9)), "(a + 1)"]) for _ in range(width)]
+            expr = operands[0] + "".join(f" {rng.choice(['+', '-', '*', 'mod', 'bagi'])} {o}" for o in operands[1:])
+            body.append(f"a := {expr}")
+        elif kind == 1:
+            operands = [rng.choice(["x", "y", "a", "1.5", "(-b)"]) for _ in range(width)]
+            expr = operands[0] + "".join(f" {rng.choice(['+', '-', '*', '/'])} {o}" for o in operands[1:])
+            body.append(f"x := {expr}")
+        else:
+            operands = [rng.choice(["p", "q", "(a < b)", "(x >= y)", "(c = 3)"]) for _ in range(width)]
+            expr = operands[0] + "".join(f" {rng.choice(['atau', 'dan'])} {o}" for o in operands[1:])
+            body.append(f"p := {expr}")
+    return "\n".join(["program padat;"] + decls + ["mulai", ";\n".join("    " + s for s in body), "selesai."]) + "\n"
+
+
+def build(source, dfa):
+    code, raw = tokenize(source, dfa)
+    root, success, end_idx, _ = parse_tokens([Token(t, v) for t, v in raw])
+    if code != 0 or not success or end_idx != len(raw):
+        return None
+    return dumps(ASTTransformer().transform(root))
+
+
+def annotations(ast):
+    out = []
+    stack = [ast]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, AST):
+            out.append((value.__dict__.get("type_index"), value.__dict__.get("tab_index")))
+            stack.extend(value.__dict__.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return out
+
+
+def run(cls, data):
+    ast = loads(data)
+    t0 = time.perf_counter()
+    errors = cls().analyze_all(ast)
+    return time.perf_counter() - t0, errors, annotations(ast)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--size", type=int, default=400)
+    ap.add_argument("--stmts", type=int, default=2000)
+    ap.add_argument("--width", type=int, default=8)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+    sys.setrecursionlimit(100000)
+    dfa = load_dfa_rules()
+
+    programs = [
+        ("expressions", generate_shape("expressions", args.size, args.seed)),
+        ("statements", generate_shape("statements", args.size, args.seed)),
+        ("padat", generate_dense(args.stmts, args.width, random.Random(args.seed))),
+    ]
+    ok = True
+    print(f"{'program':<12} {'node':>7} {'lama ms':>9} {'tabel ms':>9} {'':>6}")
+    for label, source in programs:
+        data = build(source, dfa)
+        if data is None:
+            print(f"{label:<12} gagal di-parse")
+            ok = False
+            continue
+        # bergantian agar gangguan mesin mengenai kedua analyzer
+        results = {}
+        for _ in range(args.repeat):
+            for cls in (LegacyDispatchAnalyzer, SemanticAnalyzer):
+                elapsed, errors, types = run(cls, data)
+                best = results[cls][0] if cls in results else elapsed
+                results[cls] = (min(best, elapsed), errors, types)
+        legacy, table = results[LegacyDispatchAnalyzer], results[SemanticAnalyzer]
+        same = legacy[1:] == table[1:]
+        ok &= same
+        print(f"{label:<12} {len(table[2]):>7} {legacy[0] * 1000:>9.1f} {table[0] * 1000:>9.1f}"
+              f" {legacy[0] / table[0]:>5.2f}x  {'sama' if same else 'BERBEDA'}"
+              f"{f', {len(table[1])} error' if table[1] else ''}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
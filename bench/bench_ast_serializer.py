@@ -0,0 +1,194 @@
+"""Serialisasi AST (src/ast_serializer.py) dibandingkan dengan pickle.
+
+1. Kesamaan: AST setiap file .pas di test/ yang lolos parsing dan program
+   sintetis semua shape, sebelum dan sesudah SemanticAnalyzer (anotasi
+   tab_index/type_index), harus kembali identik setelah loads(dumps(ast)):
+   kelas, urutan atribut, dan nilai sama, identifier VarNode tetap objek str
+   yang di-intern.
+2. Ukuran dan waktu dumps/loads per shape untuk program besar, dibandingkan
+   dengan pickle protokol tertinggi (mentah dan setelah zlib).
+3. Kedalaman: shape nesting sedalam --deep dengan recursion limit default;
+   pickle gagal dengan RecursionError, serializer tidak.
+4. IPC: worker ProcessPoolExecutor mem-parse program dan mengembalikan AST,
+   sebagai objek (di-pickle oleh pool) atau sebagai bytes dumps().
+
+    python bench/bench_ast_serializer.py [--size 400] [--deep 3000] [--repeat 10] [--procs 2]
+"""
+import argparse
+import gc
+import glob
+import os
+import pickle
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import load_dfa_rules
+from lexer_codegen import tokenize
+from parser2 import Token, parse_tokens
+from ast_nodes import AST, VarNode
+from ast_transformer import ASTTransformer
+from ast_analyzer import SemanticAnalyzer
+from ast_serializer import dumps, loads
+from gen_program import SHAPES, generate
+
+
+def build_ast(source, dfa):
+    code, raw = tokenize(source, dfa)
+    if code != 0:
+        return None
+    root, success, end_idx, _ = parse_tokens([Token(t, v) for t, v in raw])
+    if not success or end_idx != len(raw):
+        return None
+    return ASTTransformer().transform(root)
+
+
+def same_ast(a, b):
+    stack = [(a, b)]
+    while stack:
+        a, b = stack.pop()
+        if isinstance(a, AST):
+            if type(a) is not type(b) or list(a.__dict__) != list(b.__dict__):
+                return False
+            # identifier dari Token di-intern; hasil loads() harus objek yang sama
+            if type(a) is VarNode and a.identifier is not b.identifier:
+                return False
+            stack.extend(zip(a.__dict__.values(), b.__dict__.values()))
+        elif isinstance(a, list):
+            if not isinstance(b, list) or len(a) != len(b):
+                return False
+            stack.extend(zip(a, b))
+        elif type(a) is not type(b) or a != b:
+            return False
+    return True
+
+
+def best_time(fn, repeat):
+    # GC dimatikan selama pengukuran: koleksi generasi tua dipicu oleh alokasi
+    # node dan jatuh ke fungsi mana pun yang sedang berjalan, sehingga tanpa
+    # ini perbandingan dengan pickle bergantung pada urutan pengukuran
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            t0 = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - t0
+        finally:
+            gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+_dfa = None
+
+
+def _worker_parse(source, as_bytes):
+    global _dfa
+    if _dfa is None:
+        _dfa = load_dfa_rules()
+    sys.setrecursionlimit(100000)
+    ast = build_ast(source, _dfa)
+    return dumps(ast) if as_bytes else ast
+
+
+def check_round_trip(dfa):
+    sources = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test", "**", "*.pas"), recursive=True)):
+        with open(path, encoding="utf-8") as f:
+            sources.append((os.path.relpath(path, ROOT), f.read()))
+    for shape in SHAPES:
+        sources.append((f"{shape} 20", generate(shape, 20, 0)))
+
+    checked = failures = 0
+    for label, source in sources:
+        ast = build_ast(source, dfa)
+        if ast is None:
+            continue
+        for stage in ("ast", "analyzed"):
+            if stage == "analyzed":
+                SemanticAnalyzer(collect_errors=True).analyze_all(ast)
+            checked += 1
+            if not same_ast(ast, loads(dumps(ast))):
+                print(f"BEDA {label} ({stage})")
+                failures += 1
+    print(f"{checked} AST round-trip, {failures} berbeda")
+    return failures == 0
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--size", type=int, default=400)
+    ap.add_argument("--deep", type=int, default=3000)
+    ap.add_argument("--repeat", type=int, default=10)
+    ap.add_argument("--procs", type=int, default=2)
+    args = ap.parse_args()
+    default_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(100000)
+    dfa = load_dfa_rules()
+
+    ok = check_round_trip(dfa)
+
+    print(f"\n{'shape':<12} {'node':>7} {'byte':>9} {'pickle':>9} {'zlib':>8} {'pickle+zlib':>12}"
+          f" {'dumps':>7} {'pickle':>7} {'loads':>7} {'unpickle':>8}   (ms)")
+    for shape in SHAPES:
+        ast = build_ast(generate(shape, args.size, 0), dfa)
+        data = dumps(ast)
+        pickled = pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL)
+        nodes = sum(1 for _ in _walk(ast))
+        t_dumps = best_time(lambda: dumps(ast), args.repeat)
+        t_pickle = best_time(lambda: pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL), args.repeat)
+        t_loads = best_time(lambda: loads(data), args.repeat)
+        t_unpickle = best_time(lambda: pickle.loads(pickled), args.repeat)
+        print(f"{shape:<12} {nodes:>7} {len(data):>9} {len(pickled):>9} {len(zlib.compress(data)):>8}"
+              f" {len(zlib.compress(pickled)):>12} {t_dumps * 1000:>7.1f} {t_pickle * 1000:>7.1f}"
+              f" {t_loads * 1000:>7.1f} {t_unpickle * 1000:>8.1f}")
+
+    deep = build_ast(generate("nesting", args.deep, 0), dfa)
+    sys.setrecursionlimit(default_limit)
+    try:
+        pickle.dumps(deep, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle_result = "berhasil"
+    except RecursionError:
+        pickle_result = "RecursionError"
+    try:
+        serial_ok = same_ast(deep, loads(dumps(deep)))
+        serial_result = "identik" if serial_ok else "BERBEDA"
+    except RecursionError:
+        serial_ok, serial_result = False, "RecursionError"
+    ok &= serial_ok
+    sys.setrecursionlimit(100000)
+    print(f"\nnesting {args.deep}, recursion limit {default_limit}: pickle {pickle_result}, ast_serializer {serial_result}")
+
+    sources = [generate(shape, args.size // 4, 0) for shape in SHAPES if shape != "nesting"]
+    with ProcessPoolExecutor(args.procs) as pool:
+        list(pool.map(_worker_parse, sources, [True] * len(sources)))
+        for as_bytes in (False, True):
+            t0 = time.perf_counter()
+            results = list(pool.map(_worker_parse, sources, [as_bytes] * len(sources)))
+            if as_bytes:
+                results = [loads(r) for r in results]
+            elapsed = time.perf_counter() - t0
+            label = "bytes dumps()" if as_bytes else "objek (pickle)"
+            print(f"IPC {len(sources)} program, hasil {label:<15}: {elapsed * 1000:.1f} ms")
+    sys.exit(0 if ok else 1)
+
+
+def _walk(ast):
+    stack = [ast]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, AST):
+            yield value
+            stack.extend(value.__dict__.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+
+
+if __name__ == "__main__":
+    main()
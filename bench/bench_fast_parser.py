@@ -0,0 +1,150 @@
+"""Parser cepat (src/parser.py, --parser=fast) dibandingkan dengan parser2.
+
+1. Kesamaan: setiap file .pas di test/ yang lolos lexer, program sintetis dari
+   gen_program.py untuk semua shape, dan mutasi token acak dari keduanya (token
+   dihapus, diduplikasi, ditukar, atau diganti token lain) diparse oleh kedua
+   parser. Hasil (berhasil?, indeks akhir) dan CST-nya (kelas node, urutan
+   children, objek Token yang sama) harus identik. Untuk parse yang lengkap,
+   parser2 mode recovery (--all-errors) juga harus tidak menemukan error dan
+   menghasilkan CST yang sama, karena compiler.py memakai hasil parser cepat
+   di mode itu. parser2 tanpa ParseErrorContext (fase pertama parse_tokens)
+   juga harus memberi hasil dan CST yang sama dengan parser2 dengan context.
+2. Waktu: parse program sintetis per shape: parser2 dengan ParseErrorContext
+   (fase diagnostik), parser2 tanpa context (fase pertama), dan parser cepat.
+
+    python bench/bench_fast_parser.py [--size 100] [--mutants 40] [--repeat 3] [--seed 0]
+"""
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import load_dfa_rules
+from lexer_codegen import tokenize
+from parser2 import ProgramNode, ParseErrorContext, Token
+from parser import Parser
+from gen_program import SHAPES, generate
+
+
+def same_tree(a, b):
+    stack = [(a, b)]
+    while stack:
+        a, b = stack.pop()
+        if isinstance(a, Token) or isinstance(b, Token):
+            if a is not b:
+                return False
+            continue
+        if type(a) is not type(b) or a.name != b.name or len(a.children) != len(b.children):
+            return False
+        stack.extend(zip(a.children, b.children))
+    return True
+
+
+def parse_slow(tokens, recover=False):
+    root = ProgramNode()
+    error_ctx = ParseErrorContext(recover=recover)
+    success, end_idx = root.parse(tokens, 0, error_ctx)
+    return success, end_idx, root if success else None, error_ctx
+
+
+def compare(label, tokens):
+    success, end_idx, root, _ = parse_slow(tokens)
+    quiet = ProgramNode()
+    if quiet.parse(tokens, 0) != (success, end_idx) or (success and not same_tree(root, quiet)):
+        print(f"BEDA tanpa ParseErrorContext {label}")
+        return False
+    fast_success, fast_end, fast_root = Parser(tokens).parse()
+    if (success, end_idx) != (fast_success, fast_end):
+        print(f"BEDA {label}: parser2 {(success, end_idx)}, cepat {(fast_success, fast_end)}")
+        return False
+    if success and not same_tree(root, fast_root):
+        print(f"BEDA CST {label}")
+        return False
+    if success and end_idx == len(tokens):
+        ok, _, recovered, error_ctx = parse_slow(tokens, recover=True)
+        if not ok or error_ctx.errors or not same_tree(recovered, fast_root):
+            print(f"BEDA mode recovery {label}")
+            return False
+    return True
+
+
+def mutate(tokens, rng):
+    tokens = list(tokens)
+    for _ in range(rng.randint(1, 3)):
+        i = rng.randrange(len(tokens))
+        kind = rng.randrange(4)
+        if kind == 0 and len(tokens) > 1:
+            del tokens[i]
+        elif kind == 1:
+            tokens.insert(i, tokens[i])
+        elif kind == 2:
+            j = rng.randrange(len(tokens))
+            tokens[i], tokens[j] = tokens[j], tokens[i]
+        else:
+            tokens[i] = tokens[rng.randrange(len(tokens))]
+    return tokens
+
+
+def best_time(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--size", type=int, default=100)
+    ap.add_argument("--mutants", type=int, default=40)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+    sys.setrecursionlimit(100000)
+
+    dfa = load_dfa_rules()
+    programs = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test", "**", "*.pas"), recursive=True)):
+        with open(path, encoding="utf-8") as f:
+            programs.append((os.path.relpath(path, ROOT), f.read()))
+    for shape in SHAPES:
+        for size in (1, 3, 10):
+            programs.append((f"{shape} {size}", generate(shape, size, args.seed)))
+
+    rng = random.Random(args.seed)
+    checked = mismatches = 0
+    for label, source in programs:
+        code, raw = tokenize(source, dfa)
+        if code != 0:
+            continue
+        tokens = [Token(t, v) for t, v in raw]
+        cases = [(label, tokens)]
+        cases += [(f"{label} mutasi {k}", mutate(tokens, rng)) for k in range(args.mutants)]
+        for case_label, case_tokens in cases:
+            checked += 1
+            if not compare(case_label, case_tokens):
+                mismatches += 1
+    print(f"{checked} token stream dibandingkan, {mismatches} berbeda")
+    if mismatches:
+        sys.exit(1)
+
+    print(f"\n{'shape':<12} {'token':>7} {'parser2+ctx':>12} {'parser2':>9} {'cepat':>9}   (ms)")
+    for shape in SHAPES:
+        code, raw = tokenize(generate(shape, args.size, args.seed), dfa)
+        tokens = [Token(t, v) for t, v in raw]
+        t_ctx = best_time(lambda: ProgramNode().parse(tokens, 0, ParseErrorContext()), args.repeat)
+        t_slow = best_time(lambda: ProgramNode().parse(tokens, 0), args.repeat)
+        t_fast = best_time(lambda: Parser(tokens).parse(), args.repeat)
+        print(f"{shape:<12} {len(tokens):>7} {t_ctx * 1000:>12.1f} {t_slow * 1000:>9.1f} {t_fast * 1000:>9.1f}"
+              f"   tanpa ctx {t_ctx / t_slow:.2f}x, cepat {t_slow / t_fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
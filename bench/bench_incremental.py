@@ -0,0 +1,175 @@
+"""Benchmark kompilasi inkremental (src/incremental.py) pada file dengan banyak subprogram.
+
+Setiap putaran mengedit satu subprogram acak: badan saja (mode "body"), header
+(mode "signature"), atau badan program utama (mode "full"). Hasil setiap edit
+dibandingkan dengan kompilasi penuh file yang sama: token, parse tree (per
+node), error, dan isi tab/btab/atab yang terjangkau dari blok program. Baris
+tabel diberi nomor ulang menurut urutan kunjungan, karena analisis ulang
+inkremental menambah baris baru dan meninggalkan baris lama yang tidak
+terjangkau.
+
+    python bench/bench_incremental.py [--procs N] [--stmts M] [--edits K] [--seed S]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import load_dfa_rules
+from parser2 import Token
+from ast_analyzer import OBJ_PROCEDURE, OBJ_FUNCTION
+from incremental import IncrementalCompiler
+
+BODY_EDITS = [
+    ("a := a + 1", "a := a + 2"),
+    ("a := a + 1", "a := benar"),        # type error
+    ("a := a + 1", "a := tidakada + 1"),  # undeclared
+    ("a := a + 1", "a := a + 1; b := a * 2"),
+]
+
+
+def build_program(procs, stmts):
+    lines = ["program besar;", "variabel g: integer;"]
+    for p in range(procs):
+        body = "; ".join(["a := a + 1", "b := a * b", "g := g + a"] * (stmts // 3))
+        lines.append(f"prosedur p{p}(a: integer);")
+        lines.append("variabel b: integer;")
+        lines.append(f"mulai {body} selesai;")
+    calls = "; ".join(f"p{p}(g)" for p in range(procs))
+    lines.append(f"mulai {calls} selesai.")
+    return "\n".join(lines)
+
+
+def edit(source, procs, rng):
+    kind = rng.random()
+    p = rng.randrange(procs)
+    start = source.index(f"prosedur p{p}(")
+    if kind < 0.8:
+        old, new = rng.choice(BODY_EDITS)
+        idx = source.index(old, start)
+        return source[:idx] + new + source[idx + len(old):], "body"
+    if kind < 0.9:
+        idx = source.index("a: integer", start)
+        return source[:idx] + "a: real" + source[idx + len("a: integer"):], "signature"
+    call = f"p{p}(g"
+    idx = source.rindex(call)
+    return source[:idx] + call + " + 1" + source[idx + len(call):], "full"
+
+
+def same_tree(a, b):
+    stack = [(a, b)]
+    while stack:
+        a, b = stack.pop()
+        if isinstance(a, Token) or isinstance(b, Token):
+            if not (isinstance(a, Token) and isinstance(b, Token)
+                    and a.tipe == b.tipe and a.nilai == b.nilai):
+                return False
+            continue
+        if type(a) is not type(b) or len(a.children) != len(b.children):
+            return False
+        stack.extend(zip(a.children, b.children))
+    return True
+
+
+def table_snapshot(analyzer):
+    # isi tabel yang terjangkau dari blok program; indeks tab/btab/atab diganti
+    # bentuk strukturnya (entry yang dirujuk: nomor urut kunjungannya)
+    tab, btab, atab = analyzer.tab, analyzer.btab, analyzer.atab
+    ids = {}
+
+    def type_ref(t, ref):
+        if t == 5 and ref > 0:
+            row = atab.row(ref - 1)
+            return ("array", row[0], type_ref(row[1], row[2])) + row[3:]
+        if t == 6:
+            return ("record", block(ref, None))
+        if t > 6:
+            return ("tab", ids.get(t, ("?", t)))
+        return t
+
+    def block(b, lev):
+        # entry blok dalam urutan deklarasi; blok subprogram berlanjut ke scope luar
+        chain = []
+        idx = btab.last[b]
+        while idx > 0 and (lev is None or tab.lev[idx] == lev):
+            chain.append(idx)
+            idx = tab.link[idx]
+        chain.reverse()
+        lpar = btab.lpar[b]
+        return (chain.index(lpar) if lpar in chain else -1, btab.psze[b], btab.vsze[b],
+                tuple(entry(i) for i in chain))
+
+    def entry(i):
+        ids[i] = len(ids)
+        row = (tab[i].name, tab.obj[i], tab.nrm[i], tab.lev[i], tab.adr[i],
+               type_ref(tab.type[i], tab.ref[i]))
+        if tab.obj[i] in (OBJ_PROCEDURE, OBJ_FUNCTION):
+            types, is_var = tab.signatures.get(i, ((), ()))
+            row += (tuple(type_ref(t, 0) for t in types), tuple(is_var),
+                    block(analyzer.subprogram_blocks[i], tab.lev[i] + 1))
+        return row
+
+    return block(analyzer.display[1], 1)
+
+
+def same_result(session, full):
+    if [(t.tipe, t.nilai) for t in session.tokens] != [(t.tipe, t.nilai) for t in full.tokens]:
+        return "token"
+    if (session.parse_tree is None) != (full.parse_tree is None) or (
+            full.parse_tree is not None and not same_tree(session.parse_tree, full.parse_tree)):
+        return "parse tree"
+    if list(session.errors) != list(full.errors):
+        return "error"
+    if full.analyzer is not None and table_snapshot(session.analyzer) != table_snapshot(full.analyzer):
+        return "tab/btab/atab"
+    return None
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--procs", type=int, default=30)
+    ap.add_argument("--stmts", type=int, default=30)
+    ap.add_argument("--edits", type=int, default=50)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--no-check", action="store_true", help="lewati perbandingan dengan kompilasi penuh")
+    args = ap.parse_args()
+
+    sys.setrecursionlimit(100000)
+    dfa = load_dfa_rules()
+    rng = random.Random(args.seed)
+    source = build_program(args.procs, args.stmts)
+
+    t0 = time.perf_counter()
+    session = IncrementalCompiler(source, dfa)
+    full_time = time.perf_counter() - t0
+    print(f"file: {len(source)} karakter, {len(session.tokens)} token, {len(session.regions)} subprogram")
+    print(f"kompilasi penuh: {full_time * 1000:.1f} ms")
+
+    times = {}
+    for _ in range(args.edits):
+        source, expected = edit(source, args.procs, rng)
+        t0 = time.perf_counter()
+        session.update(source)
+        elapsed = time.perf_counter() - t0
+        times.setdefault(session.last_mode, []).append(elapsed)
+        if session.last_mode != expected:
+            print(f"mode tidak sesuai: {session.last_mode} (diharapkan {expected})")
+            sys.exit(1)
+        if not args.no_check:
+            diff = same_result(session, IncrementalCompiler(source, dfa))
+            if diff:
+                print(f"hasil inkremental berbeda dari kompilasi penuh: {diff} (mode {session.last_mode})")
+                sys.exit(1)
+
+    for mode, ts in sorted(times.items()):
+        ts.sort()
+        print(f"{mode:<10}: {len(ts):>3} edit, median {ts[len(ts) // 2] * 1000:8.2f} ms")
+    print(f"error akhir: {len(session.errors)}")
+
+
+if __name__ == "__main__":
+    main()
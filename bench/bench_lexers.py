@@ -0,0 +1,185 @@
+"""Bandingkan backend lexer: DFA (lexer.py), master regex (regex_lexer.py),
+lexer Python hasil generate (lexer_codegen.py), dan DFA per byte pada file yang
+di-mmap (mmap_lexer.py).
+
+1. Setiap file .pas di test/ dan sejumlah potongan "aneh" (komentar '(*' yang
+   membawa '(' ke token berikutnya, '**', string dengan '', karakter tidak
+   valid, komentar/string tidak tertutup, huruf non-ASCII) di-lex dengan semua
+   backend; token, offset, dan kode error harus identik. Backend mmap membaca
+   file sementara, jadi dibandingkan dengan DFA pada teks hasil universal
+   newline ('\r\n' dan '\r' menjadi '\n').
+2. Fuzz: string acak dari alfabet karakter "berbahaya" juga harus identik.
+3. Mode toleran error (lexer_recovery.py): hasil chunk cepat + DFA toleran harus
+   sama dengan DFA toleran murni untuk berbagai ukuran chunk, dan untuk input
+   tanpa error sama dengan tokenize().
+4. Throughput (karakter/detik) pada program sintetis bench/gen_program.py;
+   untuk mmap waktu membuka dan membaca file ikut dihitung, untuk backend lain
+   tidak.
+
+    python bench/bench_lexers.py [--fuzz N] [--size 400] [--repeat 5]
+"""
+import argparse
+import glob
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import lexer
+import lexer_codegen
+import lexer_recovery
+import mmap_lexer
+import regex_lexer
+from gen_program import SHAPES, generate
+
+TMP_PATH = os.path.join(tempfile.gettempdir(), f"bench_lexers.{os.getpid()}.pas")
+
+def write_tmp(source):
+    with open(TMP_PATH, "w", encoding="utf-8", newline="") as f:
+        f.write(source)
+
+def mmap_tokenize(source, dfa, positions=None):
+    write_tmp(source)
+    return mmap_lexer.tokenize_file(TMP_PATH, dfa, positions)
+
+BACKENDS = {
+    "dfa": lexer.tokenize,
+    "regex": regex_lexer.tokenize,
+    "codegen": lexer_codegen.tokenize,
+    "mmap": mmap_tokenize,
+}
+
+SAMPLES = [
+    "(* komentar *)x := 1",
+    "(* a *) (* b *) y",
+    "a (* c *)* b",
+    "a ** komentar *) b",
+    "x{ a }y(*b*)z",
+    "(* a **) b *) c",
+    "'it''s' + 'a'''",
+    "'tidak tertutup",
+    "{ tidak tertutup",
+    "(* tidak tertutup",
+    "(* *) { tidak tertutup",
+    "a := b ! c",
+    "naïve := 1",
+    "x := 'héllo' { ç }",
+    "selain-itu Turun-Ke MOD dan atau",
+    "3.14 ..5 a..b :=:<><=>=<>",
+    "(* *)",
+    "x\x1c\x0by\xa0z",
+    "a_1-b2",
+    "",
+    "a\r\nb := 'x'\r\n",
+    "{ a\r\n }\r\n(* b\r *)x",
+    "'a\r\nb'",
+    "x\ry\r",
+]
+
+FUZZ_ALPHABET = list("ab1_-(*)*{}':=<>.;, \n\t") + ["é", "²", "\xa0", "!", "\r"]
+
+
+def lex(backend, source, dfa):
+    positions = []
+    code, tokens = BACKENDS[backend](source, dfa, positions)
+    return code, tokens, positions if code == 0 else None
+
+
+def check(sources, dfa):
+    mismatches = 0
+    for label, source in sources:
+        expected = lex("dfa", source, dfa)
+        text_mode = lex("dfa", source.replace("\r\n", "\n").replace("\r", "\n"), dfa)
+        for backend in BACKENDS:
+            if backend == "dfa":
+                continue
+            if lex(backend, source, dfa) != (text_mode if backend == "mmap" else expected):
+                mismatches += 1
+                print(f"BEDA [{backend}] {label}")
+    return mismatches
+
+
+def check_tolerant(sources, dfa):
+    mismatches = 0
+    for label, source in sources:
+        expected_tokens, expected_positions = [], []
+        i = 0
+        while i < len(source):
+            i = lexer_recovery._recover(source, i, len(source), dfa, expected_tokens, expected_positions)
+        code, tokens = lexer.tokenize(source, dfa)
+        if code == 0 and tokens != expected_tokens:
+            mismatches += 1
+            print(f"BEDA [toleran vs dfa] {label}")
+            continue
+        for chunk_chars in (1, 7, 64, lexer_recovery.CHUNK_CHARS):
+            positions = []
+            _, tokens = lexer_recovery.tokenize_tolerant(source, dfa, positions, chunk_chars)
+            if tokens != expected_tokens or positions != expected_positions:
+                mismatches += 1
+                print(f"BEDA [toleran chunk {chunk_chars}] {label}")
+                break
+    return mismatches
+
+
+def throughput(backend, source, dfa, repeat):
+    if backend == "mmap":
+        write_tmp(source)
+        fn = lambda _, dfa: mmap_lexer.tokenize_file(TMP_PATH, dfa)
+    else:
+        fn = BACKENDS[backend]
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        code, _ = fn(source, dfa)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    assert code == 0
+    return len(source) / best
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--fuzz", type=int, default=2000)
+    ap.add_argument("--size", type=int, default=400)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    dfa = lexer.load_dfa_rules()
+    sources = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test", "**", "*.pas"), recursive=True)):
+        with open(path, encoding="utf-8") as f:
+            sources.append((os.path.relpath(path, ROOT), f.read()))
+    sources += [(repr(s), s) for s in SAMPLES]
+    rng = random.Random(args.seed)
+    for i in range(args.fuzz):
+        text = "".join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randrange(1, 40)))
+        sources.append((f"fuzz {i}: {text!r}", text))
+
+    try:
+        mismatches = check(sources, dfa)
+    finally:
+        if os.path.exists(TMP_PATH):
+            os.remove(TMP_PATH)
+    mismatches += check_tolerant(sources, dfa)
+    print(f"{len(sources)} input dibandingkan, {mismatches} berbeda")
+    if mismatches:
+        sys.exit(1)
+
+    print(f"\n{'shape':<12} {'karakter':>9}  " + "  ".join(f"{b + ' Mchar/s':>14}" for b in BACKENDS))
+    for shape in SHAPES:
+        source = generate(shape, args.size, args.seed)
+        try:
+            rates = [throughput(b, source, dfa, args.repeat) for b in BACKENDS]
+        finally:
+            if os.path.exists(TMP_PATH):
+                os.remove(TMP_PATH)
+        print(f"{shape:<12} {len(source):>9}  " + "  ".join(f"{r / 1e6:>14.2f}" for r in rates))
+
+
+if __name__ == "__main__":
+    main()
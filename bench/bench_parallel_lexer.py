@@ -0,0 +1,103 @@
+"""Lexing paralel (src/parallel_lexer.py) dibandingkan dengan lexer sekuensial.
+
+1. Kesamaan: setiap file .pas di test/, potongan "aneh" dari bench_lexers.py,
+   dan input fuzz yang memuat banyak baris baru di-lex dengan chunk sangat
+   kecil (sehingga batas chunk sering jatuh di dalam komentar, string, atau
+   setelah carry '(*'); token, offset, dan kode error harus identik dengan
+   lexer_codegen.tokenize. Chunk dijalankan di proses ini (procs=1), lalu
+   sebagian input sekali lagi lewat process pool.
+2. Waktu: program sintetis besar, sekuensial vs paralel untuk tiap jumlah
+   proses di --procs.
+
+    python bench/bench_parallel_lexer.py [--size 20000] [--procs 1,2,4,8] [--fuzz 2000]
+"""
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import lexer
+from lexer_codegen import tokenize
+from parallel_lexer import split_points, tokenize_parallel
+from bench_lexers import FUZZ_ALPHABET, SAMPLES
+from gen_program import generate
+
+CHUNK_SIZES = (1, 2, 5, 17, 100)
+
+
+def lex(fn, source, dfa, **kwargs):
+    positions = []
+    code, tokens = fn(source, dfa, positions, **kwargs)
+    return code, tokens, positions if code == 0 else None
+
+
+def check(sources, dfa, procs):
+    mismatches = 0
+    for label, source in sources:
+        expected = lex(tokenize, source, dfa)
+        for chunk_chars in CHUNK_SIZES:
+            if lex(tokenize_parallel, source, dfa, procs=procs, chunk_chars=chunk_chars) != expected:
+                mismatches += 1
+                print(f"BEDA [chunk {chunk_chars}] {label}")
+                break
+    return mismatches
+
+
+def best_time(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--size", type=int, default=20000)
+    ap.add_argument("--procs", default="1,2,4,8")
+    ap.add_argument("--chunk-chars", type=int, default=1 << 18)
+    ap.add_argument("--fuzz", type=int, default=2000)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    dfa = lexer.load_dfa_rules()
+    sources = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test", "**", "*.pas"), recursive=True)):
+        with open(path, encoding="utf-8") as f:
+            sources.append((os.path.relpath(path, ROOT), f.read()))
+    sources += [(repr(s), s) for s in SAMPLES]
+    rng = random.Random(args.seed)
+    alphabet = FUZZ_ALPHABET + ["\n"] * 4
+    for i in range(args.fuzz):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randrange(1, 60)))
+        sources.append((f"fuzz {i}: {text!r}", text))
+
+    mismatches = check(sources, dfa, procs=1)
+    # process pool hanya untuk file test: membuat pool per input fuzz terlalu lambat
+    mismatches += check(sources[:len(sources) - args.fuzz - len(SAMPLES)], dfa, procs=2)
+    print(f"{len(sources)} input dibandingkan, {mismatches} berbeda")
+    if mismatches:
+        sys.exit(1)
+
+    source = generate("subprograms", args.size, args.seed)
+    chunks = len(split_points(source, args.chunk_chars))
+    t_seq, expected = best_time(lambda: tokenize(source, dfa), args.repeat)
+    print(f"\n{len(source)} karakter, {len(expected[1])} token, {chunks} chunk, {os.cpu_count()} CPU")
+    print(f"{'sekuensial':<12} {t_seq * 1000:>9.1f} ms")
+    for procs in (int(p) for p in args.procs.split(",")):
+        t_par, result = best_time(
+            lambda: tokenize_parallel(source, dfa, procs=procs, chunk_chars=args.chunk_chars), args.repeat)
+        assert result == expected
+        print(f"{f'{procs} proses':<12} {t_par * 1000:>9.1f} ms  {t_seq / t_par:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Putar ulang corpus input lambat parser2 (hasil bench/fuzz_parser.py).
+
+Untuk setiap file di bench/corpus/parser/: jumlah percobaan rule parser2
+(dengan cap yang sama seperti saat disimpan) dibandingkan dengan angka di
+komentar kepala file, lalu waktu parse diukur untuk parser2 dengan
+ParseBudget default (yang dipakai compiler.py dan server.py) dan parser cepat.
+
+Jumlah percobaan deterministik, jadi kenaikan sekecil apa pun adalah regresi
+backtracking: exit code 1 jika ada file yang percobaannya melebihi angka
+tersimpan, atau jika parser2 dengan budget default gagal dengan selain
+ParseBudgetExceeded (mis. RecursionError). Angka yang tersimpan terpotong cap
+(">=") tidak bisa naik lagi; file seperti itu ditandai "di cap" dan sebaiknya
+disimpan ulang dengan cap lebih besar (fuzz_parser.py --record-cap).
+
+    python bench/bench_parse_corpus.py [--corpus DIR] [--repeat 3]
+"""
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import load_dfa_rules
+from lexer_codegen import tokenize
+from parser2 import ParseBudget, ParseBudgetExceeded, Token, parse_tokens
+from parser import Parser
+from fuzz_parser import CORPUS_DIR, count_attempts
+
+HEADER_RE = re.compile(r"\{ fuzz_parser: (>= )?(\d+) percobaan rule, (\d+) token, cap (\d+),")
+
+
+def best_time(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def parse_budgeted(tokens):
+    try:
+        root, success, end_idx, _ = parse_tokens(tokens, budget=ParseBudget())
+        return "lengkap" if success and end_idx == len(tokens) else "syntax error"
+    except ParseBudgetExceeded as e:
+        return e.kind
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--corpus", default=CORPUS_DIR)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    sys.setrecursionlimit(100000)
+
+    dfa = load_dfa_rules()
+    paths = sorted(glob.glob(os.path.join(args.corpus, "*.pas")))
+    if not paths:
+        print(f"corpus kosong: {args.corpus}")
+        sys.exit(1)
+
+    regressions = 0
+    print(f"{'file':<22} {'token':>6} {'tersimpan':>11} {'sekarang':>11} {'parser2 ms':>11} {'hasil':<16} {'cepat ms':>9}")
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        match = HEADER_RE.match(source)
+        code, raw = tokenize(source, dfa)
+        if match is None or code != 0:
+            print(f"{os.path.basename(path):<22} bukan kasus fuzz_parser yang valid")
+            regressions += 1
+            continue
+        recorded_capped, recorded, cap = match.group(1) is not None, int(match.group(2)), int(match.group(4))
+        tokens = [Token(t, v) for t, v in raw]
+
+        attempts, capped, _ = count_attempts(tokens, cap)
+        if attempts > recorded or (capped and not recorded_capped):
+            regressions += 1
+            status = "  REGRESI"
+        elif attempts < recorded:
+            status = "  lebih baik"
+        elif capped:
+            status = "  di cap"
+        else:
+            status = ""
+
+        try:
+            outcome = parse_budgeted(tokens)
+        except RecursionError:
+            outcome = "RecursionError"
+            regressions += 1
+        t_slow = best_time(lambda: parse_budgeted(tokens), args.repeat)
+        t_fast = best_time(lambda: Parser(tokens).parse(), args.repeat)
+        print(f"{os.path.basename(path):<22} {len(tokens):>6} "
+              f"{('>=' if recorded_capped else '') + str(recorded):>11} "
+              f"{('>=' if capped else '') + str(attempts):>11} {t_slow * 1000:>11.1f} {outcome:<16} "
+              f"{t_fast * 1000:>9.2f}{status}")
+
+    print(f"\n{len(paths)} kasus, {regressions} regresi")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
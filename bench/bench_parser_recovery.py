@@ -0,0 +1,81 @@
+"""Benchmark recovery parser2 (panic mode) pada program yang ditanami banyak error.
+
+Setiap blok berisi beberapa statement; setiap statement ke-k dirusak. Blok
+dibungkus 'jika ... maka' bersarang agar backtracking IfStatementNode ikut
+menguji memo recovery (recovery tidak boleh diulang per alternatif).
+
+    python bench/bench_parser_recovery.py [--blocks N] [--every K] [--nest D]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import load_dfa_rules, tokenize
+from parser2 import ProgramNode, Token, ParseErrorContext
+
+GOOD = "a := a + b * 2"
+BROKEN = [
+    "a := a + ",
+    "b := ) 3",
+    "a = := 1",
+    "jika a > maka b := 1",
+]
+
+
+def build_program(blocks, every, nest, per_block=10):
+    lines = ["program seeded;", "variabel a, b: integer;", "mulai"]
+    seeded = 0
+    n = 0
+    for b in range(blocks):
+        stmts = []
+        for _ in range(per_block):
+            n += 1
+            if every and n % every == 0:
+                stmts.append(BROKEN[seeded % len(BROKEN)])
+                seeded += 1
+            else:
+                stmts.append(GOOD)
+        body = "mulai " + "; ".join(stmts) + " selesai"
+        for _ in range(nest):
+            body = "jika a > b maka " + body
+        lines.append("    " + body + (";" if b < blocks - 1 else ""))
+    lines.append("selesai.")
+    return "\n".join(lines), seeded
+
+
+def parse(tokens, recover):
+    ctx = ParseErrorContext(recover=recover)
+    t0 = time.perf_counter()
+    ok, end = ProgramNode().parse(tokens, 0, ctx)
+    return time.perf_counter() - t0, ok, end, ctx
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--blocks", type=int, default=200)
+    ap.add_argument("--every", type=int, default=7)
+    ap.add_argument("--nest", type=int, default=3)
+    args = ap.parse_args()
+    sys.setrecursionlimit(100000)
+
+    dfa = load_dfa_rules()
+    clean, _ = build_program(args.blocks, 0, args.nest)
+    dirty, seeded = build_program(args.blocks, args.every, args.nest)
+
+    for label, source, recover in (("clean / normal ", clean, False),
+                                   ("clean / recover", clean, True),
+                                   ("dirty / recover", dirty, True)):
+        code, raw = tokenize(source, dfa)
+        tokens = [Token(t, v) for t, v in raw]
+        elapsed, ok, end, ctx = parse(tokens, recover)
+        print(f"{label}: {len(tokens):6d} token  {elapsed * 1000:8.1f} ms  "
+              f"{len(tokens) / elapsed:9.0f} token/s  errors={len(ctx.errors)}")
+    print(f"error ditanam: {seeded}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Resolusi akses field rekaman di SemanticAnalyzer: indeks field per blok
+rekaman dan cache path akses dibandingkan dengan penelusuran rantai link blok
+untuk setiap akses (cara lama, dibangun ulang di ChainWalkAnalyzer).
+
+Program: --types tipe rekaman dengan --fields field masing-masing, rekaman
+bersarang sedalam --depth, dan --accesses statement yang membaca/menulis
+field (termasuk rantai seperti h.c.re dan akses berindeks). Hasil kedua
+analyzer (type_index setiap node dan error, juga pada varian dengan field
+yang salah) harus sama.
+
+    python bench/bench_record_fields.py [--types 20] [--fields 100] [--depth 6] [--accesses 2000] [--repeat 3]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import load_dfa_rules
+from lexer_codegen import tokenize
+from parser2 import Token, parse_tokens
+from ast_nodes import AST
+from ast_transformer import ASTTransformer
+from ast_analyzer import OBJ_TYPE, OBJ_VARIABLE, T_BOOLEAN, T_CHAR, T_INTEGER, T_REAL, T_STRING, SemanticAnalyzer
+from ast_serializer import dumps, loads
+
+
+class ChainWalkAnalyzer(SemanticAnalyzer):
+    # resolusi sebelum indeks field: rantai link blok ditelusuri per akses
+    def _field_path(self, node):
+        return None
+
+    def _lookup_field_in_record(self, block_idx, field_name):
+        b = self.btab[block_idx]
+        curr = b.last
+        while curr > b.lpar:
+            entry = self.tab[curr]
+            if entry.name == field_name and entry.obj == OBJ_VARIABLE:
+                field_type, field_ref = entry.type, entry.ref
+                if field_type > 5 and field_type < len(self.tab):
+                    type_entry = self.tab[field_type]
+                    if type_entry.obj == OBJ_TYPE:
+                        if type_entry.type in (T_INTEGER, T_REAL, T_BOOLEAN, T_CHAR, T_STRING):
+                            field_type = type_entry.type
+                        elif type_entry.type in (5, 6):
+                            field_type, field_ref = type_entry.type, type_entry.ref
+                return field_type, field_ref
+            curr = entry.link
+        return self._lookup_failed(f"Unknown field '{field_name}' in record", field_name), 0
+
+
+def generate(n_types, n_fields, depth, n_accesses, rng, bad_fields=0):
+    decls = ["tipe", "    kompleks = rekaman re, im: real selesai;"]
+    for t in range(n_types):
+        fields = "; ".join(f"f{k}: integer" for k in range(n_fields))
+        decls.append(f"    t{t} = rekaman {fields}; c: kompleks selesai;")
+    decls.append("    n0 = rekaman v: integer; c: kompleks selesai;")
+    for d in range(1, depth + 1):
+        decls.append(f"    l{d} = larik [1..3] dari n{d - 1};")
+        decls.append(f"    n{d} = rekaman v: integer; d: n{d - 1}; l: l{d} selesai;")
+    decls.append("variabel")
+    decls.append("    " + "; ".join(f"h{t}: t{t}" for t in range(n_types)) + ";")
+    decls.append(f"    z: n{depth};")
+    decls.append("    a: integer;")
+    decls.append("    x: real;")
+
+    body = ["a := 0", "x := 0.0"]
+    for i in range(n_accesses):
+        kind = rng.randrange(3)
+        if kind == 0:
+            t, k = rng.randrange(n_types), rng.randrange(n_fields)
+            body.append(f"h{t}.f{k} := a + h{t}.f{rng.randrange(n_fields)}")
+        elif kind == 1:
+            t = rng.randrange(n_types)
+            body.append(f"x := h{t}.c.re + h{t}.c.im")
+        else:
+            path = "z" + "".join(rng.choice([".d", ".l[2]"]) for _ in range(depth))
+            body.append(f"a := {path}.v")
+    for i in range(bad_fields):
+        body.insert(rng.randrange(2, len(body)), f"a := h{rng.randrange(n_types)}.g{i}")
+    return "\n".join(["program rec;"] + decls + ["mulai", ";\n".join("    " + s for s in body), "selesai."]) + "\n"
+
+
+def build(source, dfa):
+    code, raw = tokenize(source, dfa)
+    root, success, end_idx, _ = parse_tokens([Token(t, v) for t, v in raw])
+    assert code == 0 and success and end_idx == len(raw)
+    return dumps(ASTTransformer().transform(root))
+
+
+def annotations(ast):
+    out = []
+    stack = [ast]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, AST):
+            out.append(value.__dict__.get("type_index"))
+            stack.extend(value.__dict__.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return out
+
+
+def run(cls, data):
+    ast = loads(data)
+    analyzer = cls(collect_errors=True)
+    t0 = time.perf_counter()
+    errors = analyzer.analyze_all(ast)
+    return time.perf_counter() - t0, errors, annotations(ast)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--types", type=int, default=20)
+    ap.add_argument("--fields", type=int, default=100)
+    ap.add_argument("--depth", type=int, default=6)
+    ap.add_argument("--accesses", type=int, default=2000)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+    sys.setrecursionlimit(100000)
+    dfa = load_dfa_rules()
+
+    ok = True
+    for label, bad in (("valid", 0), ("field salah", 20)):
+        rng = random.Random(args.seed)
+        data = build(generate(args.types, args.fields, args.depth, args.accesses, rng, bad), dfa)
+        results = {}
+        for cls in (ChainWalkAnalyzer, SemanticAnalyzer):
+            times = []
+            for _ in range(args.repeat):
+                elapsed, errors, types = run(cls, data)
+                times.append(elapsed)
+            results[cls] = (min(times), errors, types)
+        walk, indexed = results[ChainWalkAnalyzer], results[SemanticAnalyzer]
+        same = walk[1:] == indexed[1:]
+        ok &= same
+        print(f"{label:<12} {len(indexed[1]):>3} error  rantai {walk[0] * 1000:8.1f} ms"
+              f"  indeks {indexed[0] * 1000:8.1f} ms  ({walk[0] / indexed[0]:.1f}x)"
+              f"  {'sama' if same else 'BERBEDA'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Biaya mode --all-errors pada program tanpa error.
+
+Membangun program besar dari badan test/milestone-3/test1_complex.pas, lalu
+membandingkan SemanticAnalyzer mode biasa (raise) dengan mode collect.
+
+    python bench/bench_semantic_errors.py [--repeat N] [--blocks N]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import load_dfa_rules, tokenize
+from parser2 import ProgramNode, Token
+from ast_transformer import ASTTransformer
+from ast_analyzer import SemanticAnalyzer
+
+BODY = """
+    i := 85;
+    j := 51;
+    ulangi
+        jika i > j maka
+            i := i - j
+        selain-itu
+            j := j - i
+    sampai i = j;
+    p := null(h1.c.re, h2.c.im);
+    z.re := z.im * 2.5 + i;
+    matrix[1][2] := z.re / 3
+"""
+
+HEADER = """program bench;
+konstanta ten = 10;
+tipe
+    row = larik [1..ten] dari real;
+    complex = rekaman re, im: real selesai;
+variabel
+    i, j: integer;
+    p: boolean;
+    z: complex;
+    h1, h2: rekaman c: complex; r: row selesai;
+    matrix: larik [-3..+3] dari row;
+
+fungsi null(x, y: real): boolean;
+mulai
+    null := x = y
+selesai;
+
+mulai
+"""
+
+
+def build_program(blocks):
+    parts = [HEADER]
+    for b in range(blocks):
+        sep = ";" if b < blocks - 1 else ""
+        parts.append("    mulai" + BODY + "    selesai" + sep + "\n")
+    parts.append("selesai.\n")
+    return "".join(parts)
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=7)
+    ap.add_argument("--blocks", type=int, default=400)
+    args = ap.parse_args()
+
+    sys.setrecursionlimit(100000)
+    source = build_program(args.blocks)
+    code, raw = tokenize(source, load_dfa_rules())
+    assert code == 0
+    tokens = [Token(t, v) for t, v in raw]
+    tree = ProgramNode()
+    ok, end = tree.parse(tokens, 0)
+    assert ok and end == len(tokens)
+    ast = ASTTransformer().transform(tree)
+
+    def strict():
+        SemanticAnalyzer().analyze(ast)
+
+    def collect():
+        errors = SemanticAnalyzer().analyze_all(ast)
+        assert not errors, errors
+
+    t_strict = best_of(strict, args.repeat)
+    t_collect = best_of(collect, args.repeat)
+    print(f"token       : {len(tokens)}")
+    print(f"raise mode  : {t_strict * 1000:8.2f} ms")
+    print(f"collect mode: {t_collect * 1000:8.2f} ms  ({(t_collect / t_strict - 1) * 100:+.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Benchmark per tahap (lexer, parser2, AST transformer, semantic analyzer) pada
+program sintetis dari bench/gen_program.py dengan berbagai shape dan ukuran.
+
+Hasil disimpan sebagai JSON agar dua run bisa dibandingkan:
+
+    python bench/bench_stages.py -o before.json
+    python bench/bench_stages.py -o after.json --compare before.json
+
+    [--shapes nesting,globals] [--sizes 25,50,100,200] [--repeat 3] [--seed 0]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import load_dfa_rules, tokenize
+from parser2 import ProgramNode, Token
+from ast_transformer import ASTTransformer
+from ast_analyzer import SemanticAnalyzer
+from gen_program import SHAPES, generate
+
+STAGES = ["tokenize", "parse", "transform", "analyze"]
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def run_stages(source, dfa, measure=_timed):
+    # satu kali jalan semua tahap; kembalikan (waktu per tahap, jumlah token).
+    # measure(fn) -> (ukuran, hasil fn); check_scaling.py menghitung baris, bukan waktu
+    times = {}
+    times["tokenize"], (code, raw) = measure(lambda: tokenize(source, dfa))
+    if code != 0:
+        raise RuntimeError("lexer gagal")
+    tokens = [Token(t, v) for t, v in raw]
+
+    root = ProgramNode()
+    times["parse"], (success, end_idx) = measure(lambda: root.parse(tokens, 0))
+    if not success or end_idx != len(tokens):
+        raise RuntimeError(f"parser gagal di token {end_idx} dari {len(tokens)}")
+
+    times["transform"], ast = measure(lambda: ASTTransformer().transform(root))
+    times["analyze"], _ = measure(lambda: SemanticAnalyzer().analyze(ast))
+    return times, len(tokens)
+
+
+def best_of(source, dfa, repeat):
+    best = None
+    for _ in range(repeat):
+        times, n_tokens = run_stages(source, dfa)
+        best = times if best is None else {s: min(best[s], times[s]) for s in STAGES}
+    return best, n_tokens
+
+
+def run_deep(fn):
+    # parser2/transformer/analyzer rekursif: jalankan di thread dengan stack besar
+    sys.setrecursionlimit(1_000_000)
+    threading.stack_size(512 * 1024 * 1024)
+    outcome = {}
+
+    def target():
+        try:
+            outcome["value"] = fn()
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old, new, threshold):
+    old_rows = {(r["shape"], r["size"]): r for r in old["results"]}
+    regressions = 0
+    print(f"\n{'shape':<12} {'size':>6}  " + "  ".join(f"{s:>10}" for s in STAGES))
+    for row in new["results"]:
+        prev = old_rows.get((row["shape"], row["size"]))
+        if prev is None or row.get("error") or prev.get("error"):
+            continue
+        cells = []
+        for s in STAGES:
+            ratio = row["seconds"][s] / prev["seconds"][s] if prev["seconds"][s] else 1.0
+            mark = "!" if ratio > threshold else " "
+            regressions += ratio > threshold
+            cells.append(f"{ratio:>9.2f}x{mark}")
+        print(f"{row['shape']:<12} {row['size']:>6}  " + "  ".join(cells))
+    print(f"\n{regressions} tahap lebih lambat dari {threshold:.2f}x (ditandai '!')")
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--shapes", default=",".join(SHAPES))
+    ap.add_argument("--sizes", default="25,50,100,200")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("-o", "--output", help="simpan hasil ke file JSON")
+    ap.add_argument("--compare", help="file JSON hasil run sebelumnya")
+    ap.add_argument("--threshold", type=float, default=1.25, help="batas rasio regresi untuk --compare")
+    args = ap.parse_args()
+
+    dfa = load_dfa_rules()
+    shapes = args.shapes.split(",")
+    sizes = [int(s) for s in args.sizes.split(",")]
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "commit": _git_commit(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": [],
+    }
+
+    print(f"{'shape':<12} {'size':>6} {'token':>8}  " + "  ".join(f"{s + ' ms':>12}" for s in STAGES))
+    for shape in shapes:
+        for size in sizes:
+            source = generate(shape, size, args.seed)
+            row = {"shape": shape, "size": size, "chars": len(source)}
+            try:
+                seconds, n_tokens = run_deep(lambda: best_of(source, dfa, args.repeat))
+                row.update(tokens=n_tokens, seconds=seconds, error=None)
+                print(f"{shape:<12} {size:>6} {n_tokens:>8}  "
+                      + "  ".join(f"{seconds[s] * 1000:>12.2f}" for s in STAGES))
+            except Exception as e:
+                row.update(tokens=None, seconds=None, error=f"{type(e).__name__}: {e}")
+                print(f"{shape:<12} {size:>6}  GAGAL: {row['error']}")
+            report["results"].append(row)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nHasil ditulis ke {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = json.load(f)
+        if compare(old, report, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Memori tabel simbol kolom (SymbolTable/BlockTable/ArrayTable di
+src/ast_analyzer.py) dibandingkan dengan satu objek Python per baris.
+
+Untuk setiap shape, program sintetis dianalisis, lalu baris tab/btab/atab-nya
+disalin ke (a) tabel kolom baru dan (b) list objek biasa dengan atribut yang
+sama (bentuk TabEntry sebelum penyimpanan kolom). Memori keduanya diukur
+dengan tracemalloc; string nama tidak dihitung karena dipakai bersama.
+
+Bagian kedua: program dengan --decls deklarasi variabel bertipe larik/rekaman
+anonim yang strukturnya berulang (juga di dalam prosedur), dianalisis dengan
+dan tanpa interning deskriptor tipe (NoInterningAnalyzer). Ukuran tab/btab/atab
+dibandingkan; error dan ukuran variabel (adr, vsze) harus sama.
+
+Bagian ketiga: konstanta dan larik yang nilainya tidak muat di kolom 64-bit
+harus tetap diterima, dengan nilai yang sama persis (kolom menjadi list).
+
+    python bench/bench_symbol_table.py [--size 400] [--decls 300]
+"""
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import load_dfa_rules
+from lexer_codegen import tokenize
+from parser2 import Token, parse_tokens
+from ast_transformer import ASTTransformer
+from ast_analyzer import OBJ_VARIABLE, ArrayTable, BlockTable, SemanticAnalyzer, SymbolTable
+from gen_program import SHAPES, generate
+
+
+class NoInterningAnalyzer(SemanticAnalyzer):
+    # setiap larik/rekaman anonim mendapat entry atab/btab sendiri
+    def visit_ArrayTypeNode(self, node):
+        return self._array_type(node, shared=False)
+
+    def _build_record_block(self, record_node, shared=False):
+        return super()._build_record_block(record_node, shared=False)
+
+
+def generate_duplicates(n_decls, rng):
+    types = [
+        "larik [1..10] dari integer",
+        "larik [1..10] dari larik [0..3] dari real",
+        "larik ['a'..'z'] dari boolean",
+        "rekaman x, y: integer; z: real selesai",
+        "rekaman nama: char; nilai: larik2 selesai",
+    ]
+    decls = ["tipe", "    larik2 = larik [1..2] dari integer;", "variabel"]
+    decls += [f"    g{i}: {rng.choice(types)};" for i in range(n_decls)]
+    for p in range(4):
+        decls.append(f"prosedur p{p};")
+        decls.append("variabel")
+        decls += [f"    l{i}: {rng.choice(types)};" for i in range(n_decls // 4)]
+        decls.append("mulai")
+        decls.append("    l0 := l0")
+        decls.append("selesai;")
+    return "\n".join(["program dup;"] + decls + ["mulai", "    g0 := g0", "selesai."]) + "\n"
+
+
+class ObjectRow:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+def analyze(source, dfa, cls=SemanticAnalyzer):
+    code, raw = tokenize(source, dfa)
+    root, success, end_idx, _ = parse_tokens([Token(t, v) for t, v in raw])
+    if code != 0 or not success or end_idx != len(raw):
+        return None
+    analyzer = cls(collect_errors=True)
+    analyzer.analyze_all(ASTTransformer().transform(root))
+    return analyzer
+
+
+def variable_sizes(analyzer):
+    # (nama, tipe, adr, ukuran) variabel di setiap blok program/prosedur, dan vsze bloknya
+    tab, btab = analyzer.tab, analyzer.btab
+    blocks = []
+    for b in range(1, len(btab)):
+        if b in analyzer.record_fields:
+            continue
+        rows = []
+        curr = btab.last[b]
+        lev = tab.lev[curr]
+        while curr > 0 and tab.lev[curr] == lev:
+            if tab.obj[curr] == OBJ_VARIABLE:
+                atab_size = analyzer.atab[tab.ref[curr] - 1].size if tab.type[curr] == 5 else None
+                rows.append((tab[curr].name, tab.type[curr], tab.adr[curr], atab_size))
+            curr = tab.link[curr]
+        blocks.append((rows, btab.vsze[b]))
+    return blocks
+
+
+def rows(table):
+    return [tuple(column[i] for column in table.columns) for i in range(len(table))]
+
+
+def measure(build):
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def as_columns(analyzer):
+    tab = SymbolTable()
+    for i in range(len(analyzer.tab)):
+        e = analyzer.tab[i]
+        tab.add(e.name, e.obj, e.type, e.ref, e.nrm, e.lev, e.adr, e.link)
+    btab, atab = BlockTable(), ArrayTable()
+    for row in rows(analyzer.btab):
+        btab.append(*row)
+    for row in rows(analyzer.atab):
+        atab.append(*row)
+    return tab, btab, atab
+
+
+def as_objects(analyzer):
+    tab = [ObjectRow(name=e.name, obj=e.obj, type=e.type, ref=e.ref, nrm=e.nrm,
+                     lev=e.lev, adr=e.adr, link=e.link) for e in analyzer.tab]
+    btab = [ObjectRow(**dict(zip(BlockTable.fields, row))) for row in rows(analyzer.btab)]
+    atab = [ObjectRow(**dict(zip(ArrayTable.fields, row))) for row in rows(analyzer.atab)]
+    return tab, btab, atab
+
+
+HUGE_SOURCE = """program besar;
+konstanta
+    huge = 99999999999999999999999;
+variabel
+    a: larik [1..99999999999] dari larik [1..99999999999] dari integer;
+    x: integer;
+mulai
+    x := 1
+selesai.
+"""
+
+
+def check_huge(dfa):
+    analyzer = analyze(HUGE_SOURCE, dfa)
+    tab, btab, atab = analyzer.tab, analyzer.btab, analyzer.atab
+    n = 99999999999
+    got = ([tab[i].adr for i in range(len(tab) - 3, len(tab))],
+           btab[len(btab) - 1].vsze, atab[len(atab) - 1].size)
+    expected = ([99999999999999999999999, 0, n * n], n * n + 1, n * n)
+    return analyzer.errors == [] and got == expected
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--size", type=int, default=400)
+    ap.add_argument("--decls", type=int, default=300)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+    sys.setrecursionlimit(100000)
+    dfa = load_dfa_rules()
+
+    print(f"{'shape':<12} {'tab':>6} {'btab':>5} {'atab':>5} {'kolom':>9} {'objek':>9} {'byte/baris':>16}")
+    for shape in SHAPES:
+        analyzer = analyze(generate(shape, args.size, 0), dfa)
+        if analyzer is None:
+            continue
+        n_rows = len(analyzer.tab) + len(analyzer.btab) + len(analyzer.atab)
+        columns = measure(lambda: as_columns(analyzer))
+        objects = measure(lambda: as_objects(analyzer))
+        print(f"{shape:<12} {len(analyzer.tab):>6} {len(analyzer.btab):>5} {len(analyzer.atab):>5}"
+              f" {columns:>9} {objects:>9} {columns / n_rows:>7.1f} vs {objects / n_rows:>6.1f}")
+
+    source = generate_duplicates(args.decls, random.Random(args.seed))
+    plain = analyze(source, dfa, NoInterningAnalyzer)
+    interned = analyze(source, dfa)
+    same = (plain.errors == interned.errors
+            and variable_sizes(plain) == variable_sizes(interned))
+    print(f"\n{args.decls * 2} deklarasi larik/rekaman anonim:")
+    for label, analyzer in (("tanpa interning", plain), ("interning", interned)):
+        print(f"  {label:<16} tab {len(analyzer.tab):>6}  btab {len(analyzer.btab):>5}  atab {len(analyzer.atab):>5}")
+    print(f"  error dan ukuran variabel {'sama' if same else 'BERBEDA'}")
+
+    huge_ok = check_huge(dfa)
+    print(f"\nnilai di luar 64-bit: {'diterima, nilai sama' if huge_ok else 'BERBEDA'}")
+    sys.exit(0 if same and huge_ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""Pengecekan matriks hasil operator (OPERATOR_MATRIX di src/ast_analyzer.py)
+terhadap rantai if per operator yang digantikannya.
+
+Rantai lama untuk operator aditif (SimpleExprNode), multiplikatif (TermNode),
+dan relasional (BinOpNode) disalin di bawah sebagai referensi. Setiap
+kombinasi operator (semua lexeme yang dikenal, lexeme Indonesia seperti
+bagi/dan/atau, dan operator di posisi yang salah) dengan tipe kiri dan
+kanan (T_ERROR, tipe primitif, dan indeks tab tipe bentukan) dibangkitkan,
+lalu hasil operator_result() dibandingkan dengan referensi: tipe hasil, atau
+pesan error yang sama persis.
+
+Perbedaan yang disengaja (INTENTIONAL_DIFFERENCES): rantai lama tidak mengenali
+bagi/dan/atau ('atau' tidak dicek, 'bagi'/'dan' dilaporkan sebagai operator
+tidak dikenal); matriks memperlakukannya seperti div/and/or. Untuk lexeme ini
+referensinya adalah rantai lama untuk padanan Inggrisnya, dengan nama operator
+di pesan error diganti.
+
+Selain itu, setiap file .pas di test/ dan shape expressions dianalisis
+dengan collect_errors=True oleh SemanticAnalyzer dan oleh subclass yang
+memakai rantai lama; error dan anotasi type_index harus sama.
+
+    python bench/check_operator_matrix.py
+"""
+import glob
+import itertools
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import load_dfa_rules
+from lexer_codegen import tokenize
+from parser2 import Token, parse_tokens
+from ast_nodes import AST
+from ast_transformer import ASTTransformer
+from ast_analyzer import (ADDITIVE_OPERATORS, MULTIPLICATIVE_OPERATORS, OPERATOR_ERRORS,
+                          OPERATOR_MATRIX, RELATIONAL_OPERATORS, T_BOOLEAN, T_ERROR, T_INTEGER,
+                          T_NOTYPE, T_REAL, SemanticAnalyzer, operator_result)
+from gen_program import generate
+
+
+def chain_additive(op, left_type, right_type):
+    if T_ERROR in (left_type, right_type):
+        return T_ERROR
+    elif op in ['+', '-']:
+        if left_type in (T_INTEGER, T_REAL) and right_type in (T_INTEGER, T_REAL):
+            return T_REAL if T_REAL in (left_type, right_type) else T_INTEGER
+        return f"Incompatible operands for '{op}'"
+    elif op in ['or']:
+        if left_type == T_BOOLEAN and right_type == T_BOOLEAN:
+            return T_BOOLEAN
+        return "Operands for 'or' must be boolean"
+    return left_type
+
+
+def chain_multiplicative(op, left_type, right_type):
+    if T_ERROR in (left_type, right_type):
+        return T_ERROR
+    elif op == '*':
+        if left_type in (T_INTEGER, T_REAL) and right_type in (T_INTEGER, T_REAL):
+            return T_REAL if T_REAL in (left_type, right_type) else T_INTEGER
+        return "Incompatible operands for '*'"
+    elif op == '/':
+        if left_type in (T_INTEGER, T_REAL) and right_type in (T_INTEGER, T_REAL):
+            return T_REAL
+        return "Operands for '/' must be numeric"
+    elif op in ['div', 'mod']:
+        if left_type == T_INTEGER and right_type == T_INTEGER:
+            return T_INTEGER
+        return f"Operands for '{op}' must be integers"
+    elif op == 'and':
+        if left_type == T_BOOLEAN and right_type == T_BOOLEAN:
+            return T_BOOLEAN
+        return "Operands for 'and' must be boolean"
+    return f"Unknown multiplicative operator '{op}'"
+
+
+def chain_relational(op, left_type, right_type):
+    if T_ERROR in (left_type, right_type):
+        return T_ERROR
+    if op in ['=', '<>', '<', '>', '<=', '>=']:
+        if left_type == right_type:
+            return T_BOOLEAN
+        return f"Operands for relational operator '{op}' must have same type"
+    return f"Unknown operator '{op}' in BinOpNode"
+
+
+# lexeme Indonesia -> operator yang aturannya dipakai di matriks
+INTENTIONAL_DIFFERENCES = {'bagi': 'div', 'dan': 'and', 'atau': 'or'}
+
+
+def reference(chain, op, left_type, right_type):
+    alias = INTENTIONAL_DIFFERENCES.get(op)
+    if alias is None:
+        return chain(op, left_type, right_type)
+    result = chain(alias, left_type, right_type)
+    return result.replace(f"'{alias}'", f"'{op}'") if isinstance(result, str) else result
+
+
+POSITIONS = [
+    ("aditif", ADDITIVE_OPERATORS, chain_additive),
+    ("multiplikatif", MULTIPLICATIVE_OPERATORS, chain_multiplicative),
+    ("relasional", RELATIONAL_OPERATORS, chain_relational),
+]
+
+OPERATORS = ['+', '-', 'or', '*', '/', 'div', 'mod', 'and', '=', '<>', '<', '>', '<=', '>=',
+             'bagi', 'dan', 'atau', 'tidak', 'not', 'xor', '']
+
+# indeks 29.. adalah entry tab tipe bentukan (larik/rekaman/alias)
+TYPES = [T_ERROR, T_NOTYPE, 1, 2, 3, 4, 5, 6, 29, 30, 31, 500]
+
+
+def matrix_result(operators, op, left_type, right_type):
+    result = operator_result(operators, op, left_type, right_type)
+    return OPERATOR_ERRORS[result].format(op=op) if result < T_ERROR else result
+
+
+class ChainAnalyzer(SemanticAnalyzer):
+    # analyze_expression dengan rantai if lama (dan INTENTIONAL_DIFFERENCES) untuk SimpleExpr/Term/BinOp
+    def _visit_BinOpNode_expr(self, node):
+        op = node.operator.lexeme
+        result = reference(chain_relational, op, self.analyze_expression(node.left),
+                           self.analyze_expression(node.right))
+        if result == T_ERROR:
+            return T_ERROR
+        if isinstance(result, str):
+            self.error(result)
+            return T_NOTYPE
+        node.type_index = result
+        return result
+
+    def _fold(self, node, first, next_operand, chain):
+        left_type = self.analyze_expression(first)
+        tail = node.tail
+        while tail:
+            opnode, operand = next_operand(tail)
+            if opnode is not None:
+                left_type = reference(chain, opnode.lexeme, left_type, self.analyze_expression(operand))
+                if isinstance(left_type, str):
+                    self.error(left_type)
+                    return T_NOTYPE
+            tail = tail.next_tail
+        node.type_index = left_type
+        return left_type
+
+    def _visit_SimpleExprNode_expr(self, node):
+        return self._fold(node, node.term, lambda t: (t.additive_operator, t.term), chain_additive)
+
+    def _visit_TermNode_expr(self, node):
+        return self._fold(node, node.factor, lambda t: (t.multiplicative_operator, t.factor), chain_multiplicative)
+
+
+def annotations(ast):
+    out = []
+    stack = [ast]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, AST):
+            out.append(value.__dict__.get("type_index"))
+            stack.extend(value.__dict__.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return out
+
+
+def analyzed(cls, source, dfa):
+    code, raw = tokenize(source, dfa)
+    if code != 0:
+        return None
+    root, success, end_idx, _ = parse_tokens([Token(t, v) for t, v in raw])
+    if not success or end_idx != len(raw):
+        return None
+    ast = ASTTransformer().transform(root)
+    errors = cls().analyze_all(ast)
+    return errors, annotations(ast)
+
+
+def main():
+    sys.setrecursionlimit(100000)
+    failures = checked = 0
+    for label, operators, chain in POSITIONS:
+        for op, left_type, right_type in itertools.product(OPERATORS, TYPES, TYPES):
+            expected = reference(chain, op, left_type, right_type)
+            actual = matrix_result(operators, op, left_type, right_type)
+            checked += 1
+            if expected != actual:
+                failures += 1
+                print(f"BEDA {label} {left_type} {op!r} {right_type}: rantai {expected!r}, matriks {actual!r}")
+    print(f"{checked} kombinasi operator/tipe, {failures} berbeda (matriks {len(OPERATOR_MATRIX)} byte)")
+
+    dfa = load_dfa_rules()
+    sources = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test", "**", "*.pas"), recursive=True)):
+        with open(path, encoding="utf-8") as f:
+            sources.append((os.path.relpath(path, ROOT), f.read()))
+    sources += [(f"expressions {size}", generate("expressions", size, seed)) for size in (5, 50) for seed in range(3)]
+    programs = 0
+    for label, source in sources:
+        expected = analyzed(ChainAnalyzer, source, dfa)
+        if expected is None:
+            continue
+        programs += 1
+        if analyzed(SemanticAnalyzer, source, dfa) != expected:
+            failures += 1
+            print(f"BEDA {label}")
+    print(f"{programs} program dianalisis dengan kedua versi")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
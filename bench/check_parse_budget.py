@@ -0,0 +1,246 @@
+"""Uji ParseBudget parser2 dengan input adversarial.
+
+1. Pertumbuhan tanpa batas: `x := ((...1...))` dengan k kurung bersarang,
+   jumlah percobaan rule dicatat (budget sangat besar, hanya menghitung).
+   Setiap kurung kira-kira melipat-empatkan percobaan.
+2. Input adversarial dengan budget default harus berhenti cepat dengan
+   ParseBudgetExceeded jenis yang tepat, bukan hang atau RecursionError:
+     - kurung bersarang sedalam --parens       -> percobaan rule
+     - `mulai` bersarang sedalam --depth        -> kedalaman parse
+       (recursion limit 100000, seperti compiler.py)
+     - shape nesting 100 dengan satu `lakukan` diganti identifier
+                                                -> percobaan rule
+       (satu syntax error di program yang wajar; tanpa budget parse gagal
+       setelah puluhan juta percobaan)
+     - program besar dengan batas node kecil    -> node CST
+   Hal yang sama dicek lewat server.compile_request (diagnostic syntax, dengan
+   kurung yang tidak seimbang) dan lewat strict=False seperti compiler.py
+   (batas kedalaman tidak diparse ulang tanpa budget). Kurung bersarang yang
+   seimbang harus diterima server lewat parser cepat.
+   Program datar --flat statement dengan satu syntax error tidak boleh
+   melampaui budget default (rantai tail list bukan kedalaman), dan dengan
+   budget yang terlampaui, strict=False (compiler.py) harus melaporkan error
+   yang sama dengan parse_tokens tanpa budget.
+3. Input normal: setiap file .pas di test/ dan program sintetis dari
+   gen_program.py (size 1, 10, 100), serta mutasi token dari file test/ dan
+   program size 1 dan 10, serta kurung bersarang valid (k = 4, 8, 10), diparse
+   tanpa budget dan dengan budget default lewat parse_tokens_budgeted (seperti
+   compiler.py dan server.py); hasil dan CST harus identik (budget tidak boleh
+   menolak program valid). Mutasi program
+   size 100 tidak dipakai: di shape nesting mutasi seperti itu adalah kasus
+   adversarial di atas.
+
+Exit code 1 jika ada pengecekan yang gagal.
+
+    python bench/check_parse_budget.py [--parens 30] [--depth 5000] [--flat 550] [--max-k 8] [--mutants 10]
+"""
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import load_dfa_rules
+from lexer_codegen import tokenize
+from parser2 import ParseBudget, ParseBudgetExceeded, Token, parse_tokens
+from parse_driver import parse_tokens_budgeted
+from server import compile_request
+from bench_fast_parser import mutate, same_tree
+from gen_program import SHAPES, generate
+
+
+def parens_program(k):
+    return f"program p;\nvariabel x: integer;\nmulai\n    x := {'(' * k}1{')' * k}\nselesai.\n"
+
+
+def unbalanced_parens_program(k):
+    return f"program p;\nvariabel x: integer;\nmulai\n    x := {'(' * k}1{')' * (k - 1)}\nselesai.\n"
+
+
+def nested_program(depth):
+    return "program p;\nmulai\n" + "mulai " * depth + "selesai " * depth + "\nselesai.\n"
+
+
+def flat_program_with_error(count):
+    # `maka` hilang di satu statement dekat akhir list
+    body = ["    x := x + 1;"] * count
+    body[-10] = "    jika x > 1 x := 2;"
+    return "program p;\nvariabel x: integer;\nmulai\n" + "\n".join(body) + "\n    x := 0\nselesai.\n"
+
+
+def broken_nesting(dfa):
+    tokens = to_tokens(generate("nesting", 100, 0), dfa)
+    loops = [i for i, t in enumerate(tokens) if t.nilai == "lakukan"]
+    i = loops[len(loops) // 2]
+    tokens[i] = Token("IDENTIFIER", "a")
+    return tokens
+
+
+def to_tokens(source, dfa):
+    code, raw = tokenize(source, dfa)
+    assert code == 0
+    return [Token(t, v) for t, v in raw]
+
+
+def growth(dfa, max_k):
+    print(f"{'k':>3} {'token':>6} {'percobaan':>12} {'per token':>10} {'ms':>9}")
+    for k in range(0, max_k + 1):
+        tokens = to_tokens(parens_program(k), dfa)
+        counter = ParseBudget(10 ** 12, 10 ** 9, 10 ** 12)
+        t0 = time.perf_counter()
+        parse_tokens(tokens, budget=counter)
+        ms = (time.perf_counter() - t0) * 1000
+        print(f"{k:>3} {len(tokens):>6} {counter.attempts:>12} {counter.attempts / len(tokens):>10.0f} {ms:>9.1f}")
+
+
+def expect_exceeded(label, tokens, kind, budget=None):
+    t0 = time.perf_counter()
+    try:
+        parse_tokens(tokens, budget=budget or ParseBudget())
+    except ParseBudgetExceeded as e:
+        ms = (time.perf_counter() - t0) * 1000
+        if e.kind != kind:
+            print(f"GAGAL {label}: {e} (diharapkan {kind})")
+            return False
+        print(f"ok    {label}: {e} setelah {ms:.1f} ms")
+        return True
+    except RecursionError:
+        print(f"GAGAL {label}: RecursionError")
+        return False
+    print(f"GAGAL {label}: parse selesai tanpa melampaui budget")
+    return False
+
+
+def check_flat(dfa, flat):
+    ok = True
+    tokens = to_tokens(flat_program_with_error(flat), dfa)
+    _, _, _, error_ctx = parse_tokens(tokens)
+    for label, budget, strict in [("budget default", ParseBudget(), True),
+                                  ("budget 1 percobaan/token, strict=False", ParseBudget(1), False)]:
+        try:
+            _, success, _, b_ctx = parse_tokens_budgeted(tokens, budget=budget, strict=strict)
+        except ParseBudgetExceeded as e:
+            print(f"GAGAL datar {flat}, {label}: {e}")
+            ok = False
+            continue
+        if success or (b_ctx.max_index, repr(b_ctx.expected)) != (error_ctx.max_index, repr(error_ctx.expected)):
+            print(f"GAGAL datar {flat}, {label}: error di index {b_ctx.max_index}, diharapkan {error_ctx.max_index}")
+            ok = False
+        else:
+            print(f"ok    datar {flat}, {label}: Expected {b_ctx.expected} di token index {b_ctx.max_index}")
+    return ok
+
+
+def check_adversarial(dfa, parens, depth):
+    ok = True
+    ok &= expect_exceeded(f"kurung bersarang {parens}", to_tokens(parens_program(parens), dfa), "percobaan rule")
+    ok &= expect_exceeded(f"mulai bersarang {depth}", to_tokens(nested_program(depth), dfa), "kedalaman parse")
+    ok &= expect_exceeded("nesting 100 tanpa satu lakukan", broken_nesting(dfa), "percobaan rule")
+    big = to_tokens(generate("statements", 2000, 0), dfa)
+    ok &= expect_exceeded("statements 2000, node <= 10000", big, "node CST", ParseBudget(max_nodes=10000))
+
+    for label, source in [("kurung tidak seimbang", unbalanced_parens_program(parens)),
+                          ("mulai", nested_program(depth))]:
+        response = compile_request({"id": 1, "source": source})
+        messages = [d["message"] for d in response["diagnostics"]]
+        if response["ok"] or not any(d["stage"] == "syntax" and d["message"].startswith("Parse dihentikan")
+                                     for d in response["diagnostics"]):
+            print(f"GAGAL server {label}: {messages}")
+            ok = False
+        else:
+            print(f"ok    server {label}: {messages[0]} ({response['ms']} ms)")
+    response = compile_request({"id": 1, "source": parens_program(parens)})
+    if not response["ok"]:
+        print(f"GAGAL server kurung {parens}: {[d['message'] for d in response['diagnostics']]}")
+        ok = False
+    else:
+        print(f"ok    server kurung {parens}: diterima lewat parser cepat ({response['ms']} ms)")
+
+    tokens = to_tokens(nested_program(depth), dfa)
+    try:
+        parse_tokens_budgeted(tokens, budget=ParseBudget(), strict=False)
+        result = "diterima"
+    except ParseBudgetExceeded as e:
+        result = e
+    except RecursionError:
+        result = "RecursionError"
+    if not isinstance(result, ParseBudgetExceeded) or result.kind != "kedalaman parse":
+        print(f"GAGAL compiler mulai bersarang {depth}: {result}")
+        ok = False
+    else:
+        print(f"ok    compiler mulai bersarang {depth}: {result}, tanpa parse ulang")
+    return ok
+
+
+def check_normal(dfa, mutants, seed):
+    programs = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test", "**", "*.pas"), recursive=True)):
+        with open(path, encoding="utf-8") as f:
+            programs.append((os.path.relpath(path, ROOT), f.read(), mutants))
+    for shape in SHAPES:
+        for size in (1, 10, 100):
+            programs.append((f"{shape} {size}", generate(shape, size, seed), mutants if size <= 10 else 0))
+    # valid, tetapi percobaan rule per token melampaui budget default mulai k = 8
+    for k in (4, 8, 10):
+        programs.append((f"kurung {k}", parens_program(k), 0))
+
+    rng = random.Random(seed)
+    checked = mismatches = 0
+    budget = ParseBudget()
+    for label, source, count in programs:
+        code, raw = tokenize(source, dfa)
+        if code != 0:
+            continue
+        tokens = [Token(t, v) for t, v in raw]
+        cases = [(label, tokens)] + [(f"{label} mutasi {k}", mutate(tokens, rng)) for k in range(count)]
+        for case_label, case_tokens in cases:
+            for recover in (False, True):
+                checked += 1
+                root, success, end_idx, error_ctx = parse_tokens(case_tokens, recover=recover)
+                try:
+                    b_root, b_success, b_end, b_ctx = parse_tokens_budgeted(case_tokens, recover=recover, budget=budget)
+                except ParseBudgetExceeded as e:
+                    print(f"GAGAL {case_label}: {e}")
+                    mismatches += 1
+                    continue
+                # Terminal hasil recovery dibuat baru setiap parse: dibandingkan lewat repr.
+                # max_index hanya dipakai untuk pesan parse yang gagal.
+                if ((success, end_idx, repr(error_ctx.errors)) != (b_success, b_end, repr(b_ctx.errors))
+                        or (not success and error_ctx.max_index != b_ctx.max_index)
+                        or (success and not same_tree(root, b_root))):
+                    print(f"GAGAL {case_label}: hasil berbeda dengan budget")
+                    mismatches += 1
+    print(f"{checked} parse dengan budget default, {mismatches} berbeda")
+    return mismatches == 0
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--parens", type=int, default=30)
+    ap.add_argument("--depth", type=int, default=5000)
+    ap.add_argument("--flat", type=int, default=550)
+    ap.add_argument("--max-k", type=int, default=8)
+    ap.add_argument("--mutants", type=int, default=10)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    dfa = load_dfa_rules()
+    print("Percobaan rule tanpa batas, x := (...1...) dengan k kurung:")
+    growth(dfa, args.max_k)
+    print()
+    # seperti compiler.py: rantai tail list dan program sintetis sedalam 100
+    # butuh stack lebih dari recursion limit default
+    sys.setrecursionlimit(100000)
+    ok = check_adversarial(dfa, args.parens, args.depth)
+    ok &= check_flat(dfa, args.flat)
+    print()
+    ok &= check_normal(dfa, args.mutants, args.seed)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Guard regresi skala: setiap tahap (tokenize, ProgramNode.parse,
+ASTTransformer.transform, SemanticAnalyzer.analyze) dijalankan pada program
+sintetis berukuran berlipat dua, lalu eksponen pertumbuhan kerjanya difit
+(regresi log-log terhadap jumlah token).
+
+Kerja diukur sebagai jumlah baris Python yang dieksekusi (sys.settrace), bukan
+waktu: hasilnya deterministik, sehingga eksponen tidak berubah antar run dan
+tidak bergantung pada beban mesin. Kerja di dalam fungsi C (mis. list.insert,
+operasi dict) tidak terhitung; untuk itu lihat waktu di bench_stages.py.
+
+Tahap linear menghasilkan eksponen sekitar 1.0 dan O(n log n) sekitar 1.1 pada
+ukuran ini; guard gagal (exit code 1) jika ada tahap dengan eksponen di atas
+--max-exponent.
+
+    python bench/check_scaling.py [--shapes nesting,globals] [--steps 5] [--max-exponent 1.3]
+"""
+import argparse
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_stages import STAGES, run_deep, run_stages
+from gen_program import SHAPES, generate
+from lexer import load_dfa_rules
+
+# ukuran awal per shape
+START_SIZE = {
+    "nesting": 100,
+    "statements": 100,
+    "expressions": 100,
+    "globals": 100,
+    "records": 50,
+    "subprograms": 25,
+}
+
+
+def _counted(fn):
+    # (jumlah event "line" selama fn, hasil fn); dipasang di thread pemanggil saja
+    count = 0
+
+    def local(frame, event, arg):
+        nonlocal count
+        if event == "line":
+            count += 1
+        return local
+
+    sys.settrace(lambda frame, event, arg: local)
+    try:
+        result = fn()
+    finally:
+        sys.settrace(None)
+    return count, result
+
+
+def measure(source, dfa):
+    return run_stages(source, dfa, measure=_counted)
+
+
+def fit_exponent(points):
+    # kemiringan regresi linear log(t) terhadap log(n)
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx
+
+
+def check_shape(shape, dfa, steps, seed):
+    points = {s: [] for s in STAGES}
+    size = START_SIZE.get(shape, 100)
+    for _ in range(steps):
+        source = generate(shape, size, seed)
+        lines, n_tokens = run_deep(lambda: measure(source, dfa))
+        for s in STAGES:
+            points[s].append((n_tokens, lines[s]))
+        size *= 2
+    return points
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--shapes", default=",".join(SHAPES))
+    ap.add_argument("--steps", type=int, default=5, help="jumlah ukuran (tiap langkah dikali dua)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--max-exponent", type=float, default=1.3)
+    args = ap.parse_args()
+
+    dfa = load_dfa_rules()
+    failures = []
+    print(f"{'shape':<12} {'token':>15}  " + "  ".join(f"{s:>10}" for s in STAGES))
+    for shape in args.shapes.split(","):
+        points = check_shape(shape, dfa, args.steps, args.seed)
+        exponents = {s: fit_exponent(points[s]) for s in STAGES}
+        n_range = f"{points[STAGES[0]][0][0]}..{points[STAGES[0]][-1][0]}"
+        cells = []
+        for s in STAGES:
+            bad = exponents[s] > args.max_exponent
+            cells.append(f"{exponents[s]:>9.2f}{'!' if bad else ' '}")
+            if bad:
+                failures.append((shape, s, exponents[s]))
+        print(f"{shape:<12} {n_range:>15}  " + "  ".join(cells))
+
+    if failures:
+        print(f"\nGAGAL: eksponen di atas {args.max_exponent}:")
+        for shape, stage, k in failures:
+            print(f"  {shape}/{stage}: n^{k:.2f}")
+        sys.exit(1)
+    print(f"\nOK: semua tahap tumbuh paling cepat n^{args.max_exponent}")
+
+
+if __name__ == "__main__":
+    main()
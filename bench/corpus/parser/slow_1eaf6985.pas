@@ -0,0 +1,3 @@
+{ fuzz_parser: 25198 percobaan rule, 18 token, cap 100000, seed 3 }
+program b ; mulai jika 42 maka x [ p ( ( ( ( x (
+a ;
@@ -0,0 +1,6 @@
+{ fuzz_parser: 118678 percobaan rule, 75 token, cap 100000, seed 2 }
+program ComplexExpressionTest ; variabel a , b , c , d : integer ; x :
+integer ; x : integer ; y : b ; valid : boolean ; mulai a
+:= 10 ; b := 20 ; 5 ; untuk x := ( a + (
+( - f ( ( ( ( - ( - ( * x ; + a
+y a + f ; dan real ulangi 'Kondisi kompleks terpenuhi' selain-itu 1
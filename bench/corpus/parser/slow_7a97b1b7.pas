@@ -0,0 +1,2 @@
+{ fuzz_parser: 16606 percobaan rule, 16 token, cap 100000, seed 3 }
+program b ; mulai jika 42 maka x [ ( tidak ( ( ( ( a
@@ -0,0 +1,7 @@
+{ fuzz_parser: 131662 percobaan rule, 91 token, cap 100000, seed 1 }
+program p ; variabel a , b , c , d : integer ; x ,
+y : real ; valid : d ; mulai a := 10 ; b := 20
+; c := 3 ; d := 5 ; x ( ( ( a mod (
+a + b ( a + b ( ( ( ( ( + b ) 0
+c bagi <= b , < d x sampai dan ( x real := 0 c
+d ) f 'Kondisi kompleks terpenuhi' ( selain-itu ( >= ) ; selesai
@@ -0,0 +1,4 @@
+{ fuzz_parser: 56762 percobaan rule, 36 token, cap 100000, seed 0 }
+program x ; variabel x : integer ; prosedur print ( nilai : integer ) ;
+mulai mulai mulai ( ( ( ( ( ( ( - x ( ( 42 ;
+tipe selesai salah )
@@ -0,0 +1,4 @@
+{ fuzz_parser: 40550 percobaan rule, 36 token, cap 100000, seed 0 }
+program x ; variabel x : integer ; prosedur print ( nilai : integer ) ;
+mulai ( a ( ( ( ( ( ( ( - tidak selesai tipe ulangi ;
+* ; 42 a
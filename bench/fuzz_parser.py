@@ -0,0 +1,355 @@
+"""Fuzzer grammar untuk mencari input yang membuat parser2 paling lambat.
+
+Program awal dibangkitkan langsung dari grammar() kelas-kelas parser2 (turunan
+acak dari ProgramNode; di atas --gen-depth selalu dipilih alternatif terpendek)
+ditambah file .pas di test/ yang cukup kecil, dan semuanya valid. Populasi lalu
+dimutasi: token dihapus/diduplikasi/ditukar/diganti terminal grammar, potongan
+token diulang, atau rentang token diganti turunan acak sebuah nonterminal.
+Fitness adalah jumlah percobaan rule per token pada parse parser2 (penghitung
+ParseBudget, deterministik, tidak bergantung pada beban mesin); parse dihentikan
+di --cap percobaan per token (default 10x batas ParseBudget yang dipakai
+compiler.py dan server.py). Kasus yang mencapai cap dinilai per token sampai
+posisi parse dihentikan, jadi fitness tetap bisa naik di atas cap.
+
+Kasus terlambat yang bentuknya tidak saling mirip disimpan sebagai file .pas
+(token dipisah spasi, sudah dicek di-lex ulang menjadi token yang sama) di
+bench/corpus/parser/, dengan komentar kepala berisi jumlah percobaan dan cap.
+Jumlah yang disimpan dihitung ulang dengan --record-cap (default 100x batas
+ParseBudget) sehingga biasanya tidak terpotong cap: bench/bench_parse_corpus.py
+memutar ulang corpus ini sebagai benchmark dan guard regresi, dan kenaikan
+hanya terdeteksi pada jumlah yang tidak terpotong.
+
+    python bench/fuzz_parser.py [--iterations 5000] [--population 24] [--max-tokens 300]
+                                [--cap 10000] [--record-cap 100000] [--seed 0] [--save 8] [--corpus DIR]
+"""
+import argparse
+import difflib
+import glob
+import os
+import random
+import sys
+import time
+import zlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import load_dfa_rules
+from lexer_codegen import tokenize
+from symbols import OPEN_TYPES
+from parser2 import DEFAULT_MAX_ATTEMPTS_PER_TOKEN, ParseBudget, ParseBudgetExceeded, ProgramNode, Terminal, Token
+
+CORPUS_DIR = os.path.join(ROOT, "bench", "corpus", "parser")
+
+# lexeme untuk terminal tanpa nilai; tipe terbuka memakai beberapa contoh.
+# CHAR_LITERAL tidak pernah dihasilkan lexer, jadi alternatif yang memuatnya
+# tidak dipakai generator.
+LEXEMES = {
+    "ASSIGN_OPERATOR": [":="],
+    "COLON": [":"],
+    "COMMA": [","],
+    "DOT": ["."],
+    "LBRACKET": ["["],
+    "RBRACKET": ["]"],
+    "LPARENTHESIS": ["("],
+    "RPARENTHESIS": [")"],
+    "SEMICOLON": [";"],
+    "RANGE_OPERATOR": [".."],
+    "IDENTIFIER": ["a", "b", "x", "p", "f"],
+    "NUMBER": ["0", "1", "42"],
+    "STRING_LITERAL": ["'s'"],
+}
+
+HEADER = "{ fuzz_parser: "
+# kasus dengan bentuk semirip ini dengan kasus yang sudah disimpan dilewati
+SIMILAR_RATIO = 0.8
+
+
+class Grammar:
+    # rules per kelas node yang terjangkau dari ProgramNode, panjang turunan
+    # terpendek per kelas, dan alfabet terminal (tipe, lexeme)
+    def __init__(self, root=ProgramNode):
+        self.rules = {}
+        stack = [root]
+        while stack:
+            cls = stack.pop()
+            if cls in self.rules:
+                continue
+            self.rules[cls] = cls().rules()
+            for alt in self.rules[cls]:
+                stack.extend(e for e in alt if not isinstance(e, Terminal))
+        self.nonterminals = sorted((c for c in self.rules if c is not root), key=lambda c: c.__name__)
+
+        self.alphabet = []
+        for alts in self.rules.values():
+            for alt in alts:
+                for e in alt:
+                    if isinstance(e, Terminal):
+                        self.alphabet.extend((e.tipe, v) for v in self.lexemes(e))
+        self.alphabet = sorted(set(self.alphabet))
+
+        # panjang terpendek: titik tetap, kelas yang tak bisa diturunkan tetap None
+        self.shortest = {cls: None for cls in self.rules}
+        changed = True
+        while changed:
+            changed = False
+            for cls, alts in self.rules.items():
+                for alt in alts:
+                    size = self.alt_size(alt)
+                    if size is not None and (self.shortest[cls] is None or size < self.shortest[cls]):
+                        self.shortest[cls] = size
+                        changed = True
+
+    def lexemes(self, terminal):
+        if terminal.nilai is not None:
+            return [terminal.nilai]
+        return LEXEMES.get(terminal.tipe, [])
+
+    def alt_size(self, alt):
+        size = 0
+        for e in alt:
+            if isinstance(e, Terminal):
+                if not self.lexemes(e):
+                    return None
+                size += 1
+            else:
+                if self.shortest[e] is None:
+                    return None
+                size += self.shortest[e]
+        return size
+
+    def derive(self, cls, rng, max_depth, depth=0, out=None):
+        # daftar (tipe, lexeme) hasil turunan acak dari cls
+        if out is None:
+            out = []
+        alts = [alt for alt in self.rules[cls] if self.alt_size(alt) is not None]
+        if depth >= max_depth:
+            alt = min(alts, key=self.alt_size)
+        else:
+            alt = rng.choice(alts)
+        for e in alt:
+            if isinstance(e, Terminal):
+                out.append((e.tipe, rng.choice(self.lexemes(e))))
+            else:
+                self.derive(e, rng, max_depth, depth + 1, out)
+        return out
+
+
+def to_source(pairs):
+    lines = []
+    for i in range(0, len(pairs), 16):
+        lines.append(" ".join(v for _, v in pairs[i:i + 16]))
+    return "\n".join(lines) + "\n"
+
+
+def to_tokens(pairs):
+    return [Token(t, v) for t, v in pairs]
+
+
+def count_attempts(tokens, cap):
+    # (percobaan rule, terpotong di cap?, indeks token saat terpotong atau None)
+    # untuk ProgramNode().parse tanpa error_ctx
+    budget = ParseBudget(cap, 10 ** 9, 10 ** 12)
+    budget.reset(len(tokens))
+    index = None
+    try:
+        ProgramNode().parse(tokens, 0, None, budget)
+    except ParseBudgetExceeded as e:
+        index = e.index
+    return budget.attempts, index is not None, index
+
+
+class Fuzzer:
+    def __init__(self, grammar, rng, max_tokens, cap, gen_depth):
+        self.grammar = grammar
+        self.rng = rng
+        self.max_tokens = max_tokens
+        self.cap = cap
+        self.gen_depth = gen_depth
+        self.seen = {}
+
+    def evaluate(self, pairs):
+        key = tuple(pairs)
+        result = self.seen.get(key)
+        if result is None:
+            attempts, capped, index = count_attempts(to_tokens(pairs), self.cap)
+            # kasus di cap dinilai per token yang sudah dicapai parse, sehingga
+            # fitness tetap naik jika ledakan terjadi lebih awal
+            reached = index + 1 if capped else max(len(pairs), 1)
+            result = self.seen[key] = (attempts / reached, attempts, capped)
+        return result
+
+    def fragment(self):
+        cls = self.rng.choice(self.grammar.nonterminals)
+        return self.grammar.derive(cls, self.rng, self.rng.randint(1, self.gen_depth))
+
+    def mutate(self, pairs):
+        rng = self.rng
+        pairs = list(pairs)
+        for _ in range(rng.randint(1, 3)):
+            n = len(pairs)
+            i = rng.randrange(n)
+            kind = rng.randrange(7)
+            if kind == 0 and n > 1:
+                del pairs[i]
+            elif kind == 1:
+                pairs.insert(i, pairs[i])
+            elif kind == 2:
+                j = rng.randrange(n)
+                pairs[i], pairs[j] = pairs[j], pairs[i]
+            elif kind == 3:
+                pairs[i] = rng.choice(self.grammar.alphabet)
+            elif kind == 4:
+                pairs.insert(i, rng.choice(self.grammar.alphabet))
+            elif kind == 5:
+                # ulangi potongan pendek: memperdalam kurung/blok bersarang
+                j = min(n, i + rng.randint(1, 4))
+                pairs[i:i] = pairs[i:j] * rng.randint(1, 4)
+            else:
+                j = min(n, i + rng.randint(0, 6))
+                pairs[i:j] = self.fragment()
+        return pairs[:self.max_tokens]
+
+    def run(self, seeds, iterations, size, log_every=0):
+        # satu anggota populasi per bentuk (shape), agar kasus yang sudah
+        # mencapai cap tidak memenuhi populasi dengan varian yang sama
+        population = {}
+        for pairs in seeds:
+            self.offer(population, pairs, size)
+
+        for it in range(1, iterations + 1):
+            members = list(population.values())
+            a, b = self.rng.choice(members), self.rng.choice(members)
+            parent = a if rank(a) >= rank(b) else b
+            child = self.mutate(parent[1])
+            if child and tuple(child) not in self.seen:
+                self.offer(population, child, size)
+            if log_every and it % log_every == 0:
+                fitness, pairs = max(population.values(), key=rank)
+                print(f"iterasi {it:>6}: terbaik {fitness[0]:.0f} percobaan/token"
+                      f" ({len(pairs)} token{', cap' if fitness[2] else ''}), {len(population)} bentuk")
+        return sorted(population.values(), key=rank, reverse=True)
+
+    def offer(self, population, pairs, size):
+        entry = (self.evaluate(pairs), pairs)
+        key = shape(pairs)
+        current = population.get(key)
+        if current is not None:
+            if rank(entry) > rank(current):
+                population[key] = entry
+            return
+        population[key] = entry
+        if len(population) > size:
+            worst = min(population, key=lambda k: rank(population[k]))
+            del population[worst]
+
+
+def rank(entry):
+    # percobaan per token lebih tinggi lebih baik; seri (mis. di cap): lebih pendek
+    fitness, pairs = entry
+    return (fitness[0], -len(pairs))
+
+
+def shape(pairs):
+    # urutan token dengan lexeme tipe terbuka dihapus dan pengulangan berturut-turut
+    # digabung: '((((1))))' dan '((1))' berbentuk sama
+    out = []
+    for tipe, nilai in pairs:
+        item = tipe if tipe in OPEN_TYPES else nilai
+        if not out or out[-1] != item:
+            out.append(item)
+    return tuple(out)
+
+
+def seed_programs(grammar, rng, count, max_tokens, gen_depth, dfa):
+    seeds = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test", "**", "*.pas"), recursive=True)):
+        with open(path, encoding="utf-8") as f:
+            code, raw = tokenize(f.read(), dfa)
+        if code == 0 and len(raw) <= max_tokens:
+            seeds.append(list(raw))
+    tries = 0
+    generated = 0
+    while generated < count and tries < count * 20:
+        tries += 1
+        pairs = grammar.derive(ProgramNode, rng, gen_depth)
+        if len(pairs) > max_tokens:
+            continue
+        tokens = to_tokens(pairs)
+        success, end_idx = ProgramNode().parse(tokens, 0)
+        if success and end_idx == len(tokens):
+            seeds.append(pairs)
+            generated += 1
+    return seeds
+
+
+def similar(a, b):
+    return difflib.SequenceMatcher(None, shape(a), shape(b), autojunk=False).ratio() >= SIMILAR_RATIO
+
+
+def save_case(corpus, pairs, dfa, cap, seed):
+    # jumlah percobaan dihitung ulang dengan cap penyimpanan (bukan fitness pencarian)
+    source = to_source(pairs)
+    code, raw = tokenize(source, dfa)
+    if code != 0 or [tuple(t) for t in raw] != [tuple(p) for p in pairs]:
+        return None
+    attempts, capped, _ = count_attempts(to_tokens(pairs), cap)
+    name = f"slow_{zlib.crc32(source.encode()):08x}.pas"
+    path = os.path.join(corpus, name)
+    note = f"{'>= ' if capped else ''}{attempts} percobaan rule, {len(pairs)} token, cap {cap}, seed {seed}"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"{HEADER}{note} }}\n{source}")
+    return path, capped
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--iterations", type=int, default=5000)
+    ap.add_argument("--population", type=int, default=24)
+    ap.add_argument("--max-tokens", type=int, default=300)
+    ap.add_argument("--cap", type=int, default=10 * DEFAULT_MAX_ATTEMPTS_PER_TOKEN,
+                    help="batas percobaan rule per token per parse saat mencari (default: 10x batas ParseBudget)")
+    ap.add_argument("--record-cap", type=int, default=100 * DEFAULT_MAX_ATTEMPTS_PER_TOKEN,
+                    help="batas percobaan rule per token untuk jumlah yang disimpan (default: 100x batas ParseBudget)")
+    ap.add_argument("--gen-depth", type=int, default=8, help="kedalaman turunan acak sebelum alternatif terpendek")
+    ap.add_argument("--seeds", type=int, default=30, help="jumlah program awal hasil generate grammar")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--save", type=int, default=8, help="jumlah kasus terlambat yang disimpan (0: tidak disimpan)")
+    ap.add_argument("--corpus", default=CORPUS_DIR)
+    args = ap.parse_args()
+    sys.setrecursionlimit(100000)
+
+    dfa = load_dfa_rules()
+    rng = random.Random(args.seed)
+    grammar = Grammar()
+    seeds = seed_programs(grammar, rng, args.seeds, args.max_tokens, args.gen_depth, dfa)
+    print(f"{len(grammar.rules)} kelas grammar, {len(grammar.alphabet)} terminal, {len(seeds)} program awal")
+
+    fuzzer = Fuzzer(grammar, rng, args.max_tokens, args.cap, args.gen_depth)
+    t0 = time.perf_counter()
+    population = fuzzer.run(seeds, args.iterations, args.population, log_every=max(args.iterations // 10, 1))
+    print(f"{len(fuzzer.seen)} input dievaluasi dalam {time.perf_counter() - t0:.1f} s\n")
+
+    print(f"{'percobaan/token':>15} {'percobaan':>10} {'token':>6}")
+    for fitness, pairs in population[:max(args.save, 5)]:
+        per_token, attempts, capped = fitness
+        print(f"{per_token:>15.0f} {attempts:>10}{'+' if capped else ' '} {len(pairs):>5}")
+
+    if args.save:
+        os.makedirs(args.corpus, exist_ok=True)
+        saved = []
+        for fitness, pairs in population:
+            if len(saved) == args.save:
+                break
+            if any(similar(pairs, other) for other in saved):
+                continue
+            result = save_case(args.corpus, pairs, dfa, args.record_cap, args.seed)
+            if result:
+                path, capped = result
+                saved.append(pairs)
+                print(f"disimpan: {os.path.relpath(path, ROOT)}"
+                      f"{' (terpotong --record-cap: kenaikan tidak terdeteksi)' if capped else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Generator program Pascal-S sintetis untuk benchmark dan uji skala.
+
+Setiap shape menghasilkan program yang valid secara sintaks maupun semantik;
+ukurannya diatur oleh satu parameter `size`:
+
+    nesting      statement bersarang sedalam size (mulai / jika..selain-itu / selama / untuk)
+    statements   size statement berturut-turut di badan program
+    expressions  ekspresi integer, real, dan boolean selebar size operand
+    globals      size konstanta + variabel global yang semuanya dipakai
+    records      tipe rekaman/larik bersarang sedalam size beserta aksesnya
+    subprograms  size prosedur/fungsi yang saling memanggil
+
+    python bench/gen_program.py <shape> <size> [--seed S] [-o file.pas]
+"""
+import argparse
+import random
+import sys
+
+HEADER = [
+    "variabel",
+    "    a, b, c: integer;",
+    "    x, y: real;",
+    "    p: boolean;",
+]
+
+INT_OPS = ["+", "-", "*", "mod", "bagi"]
+BOOL_OPS = ["atau", "dan"]
+
+
+def _program(decls, body):
+    return "\n".join(["program gen;"] + decls + ["mulai", ";\n".join("    " + s for s in body), "selesai."]) + "\n"
+
+
+def _init():
+    return ["a := 1", "b := 2", "c := 3", "x := 0.5", "y := 1.5", "p := benar"]
+
+
+def gen_statements(size, rng):
+    templates = [
+        lambda k: f"a := a + {k}",
+        lambda k: "b := (a + c) mod 7",
+        lambda k: f"x := x * 2.5 + a",
+        lambda k: "p := a < b",
+        lambda k: f"jika p maka a := {k} selain-itu a := b",
+        lambda k: "selama a > 100 lakukan a := a - 1",
+        lambda k: f"untuk c := 1 ke {k % 10 + 1} lakukan b := b + c",
+        lambda k: "writeln(a)",
+    ]
+    body = _init() + [rng.choice(templates)(k) for k in range(size)]
+    return _program(HEADER, body)
+
+
+def gen_nesting(size, rng):
+    stmt = "a := a + 1"
+    for k in range(size):
+        kind = rng.randrange(4)
+        if kind == 0:
+            stmt = f"mulai {stmt}; b := b + 1 selesai"
+        elif kind == 1:
+            stmt = f"jika a < {k} maka {stmt} selain-itu b := {k}"
+        elif kind == 2:
+            stmt = f"selama a > {k} lakukan {stmt}"
+        else:
+            stmt = f"untuk c := 1 ke {k + 1} lakukan {stmt}"
+    return _program(HEADER, _init() + [stmt])
+
+
+def gen_expressions(size, rng):
+    operands = ["a", "b", "c", "7", "(a + 3)"]
+    int_expr = rng.choice(operands)
+    for _ in range(size - 1):
+        int_expr += f" {rng.choice(INT_OPS)} {rng.choice(operands)}"
+
+    real_expr = "x"
+    for _ in range(size - 1):
+        real_expr += f" {rng.choice(['+', '-', '*', '/'])} {rng.choice(['x', 'y', 'a', '2.5'])}"
+
+    comparisons = [f"({rng.choice('abc')} {rng.choice(['<', '<=', '=', '<>', '>', '>='])} {rng.choice('abc')})"
+                   for _ in range(max(1, size // 2))]
+    bool_expr = comparisons[0]
+    for cmp in comparisons[1:]:
+        bool_expr += f" {rng.choice(BOOL_OPS)} {cmp}"
+
+    return _program(HEADER, _init() + [f"a := {int_expr}", f"x := {real_expr}", f"p := {bool_expr}"])
+
+
+def gen_globals(size, rng):
+    consts = max(1, size // 4)
+    decls = ["konstanta"] + [f"    k{i} = {i};" for i in range(consts)]
+    decls += ["variabel"]
+    for i in range(0, size, 8):
+        names = ", ".join(f"g{j}" for j in range(i, min(size, i + 8)))
+        decls.append(f"    {names}: integer;")
+    body = ["g0 := k0"] + [f"g{i} := g{rng.randrange(i)} + k{rng.randrange(consts)}" for i in range(1, size)]
+    return _program(decls, body)
+
+
+def gen_records(size, rng):
+    # rekaman genap berisi rekaman sebelumnya, rekaman ganjil berisi larik [1..1]
+    # dari rekaman sebelumnya: ukuran tipe tumbuh linear terhadap kedalaman
+    decls = ["tipe", "    r0 = rekaman n: integer selesai;"]
+    for k in range(1, size + 1):
+        if k % 2 == 0:
+            decls.append(f"    r{k} = rekaman f: r{k - 1}; n: integer selesai;")
+        else:
+            decls.append(f"    a{k} = larik [1..1] dari r{k - 1};")
+            decls.append(f"    r{k} = rekaman e: a{k}; n: integer selesai;")
+    decls += ["variabel", f"    v: r{size};", "    a: integer;"]
+
+    body = ["a := 0"]
+    for _ in range(4):
+        depth = rng.randrange(size + 1)
+        path = "v"
+        for k in range(size, size - depth, -1):
+            path += ".f" if k % 2 == 0 else ".e[1]"
+        body.append(f"{path}.n := a + 1")
+        body.append(f"a := {path}.n")
+    return _program(decls, body)
+
+
+def gen_subprograms(size, rng):
+    decls = ["variabel", "    g: integer;", "    r: real;"]
+    kinds = []
+    for i in range(size):
+        prev = kinds[-1] if kinds else None
+        if prev == "p":
+            call = f"p{i - 1}(a, t)"
+        elif prev == "f":
+            call = f"t := f{i - 1}(t, 1.5)"
+        else:
+            call = "t := t + 1"
+
+        if rng.random() < 0.5:
+            kinds.append("p")
+            decls.append(f"prosedur p{i}(a: integer; variabel b: integer);")
+            decls.append("variabel t: integer;")
+            if i % 4 == 0:
+                decls.append("    fungsi h(a: integer): integer;")
+                decls.append("    mulai h := a + 1 selesai;")
+                decls.append(f"mulai t := h(a) + b; b := t; {call} selesai;")
+            else:
+                decls.append(f"mulai t := a + b; b := t; {call} selesai;")
+        else:
+            kinds.append("f")
+            decls.append(f"fungsi f{i}(a: integer; x: real): integer;")
+            decls.append("variabel t: integer;")
+            decls.append(f"mulai t := a * 2; {call}; f{i} := t selesai;")
+
+    body = ["g := 1", "r := 0.5"]
+    for i, kind in enumerate(kinds):
+        body.append(f"p{i}(g, g)" if kind == "p" else f"g := f{i}(g, r)")
+    return _program(decls, body)
+
+
+SHAPES = {
+    "nesting": gen_nesting,
+    "statements": gen_statements,
+    "expressions": gen_expressions,
+    "globals": gen_globals,
+    "records": gen_records,
+    "subprograms": gen_subprograms,
+}
+
+
+def generate(shape, size, seed=0):
+    return SHAPES[shape](size, random.Random(f"{shape}:{size}:{seed}"))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Generator program Pascal-S sintetis")
+    ap.add_argument("shape", choices=sorted(SHAPES))
+    ap.add_argument("size", type=int)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("-o", "--output", help="file keluaran (default: stdout)")
+    args = ap.parse_args()
+
+    source = generate(args.shape, args.size, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(source)
+    else:
+        sys.stdout.write(source)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import sys
+from array import array
 from ast_nodes import *
 
 OBJ_CONSTANT  = 0
@@ -15,61 +16,321 @@ T_REAL    = 2
 T_BOOLEAN = 3
 T_CHAR    = 4
 T_STRING  = 5 
+T_ERROR   = -1 # Result of an expression whose error was already reported
 
-class TabEntry:
-    def __init__(self, name, obj, type_idx, ref, nrm, lev, adr, link):
-        self.name = name    # Identifier name
-        self.obj = obj      # Constant, Variable, etc.
-        self.type = type_idx# Reference to type (Primitive ID or Tab Index)
-        self.ref = ref      # Reference to ATAB (if array) or Size (if Record Type)
-        self.nrm = nrm      # Normal (1) or Indirect/Param (0)
-        self.lev = lev      # Scope Level
-        self.adr = adr      # Memory Offset / Address / Value / Size
-        self.link = link    # Pointer to previous symbol in same scope
+DEFAULT_MAX_ERRORS = 100
+
+class SemanticError(Exception):
+    pass
+
+class TooManyErrors(Exception):
+    pass
+
+# ==========================================
+# TABLE STORAGE
+# ==========================================
+# tab, btab and atab keep one typed array per field instead of one Python
+# object per row. Indexing a table returns a small row view whose attributes
+# read and write the columns, so entry.type / block.vsze += n work as before.
+# A value that does not fit a column's type code (a huge constant or array
+# size) turns that column into a plain list, so the tables accept the same
+# values as one object per row did.
+
+class _Row:
+    __slots__ = ("_table", "_idx")
+
+    def __init__(self, table, idx):
+        self._table = table
+        self._idx = idx
+
+def _column(i):
+    def get(row):
+        return row._table.columns[i][row._idx]
+    def set(row, value):
+        try:
+            row._table.columns[i][row._idx] = value
+        except OverflowError:
+            row._table.widen(i)[row._idx] = value
+    return property(get, set)
+
+class ColumnTable:
+    fields = ()
+    typecodes = ()
+    row_class = _Row
+
+    def __init__(self):
+        self.columns = [array(code) for code in self.typecodes]
+        # Columns are also attributes (btab.last[i]) for the hot paths
+        for name, column in zip(self.fields, self.columns):
+            setattr(self, name, column)
+
+    def __len__(self):
+        return len(self.columns[0])
+
+    def __getitem__(self, idx):
+        n = len(self.columns[0])
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self.row_class(self, idx)
+
+    def __iter__(self):
+        row_class = self.row_class
+        return (row_class(self, i) for i in range(len(self)))
+
+    def append(self, *values):
+        columns = self.columns
+        for i, value in enumerate(values):
+            try:
+                columns[i].append(value)
+            except OverflowError:
+                self.widen(i).append(value)
+        return len(columns[0]) - 1
+
+    def widen(self, i):
+        column = self.columns[i] = list(self.columns[i])
+        setattr(self, self.fields[i], column)
+        return column
+
+    def row(self, idx):
+        return tuple(column[idx] for column in self.columns)
+
+    def truncate(self, n):
+        for column in self.columns:
+            del column[n:]
+
+class TabEntry(_Row):
+    __slots__ = ()
+    # name is stored as an id into SymbolTable.names
+    obj = _column(1)    # Constant, Variable, etc.
+    type = _column(2)   # Reference to type (Primitive ID or Tab Index)
+    ref = _column(3)    # Reference to ATAB (if array) or Size (if Record Type)
+    nrm = _column(4)    # Normal (1) or Indirect/Param (0)
+    lev = _column(5)    # Scope Level
+    adr = _column(6)    # Memory Offset / Address / Value / Size
+    link = _column(7)   # Pointer to previous symbol in same scope
+
+    @property
+    def name(self):
+        table = self._table
+        return table.names[table.name_id[self._idx]]
 
     def __repr__(self):
         obj_map = ["Const", "Var", "Type", "Proc", "Func", "Prog", "Param"]
         obj_str = obj_map[self.obj] if 0 <= self.obj < len(obj_map) else "?"
         return f"| {self.name:<10} | {obj_str:<5} | Typ:{self.type:<3} | Ref:{self.ref:<3} | Nrm:{self.nrm:<1} | Lev:{self.lev:<1} | Adr:{self.adr:<3} | Link:{self.link:<2} |"
 
-class BtabEntry:
-    def __init__(self, last, lpar, psze, vsze):
-        self.last = last    # Index of last identifier in this block (in tab)
-        self.lpar = lpar    # Index of last parameter (in tab)
-        self.psze = psze    # Parameter Size
-        self.vsze = vsze    # Variable Size (Local variables)
+class SymbolTable(ColumnTable):
+    fields = ("name_id", "obj", "type", "ref", "nrm", "lev", "adr", "link")
+    typecodes = ("i", "b", "i", "i", "b", "b", "q", "i")
+    row_class = TabEntry
+
+    def __init__(self):
+        super().__init__()
+        self.names = []
+        self._name_ids = {}
+        # Procedure/function tab index -> (parameter types, is-var flags)
+        self.signatures = {}
+
+    def add(self, name, obj, type_idx, ref, nrm, lev, adr, link):
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        return self.append(name_id, obj, type_idx, ref, nrm, lev, adr, link)
+
+    def signature(self, idx):
+        sig = self.signatures.get(idx)
+        if sig is None:
+            sig = self.signatures[idx] = (array("i"), array("b"))
+        return sig
+
+class BtabEntry(_Row):
+    __slots__ = ()
+    last = _column(0)   # Index of last identifier in this block (in tab)
+    lpar = _column(1)   # Index of last parameter (in tab)
+    psze = _column(2)   # Parameter Size
+    vsze = _column(3)   # Variable Size (Local variables)
 
     def __repr__(self):
         return f"| Last:{self.last:<3} | Lpar:{self.lpar:<3} | P.Sz:{self.psze:<3} | V.Sz:{self.vsze:<3} |"
 
-class AtabEntry:
-    def __init__(self, inxtyp, eltyp, elref, low, high, elsze, size):
-        self.inxtyp = inxtyp # Index type (T_INTEGER etc)
-        self.eltyp = eltyp   # Element type (Primitive ID or Tab Index)
-        self.elref = elref   # Reference to ATAB if element is array
-        self.low = low       # Low bound value
-        self.high = high     # High bound value
-        self.elsze = elsze   # Element size
-        self.size = size     # Total size
+class BlockTable(ColumnTable):
+    fields = ("last", "lpar", "psze", "vsze")
+    typecodes = ("i", "i", "q", "q")
+    row_class = BtabEntry
+
+class AtabEntry(_Row):
+    __slots__ = ()
+    inxtyp = _column(0) # Index type (T_INTEGER etc)
+    eltyp = _column(1)  # Element type (Primitive ID or Tab Index)
+    elref = _column(2)  # Reference to ATAB if element is array
+    low = _column(3)    # Low bound value
+    high = _column(4)   # High bound value
+    elsze = _column(5)  # Element size
+    size = _column(6)   # Total size
 
     def __repr__(self):
         # ElSz added as requested
         return f"| Inx:{self.inxtyp:<3} | ElTyp:{self.eltyp:<3} | ElRef:{self.elref:<3} | Low:{self.low:<3} | High:{self.high:<3} | ElSz:{self.elsze:<3} | Sz:{self.size:<3} |"
 
+class ArrayTable(ColumnTable):
+    fields = ("inxtyp", "eltyp", "elref", "low", "high", "elsze", "size")
+    typecodes = ("b", "i", "i", "q", "q", "q", "q")
+    row_class = AtabEntry
+
+# ==========================================
+# OPERATOR TYPE RULES
+# ==========================================
+# Result of a binary operator for (operator row, left type, right type),
+# stored in one flat array. Entries >= T_ERROR are result types; lower
+# entries are the error codes below or one of the two rules that need the
+# actual operand types.
+
+E_INCOMPATIBLE = -2
+E_NOT_NUMERIC = -3
+E_NOT_INTEGER = -4
+E_NOT_BOOLEAN = -5
+E_NOT_SAME_TYPE = -6
+E_UNKNOWN_MULTIPLICATIVE = -7
+E_UNKNOWN_BINARY = -8
+R_LEFT = -9         # Result is the left operand's type
+R_SAME_TYPE = -10   # Boolean if both operands have the same (non-primitive) type
+
+OPERATOR_ERRORS = {
+    E_INCOMPATIBLE: "Incompatible operands for '{op}'",
+    E_NOT_NUMERIC: "Operands for '{op}' must be numeric",
+    E_NOT_INTEGER: "Operands for '{op}' must be integers",
+    E_NOT_BOOLEAN: "Operands for '{op}' must be boolean",
+    E_NOT_SAME_TYPE: "Operands for relational operator '{op}' must have same type",
+    E_UNKNOWN_MULTIPLICATIVE: "Unknown multiplicative operator '{op}'",
+    E_UNKNOWN_BINARY: "Unknown operator '{op}' in BinOpNode",
+}
+
+# Operator rows
+OP_ARITHMETIC = 0   # + - *
+OP_REAL_DIVIDE = 1  # /
+OP_INTEGER = 2      # div mod bagi
+OP_BOOLEAN = 3      # or and atau dan
+OP_RELATIONAL = 4   # = <> < > <= >=
+OP_UNCHECKED = 5    # other additive operators are not checked
+OP_UNKNOWN_MULTIPLICATIVE = 6
+OP_UNKNOWN_BINARY = 7
+OPERATOR_ROWS = 8
+
+# Operator lexeme -> row for each operator position; None is the fallback.
+# The Indonesian keywords (bagi, dan, atau) share the rows of div, and, or.
+ADDITIVE_OPERATORS = {'+': OP_ARITHMETIC, '-': OP_ARITHMETIC, 'or': OP_BOOLEAN, 'atau': OP_BOOLEAN,
+                      None: OP_UNCHECKED}
+MULTIPLICATIVE_OPERATORS = {'*': OP_ARITHMETIC, '/': OP_REAL_DIVIDE, 'div': OP_INTEGER, 'bagi': OP_INTEGER,
+                            'mod': OP_INTEGER, 'and': OP_BOOLEAN, 'dan': OP_BOOLEAN,
+                            None: OP_UNKNOWN_MULTIPLICATIVE}
+RELATIONAL_OPERATORS = {op: OP_RELATIONAL for op in ('=', '<>', '<', '>', '<=', '>=')}
+RELATIONAL_OPERATORS[None] = OP_UNKNOWN_BINARY
+
+# Type columns: T_ERROR, T_NOTYPE..T_STRING, then every other type (tab indices)
+_TYPE_COLUMN = {t: t + 1 for t in range(T_ERROR, T_STRING + 1)}
+_OTHER_COLUMN = len(_TYPE_COLUMN)
+_COLUMNS = _OTHER_COLUMN + 1
+_COLUMN_TYPES = list(range(T_ERROR, T_STRING + 1)) + [None]
+
+def _operator_rule(row, left, right):
+    # left/right: a primitive type, T_ERROR, or None for any other type
+    if T_ERROR in (left, right):
+        return T_ERROR
+    numeric = left in (T_INTEGER, T_REAL) and right in (T_INTEGER, T_REAL)
+    if row == OP_ARITHMETIC:
+        if not numeric:
+            return E_INCOMPATIBLE
+        return T_REAL if T_REAL in (left, right) else T_INTEGER
+    if row == OP_REAL_DIVIDE:
+        return T_REAL if numeric else E_NOT_NUMERIC
+    if row == OP_INTEGER:
+        return T_INTEGER if left == right == T_INTEGER else E_NOT_INTEGER
+    if row == OP_BOOLEAN:
+        return T_BOOLEAN if left == right == T_BOOLEAN else E_NOT_BOOLEAN
+    if row == OP_RELATIONAL:
+        if left is None and right is None:
+            return R_SAME_TYPE
+        return T_BOOLEAN if left == right else E_NOT_SAME_TYPE
+    if row == OP_UNCHECKED:
+        return R_LEFT
+    if row == OP_UNKNOWN_MULTIPLICATIVE:
+        return E_UNKNOWN_MULTIPLICATIVE
+    return E_UNKNOWN_BINARY
+
+OPERATOR_MATRIX = array("b", [
+    _operator_rule(row, left, right)
+    for row in range(OPERATOR_ROWS)
+    for left in _COLUMN_TYPES
+    for right in _COLUMN_TYPES
+])
+
+def operator_result(operators, op, left_type, right_type):
+    # Result type of `left op right`, or an E_* code (see OPERATOR_ERRORS)
+    row = operators.get(op)
+    if row is None:
+        row = operators[None]
+    result = OPERATOR_MATRIX[(row * _COLUMNS + _TYPE_COLUMN.get(left_type, _OTHER_COLUMN)) * _COLUMNS
+                             + _TYPE_COLUMN.get(right_type, _OTHER_COLUMN)]
+    if result >= T_ERROR:
+        return result
+    if result == R_LEFT:
+        return left_type
+    if result == R_SAME_TYPE:
+        return T_BOOLEAN if left_type == right_type else E_NOT_SAME_TYPE
+    return result
+
 # ==========================================
 # SEMANTIC ANALYZER (VISITOR)
 # ==========================================
 
+# Node class -> attribute names generic_visit descends into. ASTTransformer
+# sets every field in the node constructor, so the first instance of a class
+# describes all of them; analyzer annotations are not children.
+_CHILD_FIELDS = {}
+_ANNOTATIONS = ("tab_index", "type_index")
+
+def _child_fields(node):
+    fields = tuple(key for key in getattr(node, "__dict__", ()) if key not in _ANNOTATIONS)
+    _CHILD_FIELDS[node.__class__] = fields
+    return fields
+
 class SemanticAnalyzer:
-    def __init__(self):
-        self.tab = []
-        self.btab = []
-        self.atab = []
+    def __init__(self, collect_errors=False, max_errors=DEFAULT_MAX_ERRORS):
+        self.tab = SymbolTable()
+        self.btab = BlockTable()
+        self.atab = ArrayTable()
+        # Per-block name -> tab index of the block's own entries, so lookups
+        # and duplicate checks do not walk the whole link chain
+        self.block_names = []
+        # Record block -> {field name: (type, ref, offset)}, and resolved
+        # types of index-free field access paths keyed by (tab index, names)
+        self.record_fields = {}
+        self.field_paths = {}
+        # Node class -> bound visit_<Class> / _visit_<Class>_expr method,
+        # resolved on the first node of each class
+        self._visitors = {}
+        self._expression_visitors = {}
+        # Anonymous type descriptors by structure: atab row -> atab index,
+        # (field rows, size) -> record block. Named types always get their
+        # own entry, so a type name keeps a descriptor of its own.
+        self.array_types = {}
+        self.record_types = {}
         
 
         self.display = [0] * 20 
         self.level = 0
         self.current_subprogram = None
+
+        # Collecting mode: errors are recorded and analysis resumes at the
+        # next statement / declaration instead of stopping at the first one.
+        self.collect_errors = collect_errors
+        self.max_errors = max_errors
+        self.errors = []
+        self._reported = set()
+        self._quiet = 0
         
         self.init_keywords()
 
@@ -84,47 +345,88 @@ class SemanticAnalyzer:
         
         for kw in keywords:
             obj_type = OBJ_TYPE if kw == 'string' else OBJ_CONSTANT
-            self.tab.append(TabEntry(kw, obj_type, T_NOTYPE, 0, 0, 0, 0, 0))
+            self.tab.add(kw, obj_type, T_NOTYPE, 0, 0, 0, 0, 0)
 
 
-        self.btab.append(BtabEntry(last=28, lpar=0, psze=0, vsze=0))
+        self._new_block(28)
+        # Keyword entries have link 0, so only the chain head is reachable
+        curr_idx = self.btab.last[0]
+        while curr_idx > 0:
+            self.block_names[0].setdefault(self.tab[curr_idx].name, curr_idx)
+            curr_idx = self.tab.link[curr_idx]
         self.display[0] = 0
 
+    def _new_block(self, last):
+        self.block_names.append({})
+        return self.btab.append(last, 0, 0, 0)
+
     def error(self, msg):
-        raise Exception(f"Semantic Error: {msg}")
+        message = f"Semantic Error: {msg}"
+        if self.collect_errors and not self._quiet:
+            self._record(message)
+        raise SemanticError(message)
+
+    def _record(self, message):
+        self.errors.append(message)
+        if len(self.errors) >= self.max_errors:
+            raise TooManyErrors(message)
+
+    def _lookup_failed(self, msg, name):
+        # A failed lookup is reported once per name and scope; afterwards the
+        # name behaves as T_ERROR so its other uses do not cascade.
+        if not self.collect_errors or self._quiet:
+            self.error(msg)
+        key = (name, self.display[self.level])
+        if key not in self._reported:
+            self._reported.add(key)
+            self._record(f"Semantic Error: {msg}")
+        return T_ERROR
+
+    def _recover(self, visit, node):
+        if not self.collect_errors:
+            return visit(node)
+        level, subprogram = self.level, self.current_subprogram
+        try:
+            return visit(node)
+        except SemanticError:
+            self.level, self.current_subprogram = level, subprogram
+            return T_ERROR
+
+    def analyze_all(self, node):
+        # Run in collecting mode and return every diagnostic found
+        self.collect_errors = True
+        try:
+            self.analyze(node)
+        except (SemanticError, TooManyErrors):
+            pass
+        return self.errors
 
     def enter(self, name, obj, type_idx, ref=0, nrm=1, adr=0):
         current_btab_idx = self.display[self.level]
-        curr_idx = self.btab[current_btab_idx].last
-        limit = self.btab[current_btab_idx].lpar
-        
-        while curr_idx > limit: 
-            entry = self.tab[curr_idx]
-            if entry.name == name and entry.lev == self.level:
+        tab, btab = self.tab, self.btab
+        names = self.block_names[current_btab_idx]
+
+        prev_idx = names.get(name)
+        if prev_idx is not None and prev_idx <= btab.last[current_btab_idx]:
+            lpar = btab.lpar[current_btab_idx]
+            same_level = tab.lev[prev_idx] == self.level
+            if prev_idx > lpar and same_level:
                 self.error(f"Duplicate declaration of '{name}' in scope level {self.level}")
-            curr_idx = entry.link
-        
-        if self.level > 0:
-            curr_idx = self.btab[current_btab_idx].lpar
-            while curr_idx > 0 and self.tab[curr_idx].obj == OBJ_PARAMETER:
-                entry = self.tab[curr_idx]
-                if entry.name == name and entry.lev == self.level:
-                    self.error(f"Duplicate declaration of '{name}' (conflicts with parameter)")
-                curr_idx = entry.link
+            if (self.level > 0 and prev_idx <= lpar
+                    and tab.obj[prev_idx] == OBJ_PARAMETER and same_level):
+                self.error(f"Duplicate declaration of '{name}' (conflicts with parameter)")
         
         if self.level == 0:
             existing_idx, _ = self.lookup(name)
             if existing_idx > 0 and existing_idx <= 28: 
                 self.error(f"Cannot redeclare reserved word '{name}'")
 
-        link = self.btab[current_btab_idx].last
-        
-        new_entry = TabEntry(name, obj, type_idx, ref, nrm, self.level, adr, link)
-        
-        idx = len(self.tab)
-        self.tab.append(new_entry)
-        
-        self.btab[current_btab_idx].last = idx
+        link = btab.last[current_btab_idx]
+
+        idx = tab.add(name, obj, type_idx, ref, nrm, self.level, adr, link)
+
+        btab.last[current_btab_idx] = idx
+        names[name] = idx
         return idx
 
 
@@ -140,25 +442,38 @@ class SemanticAnalyzer:
                     self._expr_is_char(node.factor_node))
         return False
 
-    def _build_record_block(self, record_node: RecordTypeNode):
+    def _build_record_block(self, record_node: RecordTypeNode, shared=False):
+        first_field, err_count = len(self.tab), len(self.errors)
         self.level += 1
-        new_btab_idx = len(self.btab)
-        self.btab.append(BtabEntry(last=0, lpar=0, psze=0, vsze=0))
+        new_btab_idx = self._new_block(0)
         self.display[self.level] = new_btab_idx
 
         rec_size = self.analyze(record_node.field_list)
         self.btab[new_btab_idx].vsze = rec_size
+        self._index_record_fields(new_btab_idx)
 
         self.level -= 1
+        if shared and len(self.errors) == err_count:
+            # Field rows without link, which only chains the rows in order
+            key = (tuple(self.tab.row(i)[:-1] for i in range(first_field, len(self.tab))), rec_size)
+            existing = self.record_types.get(key)
+            if existing is not None:
+                # The block was just built and nothing refers to it yet
+                self.tab.truncate(first_field)
+                self.btab.truncate(new_btab_idx)
+                self.block_names.pop()
+                del self.record_fields[new_btab_idx]
+                return existing, rec_size
+            self.record_types[key] = new_btab_idx
         return new_btab_idx, rec_size
 
 
     def _normalize_type(self, type_idx, ref):
-        if type_idx > 5 and type_idx < len(self.tab):
-            tentry = self.tab[type_idx]
-            if tentry.obj == OBJ_TYPE:
-                base_type = tentry.type
-                base_ref  = tentry.ref
+        tab = self.tab
+        if type_idx > 5 and type_idx < len(tab):
+            if tab.obj[type_idx] == OBJ_TYPE:
+                base_type = tab.type[type_idx]
+                base_ref  = tab.ref[type_idx]
 
                 if base_type in (T_INTEGER, T_REAL, T_BOOLEAN, T_CHAR, T_STRING):
                     return base_type, 0
@@ -171,6 +486,10 @@ class SemanticAnalyzer:
     def _array_element_after_index(self, current_type, current_ref, index_expr):
         current_type, current_ref = self._normalize_type(current_type, current_ref)
 
+        if current_type == T_ERROR:
+            self.analyze_expression(index_expr)
+            return T_ERROR, 0
+
         if current_type != 5:
             self.error("Attempting to index a non-array value")
 
@@ -181,7 +500,9 @@ class SemanticAnalyzer:
 
         index_type = self.analyze_expression(index_expr)
 
-        if arr_desc.inxtyp == T_INTEGER:
+        if index_type == T_ERROR:
+            pass
+        elif arr_desc.inxtyp == T_INTEGER:
             if index_type != T_INTEGER:
                 self.error("Array index must be of type integer")
         elif arr_desc.inxtyp == T_CHAR:
@@ -192,10 +513,13 @@ class SemanticAnalyzer:
 
         if arr_desc.inxtyp == T_INTEGER:
             static_index = None
+            self._quiet += 1
             try:
                 static_index = self.evaluate_static_expr(index_expr)
             except Exception:
                 static_index = None
+            finally:
+                self._quiet -= 1
 
             if static_index is not None:
                 if static_index < arr_desc.low or static_index > arr_desc.high:
@@ -214,12 +538,11 @@ class SemanticAnalyzer:
         curr_lev = self.level
         while curr_lev >= 0:
             btab_idx = self.display[curr_lev]
-            curr_idx = self.btab[btab_idx].last
-            while curr_idx > 0:
-                entry = self.tab[curr_idx]
-                if entry.name == name:
-                    return curr_idx, entry
-                curr_idx = entry.link
+            idx = self.block_names[btab_idx].get(name)
+            # Entries inherited through the link chain belong to an enclosing
+            # level and are found there
+            if idx is not None and idx <= self.btab.last[btab_idx]:
+                return idx, self.tab[idx]
             curr_lev -= 1
         return 0, None
 
@@ -240,22 +563,27 @@ class SemanticAnalyzer:
 
     def analyze(self, node):
         if node is None: return T_NOTYPE
-        method_name = f"visit_{node.__class__.__name__}"
-        visitor = getattr(self, method_name, self.generic_visit)
+        visitor = self._visitors.get(node.__class__)
+        if visitor is None:
+            visitor = self._visitors[node.__class__] = getattr(
+                self, f"visit_{node.__class__.__name__}", self.generic_visit)
         return visitor(node)
 
     def generic_visit(self, node):
         res = T_NOTYPE
-        if hasattr(node, '__dict__'):
-            for key, value in node.__dict__.items():
-                if isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, AST): 
-                            val = self.analyze(item)
-                            if val != T_NOTYPE: res = val
-                elif isinstance(value, AST):
-                    val = self.analyze(value)
-                    if val != T_NOTYPE: res = val
+        fields = _CHILD_FIELDS.get(node.__class__)
+        if fields is None:
+            fields = _child_fields(node)
+        for key in fields:
+            value = getattr(node, key, None)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, AST):
+                        val = self.analyze(item)
+                        if val != T_NOTYPE: res = val
+            elif isinstance(value, AST):
+                val = self.analyze(value)
+                if val != T_NOTYPE: res = val
         return res
 
     def _resolve_type(self, type_node):
@@ -269,10 +597,10 @@ class SemanticAnalyzer:
             if type_name == 'string': return T_STRING
             
             idx, entry = self.lookup(type_name)
-            if entry and entry.obj == OBJ_TYPE: 
-                return idx 
-            
-            self.error(f"Undefined type '{type_name}'")
+            if entry and entry.obj == OBJ_TYPE:
+                return idx
+
+            return self._lookup_failed(f"Undefined type '{type_name}'", type_name)
         return T_NOTYPE
 
     def evaluate_static_expr(self, node):
@@ -305,11 +633,10 @@ class SemanticAnalyzer:
         prog_name = node.program_header.identifier
 
         self.level = 1
-        new_btab_idx = len(self.btab)
         parent_idx = self.display[0]
         parent_last = self.btab[parent_idx].last
 
-        self.btab.append(BtabEntry(last=parent_last, lpar=0, psze=0, vsze=0))
+        new_btab_idx = self._new_block(parent_last)
         self.display[self.level] = new_btab_idx
 
         self.enter(prog_name, OBJ_PROGRAM, T_NOTYPE, nrm=1)
@@ -332,12 +659,12 @@ class SemanticAnalyzer:
         return T_NOTYPE
 
     def visit_ConstDeclNode(self, node):
-        self.analyze(node.const_item)
+        self._recover(self.analyze, node.const_item)
         self.analyze(node.item_tail)
         return T_NOTYPE
 
     def visit_ConstTailNode(self, node):
-        if node.const_item: self.analyze(node.const_item)
+        if node.const_item: self._recover(self.analyze, node.const_item)
         if node.next_tail: self.analyze(node.next_tail)
         return T_NOTYPE
 
@@ -369,12 +696,12 @@ class SemanticAnalyzer:
         return T_NOTYPE
 
     def visit_TypeDeclNode(self, node):
-        self.analyze(node.type_item)
+        self._recover(self.analyze, node.type_item)
         self.analyze(node.item_tail)
         return T_NOTYPE
 
     def visit_TypeTailNode(self, node):
-        if node.type_item: self.analyze(node.type_item)
+        if node.type_item: self._recover(self.analyze, node.type_item)
         if node.next_tail: self.analyze(node.next_tail)
         return T_NOTYPE
 
@@ -388,7 +715,7 @@ class SemanticAnalyzer:
 
         idx = self.enter(name, OBJ_TYPE, T_NOTYPE)
         if isinstance(node.type_definition, ArrayTypeNode):
-            atab_idx = self.analyze(node.type_definition)
+            atab_idx = self._array_type(node.type_definition, shared=False)
             arr_size = self.atab[atab_idx - 1].size
 
             self.tab[idx].type = 5
@@ -406,17 +733,41 @@ class SemanticAnalyzer:
 
 
     def visit_RecordTypeNode(self, node):
-        block_idx, _ = self._build_record_block(node)
+        block_idx, _ = self._build_record_block(node, shared=True)
         return block_idx
 
+    def _field_path(self, node):
+        # Field names of an access without indexing (h1.c.re -> ('c', 're'))
+        if getattr(node, "index_expr", None) is not None:
+            return None
+        names = [] if node.identifier_2 is None else [node.identifier_2]
+        tail = node.tail
+        while tail and (tail.identifier is not None or getattr(tail, "index_expr", None) is not None):
+            if tail.identifier is None:
+                return None
+            names.append(tail.identifier)
+            tail = tail.next_tail
+        return tuple(names) if names else None
+
     def _visit_FieldAccessNode_expr(self, node):
         idx, entry = self.lookup(node.identifier_1)
         if not entry:
-            self.error(f"Undeclared variable '{node.identifier_1}'")
+            node.type_index = self._lookup_failed(f"Undeclared variable '{node.identifier_1}'", node.identifier_1)
+            return T_ERROR
+
+        path = self._field_path(node)
+        if path is not None:
+            path = (idx, path)
+            cached = self.field_paths.get(path)
+            if cached is not None:
+                node.type_index = cached
+                return cached
 
         current_type, current_ref = self._normalize_type(entry.type, entry.ref)
 
-        if node.identifier_2 is not None:
+        if current_type == T_ERROR:
+            pass
+        elif node.identifier_2 is not None:
             if current_type != 6:
                 self.error(f"'{node.identifier_1}' is not a record")
             current_type, current_ref = self._lookup_field_in_record(
@@ -433,6 +784,9 @@ class SemanticAnalyzer:
 
         tail = node.tail
         while tail and (tail.identifier is not None or getattr(tail, "index_expr", None) is not None):
+            if current_type == T_ERROR:
+                break
+
             if tail.identifier is not None:
                 current_type, current_ref = self._normalize_type(current_type, current_ref)
                 if current_type != 6:
@@ -451,23 +805,29 @@ class SemanticAnalyzer:
 
             tail = tail.next_tail
 
+        if path is not None and current_type != T_ERROR:
+            self.field_paths[path] = current_type
         node.type_index = current_type
         return current_type
 
 
-    def _lookup_field_in_record(self, block_idx, field_name):
-        b = self.btab[block_idx]
-        curr = b.last
-        limit = b.lpar
+    def _index_record_fields(self, block_idx):
+        # One walk of the record block's link chain; named field types are
+        # resolved here once instead of at every field access
+        tab = self.tab
+        names, name_id = tab.names, tab.name_id
+        fields = {}
+        curr = self.btab.last[block_idx]
+        limit = self.btab.lpar[block_idx]
 
         while curr > limit:
-            entry = self.tab[curr]
-            if entry.name == field_name and entry.obj == OBJ_VARIABLE:
-                field_type = entry.type
-                field_ref  = entry.ref
+            field_name = names[name_id[curr]]
+            if tab.obj[curr] == OBJ_VARIABLE and field_name not in fields:
+                field_type = tab.type[curr]
+                field_ref  = tab.ref[curr]
 
-                if field_type > 5 and field_type < len(self.tab):
-                    type_entry = self.tab[field_type]
+                if field_type > 5 and field_type < len(tab):
+                    type_entry = tab[field_type]
                     if type_entry.obj == OBJ_TYPE:
                         if type_entry.type in (T_INTEGER, T_REAL, T_BOOLEAN, T_CHAR, T_STRING):
                             field_type = type_entry.type
@@ -480,11 +840,23 @@ class SemanticAnalyzer:
                             field_type = 6
                             field_ref  = type_entry.ref
 
-                return field_type, field_ref
+                fields[field_name] = (field_type, field_ref, tab.adr[curr])
+
+            curr = tab.link[curr]
+
+        self.record_fields[block_idx] = fields
+        return fields
 
-            curr = entry.link
+    def _lookup_field_in_record(self, block_idx, field_name):
+        fields = self.record_fields.get(block_idx)
+        if fields is None:
+            # Block left incomplete by an error in its field list
+            fields = self._index_record_fields(block_idx)
+        field = fields.get(field_name)
+        if field is not None:
+            return field[0], field[1]
 
-        self.error(f"Unknown field '{field_name}' in record")
+        return self._lookup_failed(f"Unknown field '{field_name}' in record", field_name), 0
 
 
         
@@ -510,7 +882,8 @@ class SemanticAnalyzer:
         if node.field_list_tail:
             tail_size = self.analyze(node.field_list_tail)
 
-        return (len(identifiers) * size_per_field) + tail_size
+        rec_size = (len(identifiers) * size_per_field) + tail_size
+        return rec_size
 
         
     def visit_FieldListTailNode(self, node):
@@ -521,6 +894,9 @@ class SemanticAnalyzer:
         return 0
     
     def visit_ArrayTypeNode(self, node):
+        return self._array_type(node, shared=True)
+
+    def _array_type(self, node, shared):
         low_expr = node.range_node.expression_1
         high_expr = node.range_node.expression_2
 
@@ -568,26 +944,24 @@ class SemanticAnalyzer:
 
         total_size = count * elsze
 
-        new_entry = AtabEntry(
-            inxtyp=inxtyp,
-            eltyp=eltyp,
-            elref=elref,
-            low=low,
-            high=high,
-            elsze=elsze,
-            size=total_size
-        )
-        self.atab.append(new_entry)
-        return len(self.atab)
+        row = (inxtyp, eltyp, elref, low, high, elsze, total_size)
+        if not shared:
+            self.atab.append(*row)
+            return len(self.atab)
+        atab_idx = self.array_types.get(row)
+        if atab_idx is None:
+            self.atab.append(*row)
+            atab_idx = self.array_types[row] = len(self.atab)
+        return atab_idx
 
 
     def visit_VarDeclNode(self, node):
-        self.analyze(node.var_item)
+        self._recover(self.analyze, node.var_item)
         if node.item_tail: self.analyze(node.item_tail)
         return T_NOTYPE
 
     def visit_VarTailNode(self, node):
-        if node.var_item: self.analyze(node.var_item)
+        if node.var_item: self._recover(self.analyze, node.var_item)
         if node.next_tail: self.analyze(node.next_tail)
         return T_NOTYPE
 
@@ -600,7 +974,7 @@ class SemanticAnalyzer:
         size_per_var = 1
 
         if isinstance(node.type_node, RecordTypeNode):
-            rec_block_idx, rec_size = self._build_record_block(node.type_node)
+            rec_block_idx, rec_size = self._build_record_block(node.type_node, shared=True)
             v_type = 6
             v_ref = rec_block_idx
             size_per_var = rec_size
@@ -632,56 +1006,45 @@ class SemanticAnalyzer:
 
 
     def visit_ProcedureNode(self, node):
-        proc_name = node.identifier
-        proc_idx = self.enter(proc_name, OBJ_PROCEDURE, T_NOTYPE)
-        prev_subprog = self.current_subprogram
-        self.current_subprogram = proc_idx
-        
-        self.level += 1
-        new_btab_idx = len(self.btab)
-        self.btab.append(BtabEntry(last=self.tab[proc_idx].link, lpar=0, psze=0, vsze=0)) 
-        self.display[self.level] = new_btab_idx
-        
-        if node.formal_parameter_list:
-            self.analyze(node.formal_parameter_list)
-        
-        if self.btab[new_btab_idx].lpar > 0:
-            self.btab[new_btab_idx].last = self.btab[new_btab_idx].lpar
-        else:
-            self.btab[new_btab_idx].last = self.tab[proc_idx].link
-
-        self.analyze(node.block)
-        self.level -= 1
-        self.current_subprogram = prev_subprog
+        proc_idx = self.enter(node.identifier, OBJ_PROCEDURE, T_NOTYPE)
+        self._analyze_subprogram(node, proc_idx)
         return T_NOTYPE
 
     def visit_FunctionNode(self, node):
-        func_name = node.identifier
         ret_type_idx = self._resolve_type(node.return_type)
-        func_idx = self.enter(func_name, OBJ_FUNCTION, ret_type_idx)
+        func_idx = self.enter(node.identifier, OBJ_FUNCTION, ret_type_idx)
+        self._analyze_subprogram(node, func_idx)
+        return T_NOTYPE
+
+    def _analyze_subprogram(self, node, subprog_idx):
+        # Opens the block of an already entered procedure/function and
+        # analyzes its parameters and body
         prev_subprog = self.current_subprogram
-        self.current_subprogram = func_idx
+        self.current_subprogram = subprog_idx
         
         self.level += 1
-        new_btab_idx = len(self.btab)
-        self.btab.append(BtabEntry(last=self.tab[func_idx].link, lpar=0, psze=0, vsze=0))
+        new_btab_idx = self._new_block(self.tab[subprog_idx].link)
         self.display[self.level] = new_btab_idx
         
         if node.formal_parameter_list:
             self.analyze(node.formal_parameter_list)
-            
+        
         if self.btab[new_btab_idx].lpar > 0:
             self.btab[new_btab_idx].last = self.btab[new_btab_idx].lpar
         else:
-            self.btab[new_btab_idx].last = self.tab[func_idx].link
-            
+            self.btab[new_btab_idx].last = self.tab[subprog_idx].link
+
         self.analyze(node.block)
         self.level -= 1
         self.current_subprogram = prev_subprog
+
+    def visit_SubprogramSectionNode(self, node):
+        self._recover(self.analyze, node.subprogram_declaration)
+        self.analyze(node.next_section)
         return T_NOTYPE
 
     def visit_ParameterListNode(self, node):
-        self.analyze(node.param_group_node)
+        self._recover(self.analyze, node.param_group_node)
         self.analyze(node.next_tail)
         return T_NOTYPE
 
@@ -697,14 +1060,11 @@ class SemanticAnalyzer:
 
         if self.current_subprogram is None:
             self.error("Internal error: parameter group outside of procedure/function")
-        subprog_entry = self.tab[self.current_subprogram]
-        if not hasattr(subprog_entry, "param_types"):
-            subprog_entry.param_types = []
-            subprog_entry.param_is_var = []
+        param_types, param_is_var = self.tab.signature(self.current_subprogram)
         for name in identifiers:
             idx = self.enter(name, OBJ_PARAMETER, type_idx, nrm=nrm, adr=param_adr)
-            subprog_entry.param_types.append(type_idx)
-            subprog_entry.param_is_var.append(is_var_param)
+            param_types.append(type_idx)
+            param_is_var.append(is_var_param)
             self.btab[btab_idx].lpar = idx
             self.btab[btab_idx].psze += 1
             param_adr += 1
@@ -714,7 +1074,7 @@ class SemanticAnalyzer:
 
         
     def visit_ParameterTailNode(self, node):
-        if node.param_group_node: self.analyze(node.param_group_node)
+        if node.param_group_node: self._recover(self.analyze, node.param_group_node)
         if node.next_tail: self.analyze(node.next_tail)
         return T_NOTYPE
 
@@ -731,15 +1091,14 @@ class SemanticAnalyzer:
                 node.var_node.type_index = entry.type
                 lhs_type = entry.type
             else:
-                self.error(f"Undeclared variable '{name}'")
-                return T_NOTYPE
+                lhs_type = self._lookup_failed(f"Undeclared variable '{name}'", name)
 
         elif isinstance(node.field_access_node, FieldAccessNode):
             lhs_type = self._visit_FieldAccessNode_expr(node.field_access_node)
 
         rhs_type = self.analyze_expression(node.expression)
 
-        if lhs_type != T_NOTYPE and rhs_type != T_NOTYPE:
+        if lhs_type not in (T_NOTYPE, T_ERROR) and rhs_type not in (T_NOTYPE, T_ERROR):
 
             if lhs_type == T_REAL and rhs_type == T_INTEGER:
                 return lhs_type
@@ -801,14 +1160,13 @@ class SemanticAnalyzer:
         idx, entry = self.lookup(name)
         if not entry:
             if name not in ['writeln', 'write']:
-                self.error(f"Undeclared procedure or function '{name}'")
+                return self._lookup_failed(f"Undeclared procedure or function '{name}'", name)
             return T_NOTYPE
         if entry.obj not in [OBJ_PROCEDURE, OBJ_FUNCTION]:
             self.error(f"'{name}' is not callable")
 
         node.tab_index = idx
-        formal_types = getattr(entry, "param_types", [])
-        formal_is_var = getattr(entry, "param_is_var", [])
+        formal_types, formal_is_var = self.tab.signatures.get(idx, ((), ()))
         actual_types = []
         actual_nodes = []
         if node.parameter_list:
@@ -840,6 +1198,9 @@ class SemanticAnalyzer:
             if ftype == T_REAL and atype == T_INTEGER:
                 continue
 
+            if T_ERROR in (ftype, atype):
+                continue
+
             if ftype != atype:
                 self.error(
                     f"Type mismatch in argument {i+1} of '{name}': "
@@ -852,199 +1213,172 @@ class SemanticAnalyzer:
         return T_NOTYPE
 
     def visit_StatementListNode(self, node):
-        self.analyze(node.statement)
+        self._recover(self.analyze, node.statement)
         if node.tail: self.analyze(node.tail)
         return T_NOTYPE
 
     def visit_StatementListTailNode(self, node):
-        if node.statement: self.analyze(node.statement)
+        if node.statement: self._recover(self.analyze, node.statement)
         if node.next_tail: self.analyze(node.next_tail)
         return T_NOTYPE
 
     def analyze_expression(self, node):
         if node is None:
             return T_NOTYPE
+        visitor = self._expression_visitors.get(node.__class__)
+        if visitor is None:
+            visitor = self._expression_visitors[node.__class__] = getattr(
+                self, f"_visit_{node.__class__.__name__}_expr", self._generic_expr)
+        return visitor(node)
 
-        if isinstance(node, (NumberNode, CharNode, StringNode, BooleanNode)):
-            if isinstance(node, NumberNode):
-                t = T_REAL if '.' in str(node.value) else T_INTEGER
-            elif isinstance(node, CharNode):
-                t = T_CHAR
-            elif isinstance(node, StringNode):
-                t = T_STRING
-            elif isinstance(node, BooleanNode):
-                t = T_BOOLEAN
-            node.type_index = t
-            return t
+    def _generic_expr(self, node):
+        return T_NOTYPE
 
-        if isinstance(node, FieldAccessNode):
-            return self._visit_FieldAccessNode_expr(node)
+    def _visit_NumberNode_expr(self, node):
+        t = T_REAL if '.' in str(node.value) else T_INTEGER
+        node.type_index = t
+        return t
 
-        if isinstance(node, VarNode):
-            idx, entry = self.lookup(node.identifier)
-            if entry:
-                node.tab_index = idx
-                node.type_index = entry.type
-                return entry.type
-            self.error(f"Undeclared variable '{node.identifier}'")
-            return T_NOTYPE
+    def _visit_CharNode_expr(self, node):
+        node.type_index = T_CHAR
+        return T_CHAR
 
-        if isinstance(node, CallNode):
-            self.analyze(node)
-            idx, entry = self.lookup(node.identifier)
-            if entry and entry.obj == OBJ_FUNCTION:
-                node.type_index = entry.type
-                return entry.type
-            self.error(f"Call to non-function '{node.identifier}' in expression")
-            return T_NOTYPE
+    def _visit_StringNode_expr(self, node):
+        node.type_index = T_STRING
+        return T_STRING
 
-        if isinstance(node, UnaryOpNode):
-            op = node.operator.lexeme
-            operand_type = self.analyze_expression(node.term_node)
-
-            if op in ['+', '-']:
-                if operand_type in (T_INTEGER, T_REAL):
-                    node.type_index = operand_type
-                    return operand_type
-                self.error(f"Unary '{op}' requires numeric operand")
-                return T_NOTYPE
+    def _visit_BooleanNode_expr(self, node):
+        node.type_index = T_BOOLEAN
+        return T_BOOLEAN
 
-            if op == 'not':
-                if operand_type == T_BOOLEAN:
-                    node.type_index = T_BOOLEAN
-                    return T_BOOLEAN
-                self.error("Unary 'not' requires boolean operand")
-                return T_NOTYPE
+    def _visit_VarNode_expr(self, node):
+        idx, entry = self.lookup(node.identifier)
+        if entry:
+            node.tab_index = idx
+            node.type_index = entry.type
+            return entry.type
+        return self._lookup_failed(f"Undeclared variable '{node.identifier}'", node.identifier)
+
+    def _visit_CallNode_expr(self, node):
+        if self.analyze(node) == T_ERROR:
+            return T_ERROR
+        idx, entry = self.lookup(node.identifier)
+        if entry and entry.obj == OBJ_FUNCTION:
+            node.type_index = entry.type
+            return entry.type
+        self.error(f"Call to non-function '{node.identifier}' in expression")
+        return T_NOTYPE
+
+    def _visit_UnaryOpNode_expr(self, node):
+        op = node.operator.lexeme
+        operand_type = self.analyze_expression(node.term_node)
 
-            self.error(f"Unknown unary operator '{op}'")
+        if operand_type == T_ERROR:
+            return T_ERROR
+
+        if op in ['+', '-']:
+            if operand_type in (T_INTEGER, T_REAL):
+                node.type_index = operand_type
+                return operand_type
+            self.error(f"Unary '{op}' requires numeric operand")
             return T_NOTYPE
 
-        if isinstance(node, BinOpNode):
-            op = node.operator.lexeme
-            left_type = self.analyze_expression(node.left)
-            right_type = self.analyze_expression(node.right)
+        if op == 'not':
+            if operand_type == T_BOOLEAN:
+                node.type_index = T_BOOLEAN
+                return T_BOOLEAN
+            self.error("Unary 'not' requires boolean operand")
+            return T_NOTYPE
 
-            if op in ['=', '<>', '<', '>', '<=', '>=']:
-                if left_type == right_type:
-                    node.type_index = T_BOOLEAN
-                    return T_BOOLEAN
-                self.error(f"Operands for relational operator '{op}' must have same type")
-                return T_NOTYPE
+        self.error(f"Unknown unary operator '{op}'")
+        return T_NOTYPE
+
+    def _visit_BinOpNode_expr(self, node):
+        op = node.operator.lexeme
+        left_type = self.analyze_expression(node.left)
+        right_type = self.analyze_expression(node.right)
 
-            self.error(f"Unknown operator '{op}' in BinOpNode")
+        result = operator_result(RELATIONAL_OPERATORS, op, left_type, right_type)
+        if result == T_ERROR:
+            return T_ERROR
+        if result < T_ERROR:
+            self.error(OPERATOR_ERRORS[result].format(op=op))
             return T_NOTYPE
+        node.type_index = result
+        return result
 
-        if isinstance(node, SimpleExprNode):
-            left_type = self.analyze_expression(node.term)
-            tail = node.tail
-
-            while tail:
-                if tail.additive_operator is None:
-                    tail = tail.next_tail
-                    continue
-
-                op = tail.additive_operator.lexeme
-                right_type = self.analyze_expression(tail.term)
-
-                if op in ['+', '-']:
-                    if left_type in (T_INTEGER, T_REAL) and right_type in (T_INTEGER, T_REAL):
-                        left_type = T_REAL if T_REAL in (left_type, right_type) else T_INTEGER
-                    else:
-                        self.error(f"Incompatible operands for '{op}'")
-                        return T_NOTYPE
-
-                elif op in ['or']:
-                    if left_type == T_BOOLEAN and right_type == T_BOOLEAN:
-                        left_type = T_BOOLEAN
-                    else:
-                        self.error("Operands for 'or' must be boolean")
-                        return T_NOTYPE
+    def _visit_SimpleExprNode_expr(self, node):
+        left_type = self.analyze_expression(node.term)
+        tail = node.tail
 
+        while tail:
+            if tail.additive_operator is None:
                 tail = tail.next_tail
+                continue
 
-            node.type_index = left_type
-            return left_type
+            op = tail.additive_operator.lexeme
+            right_type = self.analyze_expression(tail.term)
 
-        if isinstance(node, TermNode):
-            left_type = self.analyze_expression(node.factor)
-            tail = node.tail
-
-            while tail:
-                opnode = tail.multiplicative_operator
-                if opnode is None:
-                    tail = tail.next_tail
-                    continue
-
-                op = opnode.lexeme
-                right_type = self.analyze_expression(tail.factor)
-
-                if op == '*':
-                    if left_type in (T_INTEGER, T_REAL) and right_type in (T_INTEGER, T_REAL):
-                        left_type = T_REAL if T_REAL in (left_type, right_type) else T_INTEGER
-                    else:
-                        self.error(f"Incompatible operands for '*'")
-                        return T_NOTYPE
-
-                elif op == '/':
-                    if left_type in (T_INTEGER, T_REAL) and right_type in (T_INTEGER, T_REAL):
-                        left_type = T_REAL
-                    else:
-                        self.error("Operands for '/' must be numeric")
-                        return T_NOTYPE
-
-                elif op in ['div', 'mod']:
-                    if left_type == T_INTEGER and right_type == T_INTEGER:
-                        left_type = T_INTEGER
-                    else:
-                        self.error(f"Operands for '{op}' must be integers")
-                        return T_NOTYPE
-
-                elif op == 'and':
-                    if left_type == T_BOOLEAN and right_type == T_BOOLEAN:
-                        left_type = T_BOOLEAN
-                    else:
-                        self.error("Operands for 'and' must be boolean")
-                        return T_NOTYPE
-
-                else:
-                    self.error(f"Unknown multiplicative operator '{op}'")
-                    return T_NOTYPE
+            left_type = operator_result(ADDITIVE_OPERATORS, op, left_type, right_type)
+            if left_type < T_ERROR:
+                self.error(OPERATOR_ERRORS[left_type].format(op=op))
+                return T_NOTYPE
+
+            tail = tail.next_tail
+
+        node.type_index = left_type
+        return left_type
 
+    def _visit_TermNode_expr(self, node):
+        left_type = self.analyze_expression(node.factor)
+        tail = node.tail
+
+        while tail:
+            opnode = tail.multiplicative_operator
+            if opnode is None:
                 tail = tail.next_tail
+                continue
 
-            node.type_index = left_type
-            return left_type
+            op = opnode.lexeme
+            right_type = self.analyze_expression(tail.factor)
 
+            left_type = operator_result(MULTIPLICATIVE_OPERATORS, op, left_type, right_type)
+            if left_type < T_ERROR:
+                self.error(OPERATOR_ERRORS[left_type].format(op=op))
+                return T_NOTYPE
 
-        return T_NOTYPE
+            tail = tail.next_tail
+
+        node.type_index = left_type
+        return left_type
 
     def visit_WhileNode(self, node):
-        cond_type = self.analyze_expression(node.expression)
+        cond_type = self._recover(self.analyze_expression, node.expression)
 
-        if cond_type != T_BOOLEAN:
-            self.error("Condition of WHILE must be boolean")
+        if cond_type not in (T_BOOLEAN, T_ERROR):
+            self._recover(self.error, "Condition of WHILE must be boolean")
 
-        self.analyze(node.statement)
+        self._recover(self.analyze, node.statement)
 
 
     def visit_IfNode(self, node):
-        cond_type = self.analyze_expression(node.expression)
+        cond_type = self._recover(self.analyze_expression, node.expression)
 
-        if cond_type != T_BOOLEAN:
-            self.error("Condition of IF must be boolean")
+        if cond_type not in (T_BOOLEAN, T_ERROR):
+            self._recover(self.error, "Condition of IF must be boolean")
 
-        self.analyze(node.then_statement)
+        self._recover(self.analyze, node.then_statement)
 
         if node.else_statement:
-            self.analyze(node.else_statement)
+            self._recover(self.analyze, node.else_statement)
 
 
     def visit_RepeatNode(self, node):
         self.analyze(node.statement_list)
 
-        cond_type = self.analyze_expression(node.expression)
+        cond_type = self._recover(self.analyze_expression, node.expression)
 
-        if cond_type != T_BOOLEAN:
+        if cond_type not in (T_BOOLEAN, T_ERROR):
             self.error("Condition of REPEAT..UNTIL must be boolean")
 
     def _collect_identifiers(self, id_list_node):
@@ -1057,6 +1391,25 @@ class SemanticAnalyzer:
             else: curr = None
         return ids
 
+    def dump_tables(self):
+        # Same rows as print_tables, as plain data (e.g. for JSON clients)
+        return {
+            "tab": [
+                {"idx": i, "name": e.name, "link": e.link, "obj": e.obj, "type": e.type,
+                 "ref": e.ref, "nrm": e.nrm, "lev": e.lev, "adr": e.adr}
+                for i, e in enumerate(self.tab) if i > 0
+            ],
+            "btab": [
+                {"idx": i, "last": b.last, "lpar": b.lpar, "psze": b.psze, "vsze": b.vsze}
+                for i, b in enumerate(self.btab)
+            ],
+            "atab": [
+                {"idx": i + 1, "inxtyp": a.inxtyp, "eltyp": a.eltyp, "elref": a.elref,
+                 "low": a.low, "high": a.high, "elsze": a.elsze, "size": a.size}
+                for i, a in enumerate(self.atab)
+            ],
+        }
+
     def print_tables(self):
         print("\n--- SYMBOL TABLE (tab) ---")
         print(f"{'Idx':<4} | {'Identifier':<12} | {'Link':<4} | {'Obj':<3} | {'Typ':<3} | {'Ref':<3} | {'Nrm':<3} | {'Lev':<3} | {'Adr':<3} |")
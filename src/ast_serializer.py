@@ -0,0 +1,357 @@
+# Serialisasi AST (hasil ASTTransformer, termasuk anotasi analyzer seperti
+# tab_index/type_index) ke format biner ringkas, untuk cache di disk dan untuk
+# mengirim AST dari worker process.
+#
+#   data = dumps(ast_root)
+#   ast_root = loads(data)
+#
+# pickle menyimpan nama modul/kelas dan nama atribut di setiap objek (memo
+# membantu, tetapi tetap per objek), dan rekursif sehingga gagal pada AST yang
+# dalam (RecursionError). Format di sini:
+#
+#   MAGIC, versi
+#   tabel string : varint jumlah, lalu per string varint panjang + UTF-8.
+#                  Berisi nama kelas, nama atribut, dan semua nilai str
+#                  (identifier, lexeme operator), masing-masing sekali.
+#   tabel kind   : varint jumlah, lalu per kind: id string nama kelas, varint
+#                  jumlah atribut, id string tiap atribut, varint bitmask
+#                  atribut yang bernilai None. Satu kind per (kelas, urutan
+#                  atribut, atribut None): node yang diberi anotasi analyzer
+#                  hanya menambah kind, dan atribut None (± sepertiga nilai di
+#                  AST) tidak ditulis di body sama sekali.
+#   nilai akar   : post-order. Setiap nilai diawali satu byte tag; node adalah
+#                  tag >= _NODE (tag - _NODE = kode kind, atau _NODE_EXT +
+#                  varint untuk kind ke-_MAX_INLINE_KIND dan seterusnya) dan
+#                  muncul setelah nilai atributnya yang bukan None, sesuai
+#                  urutan kind, tanpa nama atau panjang; list: item lalu
+#                  _LIST + varint panjang.
+#
+# Encoder dan decoder memakai stack eksplisit, jadi kedalaman AST tidak
+# dibatasi recursion limit. Decoder cukup mengambil anak dari puncak stack
+# nilai untuk setiap node (post-order), tanpa pelacakan slot induk. String
+# dari tabel di-intern (lihat symbols.py) sehingga identifier hasil loads()
+# tetap memakai jalur identitas di lookup dict SemanticAnalyzer.
+#
+# Encoder/decoder Python murni: dumps kira-kira secepat pickle, loads lebih
+# lambat dari unpickle (C); yang dibeli adalah ukuran dan kedalaman tak
+# terbatas. Decoder membaca body lewat satu iterator byte (for tag in body,
+# next untuk varint) alih-alih indeks + data[pos], dan varint kecil (< 0x80)
+# ditulis/dibaca tanpa loop.
+#
+#   python src/ast_serializer.py <file.pas>     # round-trip dan ukuran vs pickle
+
+import struct
+import sys
+from functools import partial
+from itertools import islice
+from operator import is_, is_not, length_hint
+
+import ast_nodes
+from ast_nodes import AST
+from symbols import intern_name
+
+MAGIC = b"PSAST"
+VERSION = 1
+
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3        # zigzag varint
+_STR = 4        # varint id string
+_LIST = 5       # varint panjang, lalu item
+_FLOAT = 6      # 8 byte double
+_NODE_EXT = 7   # varint kode kind
+_NODE = 8
+_MAX_INLINE_KIND = 256 - _NODE
+
+_is_none = partial(is_, None)
+_is_not_none = partial(is_not, None)
+_pack_double = struct.Struct("<d").pack
+_unpack_double = struct.Struct("<d").unpack_from
+
+class ASTFormatError(Exception):
+    pass
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _write_varint_reversed(out, value):
+    # varint yang byte-nya dibalik; lihat dumps()
+    encoded = bytearray()
+    _write_varint(encoded, value)
+    encoded.reverse()
+    out += encoded
+
+def dumps(root):
+    strings = {}
+    kinds = {}
+    kind_table = []
+    # body ditulis terbalik: pre-order dengan anak dikunjungi dari kanan dan
+    # byte setiap nilai dibalik, lalu seluruh buffer dibalik sekali di akhir
+    # sehingga hasilnya post-order dengan byte berurutan normal
+    body = bytearray()
+    append = body.append
+    write_reversed = _write_varint_reversed
+    is_none = _is_none
+    is_not_none = _is_not_none
+
+    stack = [root]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        value = pop()
+        if value is None:
+            append(_NONE)
+        elif isinstance(value, AST):
+            attrs = value.__dict__
+            values = attrs.values()
+            key = (value.__class__, tuple(attrs), tuple(map(is_none, values)))
+            code = kinds.get(key)
+            if code is None:
+                code = kinds[key] = len(kind_table)
+                kind_table.append(key)
+            if code < _MAX_INLINE_KIND:
+                append(_NODE + code)
+            else:
+                write_reversed(body, code)
+                append(_NODE_EXT)
+            push(filter(is_not_none, values))
+        elif value.__class__ is str:
+            sid = strings.get(value)
+            if sid is None:
+                sid = strings[value] = len(strings)
+            if sid < 0x80:
+                append(sid)
+            else:
+                write_reversed(body, sid)
+            append(_STR)
+        elif value is True or value is False:
+            append(_TRUE if value else _FALSE)
+        elif isinstance(value, int):
+            z = value << 1 if value >= 0 else ((-value) << 1) - 1
+            if z < 0x80:
+                append(z)
+            else:
+                write_reversed(body, z)
+            append(_INT)
+        elif isinstance(value, list):
+            count = len(value)
+            if count < 0x80:
+                append(count)
+            else:
+                write_reversed(body, count)
+            append(_LIST)
+            push(value)
+        elif isinstance(value, float):
+            body += _pack_double(value)[::-1]
+            append(_FLOAT)
+        else:
+            raise TypeError(f"nilai {type(value).__name__} di AST tidak dapat diserialisasi")
+    body.reverse()
+
+    # nama kelas dan atribut masuk tabel string setelah nilai: id nilai yang
+    # sering muncul tetap kecil (varint 1 byte)
+    def string_id(s):
+        sid = strings.get(s)
+        if sid is None:
+            sid = strings[s] = len(strings)
+        return sid
+    kind_ids = [(string_id(cls.__name__), [string_id(name) for name in names], none_mask)
+                for cls, names, none_mask in kind_table]
+
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    _write_varint(out, len(strings))
+    for s in strings:
+        encoded = s.encode("utf-8")
+        _write_varint(out, len(encoded))
+        out += encoded
+    _write_varint(out, len(kind_ids))
+    for class_id, name_ids, none_mask in kind_ids:
+        _write_varint(out, class_id)
+        _write_varint(out, len(name_ids))
+        for name_id in name_ids:
+            _write_varint(out, name_id)
+        _write_varint(out, sum(1 << i for i, is_none in enumerate(none_mask) if is_none))
+    out += body
+    return bytes(out)
+
+def loads(data):
+    # bytes, bytearray, memoryview, atau mmap
+    if not isinstance(data, (bytes, bytearray)):
+        data = memoryview(data).cast("B")
+    try:
+        return _loads(data)
+    except StopIteration:
+        raise ASTFormatError("data AST terpotong") from None
+    except (IndexError, UnicodeDecodeError, struct.error) as e:
+        raise ASTFormatError(f"data AST rusak: {e}") from None
+
+def _loads(data):
+    n = len(data)
+    if bytes(data[:len(MAGIC)]) != MAGIC:
+        raise ASTFormatError("bukan data AST (magic tidak cocok)")
+    if n <= len(MAGIC) or data[len(MAGIC)] != VERSION:
+        raise ASTFormatError("versi format AST tidak didukung")
+    pos = len(MAGIC) + 1
+
+    def read_varint():
+        nonlocal pos
+        result = 0
+        shift = 0
+        while True:
+            if pos >= n:
+                raise ASTFormatError("data AST terpotong")
+            b = data[pos]
+            pos += 1
+            result |= (b & 0x7F) << shift
+            if b < 0x80:
+                return result
+            shift += 7
+
+    strings = []
+    for _ in range(read_varint()):
+        length = read_varint()
+        if pos + length > n:
+            raise ASTFormatError("data AST terpotong")
+        strings.append(intern_name(str(data[pos:pos + length], "utf-8")))
+        pos += length
+
+    kinds = []
+    for _ in range(read_varint()):
+        class_name = strings[read_varint()]
+        cls = getattr(ast_nodes, class_name, None)
+        if not (isinstance(cls, type) and issubclass(cls, AST)):
+            raise ASTFormatError(f"kelas AST tidak dikenal: {class_name}")
+        names = tuple(strings[read_varint()] for _ in range(read_varint()))
+        none_mask = read_varint()
+        present = tuple(name for i, name in enumerate(names) if not none_mask >> i & 1)
+        # atribut None disalin dari template (urutan atribut asli tetap terjaga)
+        template = dict.fromkeys(names) if none_mask else None
+        kinds.append((cls, present, len(present), template))
+
+    # post-order: nilai didorong ke stack; node/list mengambil anaknya dari
+    # puncak stack. Body dibaca lewat iterator byte (lebih murah daripada
+    # data[pos] per byte); offset untuk pesan error dihitung dari sisa iterator.
+    # Konstanta tag disalin ke variabel lokal untuk loop ini.
+    NODE, NODE_EXT, STR, NONE = _NODE, _NODE_EXT, _STR, _NONE
+    new = object.__new__
+    stack = []
+    push = stack.append
+    body = iter(data[pos:])
+    read = partial(next, body)
+
+    def offset():
+        return n - length_hint(body) - 1
+
+    def read_body_varint(b):
+        # b: byte pertama yang sudah dibaca
+        result = b & 0x7F
+        shift = 7
+        while b >= 0x80:
+            b = next(body, None)
+            if b is None:
+                raise ASTFormatError("data AST terpotong")
+            result |= (b & 0x7F) << shift
+            shift += 7
+        return result
+
+    for tag in body:
+        if tag >= NODE:
+            cls, names, count, template = kinds[tag - NODE]
+            node = new(cls)
+            attrs = node.__dict__
+            if template is not None:
+                attrs.update(template)
+            if count:
+                if len(stack) < count:
+                    raise ASTFormatError(f"node tanpa cukup atribut di offset {offset()}")
+                attrs.update(zip(names, stack[-count:]))
+                del stack[-count:]
+            push(node)
+        elif tag == STR:
+            sid = read()
+            if sid >= 0x80:
+                sid = read_body_varint(sid)
+            push(strings[sid])
+        elif tag == NONE:
+            push(None)
+        elif tag == NODE_EXT:
+            cls, names, count, template = kinds[read_body_varint(read())]
+            node = new(cls)
+            attrs = node.__dict__
+            if template is not None:
+                attrs.update(template)
+            if count:
+                if len(stack) < count:
+                    raise ASTFormatError(f"node tanpa cukup atribut di offset {offset()}")
+                attrs.update(zip(names, stack[-count:]))
+                del stack[-count:]
+            push(node)
+        elif tag == _INT:
+            z = read_body_varint(read())
+            push((z >> 1) if not z & 1 else -((z + 1) >> 1))
+        elif tag == _TRUE:
+            push(True)
+        elif tag == _FALSE:
+            push(False)
+        elif tag == _LIST:
+            count = read_body_varint(read())
+            if len(stack) < count:
+                raise ASTFormatError(f"list tanpa cukup item di offset {offset()}")
+            items = stack[len(stack) - count:]
+            del stack[len(stack) - count:]
+            push(items)
+        elif tag == _FLOAT:
+            push(_unpack_double(bytes(islice(body, 8)))[0])
+        else:
+            raise ASTFormatError(f"tag tidak dikenal {tag} di offset {offset()}")
+
+    if len(stack) != 1:
+        raise ASTFormatError("data AST tidak berisi tepat satu nilai akar")
+    return stack[0]
+
+def dump(root, f):
+    f.write(dumps(root))
+
+def load(f):
+    return loads(f.read())
+
+def main():
+    import pickle
+    import time
+
+    from lexer import load_dfa_rules
+    from lexer_codegen import tokenize
+    from parser2 import Token, parse_tokens
+    from ast_transformer import ASTTransformer
+
+    if len(sys.argv) != 2:
+        print("Penggunaan: python src/ast_serializer.py <file.pas>")
+        sys.exit(1)
+    sys.setrecursionlimit(100000)
+    with open(sys.argv[1], "r", encoding="utf-8") as f:
+        code, raw = tokenize(f.read(), load_dfa_rules())
+    if code != 0:
+        print("Error: token tidak valid ditemukan")
+        sys.exit(1)
+    root, success, end_idx, _ = parse_tokens([Token(t, v) for t, v in raw])
+    if not success or end_idx != len(raw):
+        print("Error: program tidak lolos parsing")
+        sys.exit(1)
+    ast_root = ASTTransformer().transform(root)
+
+    t0 = time.perf_counter()
+    data = dumps(ast_root)
+    t1 = time.perf_counter()
+    same = str(loads(data)) == str(ast_root)
+    pickled = pickle.dumps(ast_root, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"{len(data)} byte ({len(pickled)} byte pickle), dumps {(t1 - t0) * 1000:.2f} ms, "
+          f"round-trip {'identik' if same else 'BERBEDA'}")
+    sys.exit(0 if same else 1)
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,15 @@ import sys
 import io
 
 from lexer import load_dfa_rules, tokenize, print_tokens, load_tokens_from_file
-from parser2 import ProgramNode as ParserRoot, Token, ParseErrorContext, Terminal
-from ast_transformer import ASTTransformer
-from ast_nodes import * 
-from ast_analyzer import SemanticAnalyzer
+
+# parser2, ast_transformer, dan ast_analyzer baru di-import saat tahapnya
+# dijalankan, sehingga --lexer-only tidak membayar waktu import parser/analyzer
 
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 def _get_readable_value(obj):
+    from parser2 import Token, Terminal
     if isinstance(obj, (Token, Terminal)):
         if obj.nilai is not None:
             return str(obj.nilai)
@@ -24,62 +24,96 @@ def _print_stage_header(title):
 
 def _print_syntax_error(tokens, error_ctx):
     _print_stage_header("SYNTAX ERROR FOUND")
+
+    for idx, expected, found, rule_name in error_ctx.errors:
+        _print_error_detail(tokens, idx, expected, found, rule_name)
+        print()
     
     if error_ctx.max_index > -1:
-        idx = error_ctx.max_index
-        
-        start_context = max(0, idx - 4)
-        end_context = min(len(tokens), idx + 4)
-        
-        pre_error_tokens = tokens[start_context:idx]
-        error_token = tokens[idx] if idx < len(tokens) else None
-        post_error_tokens = tokens[idx+1:end_context]
-        
-        prefix_str = " ".join([_get_readable_value(t) for t in pre_error_tokens])
-        error_str = _get_readable_value(error_token) if error_token else "EOF"
-        suffix_str = " ".join([_get_readable_value(t) for t in post_error_tokens])
-        
-        start_dots = "... " if start_context > 0 else ""
-        end_dots = " ..." if end_context < len(tokens) else ""
-        
-        full_context_line = f"{start_dots}{prefix_str} {error_str} {suffix_str}{end_dots}"
-        
-        caret_offset = len(start_dots) + len(prefix_str) + 1
-        if not prefix_str: caret_offset -= 1
-
-        print(f"Error Location (Index): {idx}")
-        print(f"Context: {full_context_line}")
-        print(" " * (9 + caret_offset) + "^ ERROR HERE")
-        print("-" * 50)
-        
-        expected_val = _get_readable_value(error_ctx.expected)
-        found_val = _get_readable_value(error_ctx.found)
-        
-        if isinstance(error_ctx.expected, Terminal) and error_ctx.expected.nilai is None:
-            expected_val = f"Any {error_ctx.expected.tipe}"
-
-        print(f"Expected : {expected_val}")
-        print(f"Found    : {found_val}")
-        print(f"Rule     : {error_ctx.rule_name}")
-    else:
+        _print_error_detail(tokens, error_ctx.max_index, error_ctx.expected,
+                            error_ctx.found, error_ctx.rule_name)
+    elif not error_ctx.errors:
         print("Unknown Error (Parser did not start).")
     
     sys.exit(1)
 
-def run_syntax_analysis(tokens):
-    _print_stage_header("Syntax Analysis (Parse Tree / CST)")
+def _print_error_detail(tokens, idx, expected, found, rule_name):
+    start_context = max(0, idx - 4)
+    end_context = min(len(tokens), idx + 4)
+    
+    pre_error_tokens = tokens[start_context:idx]
+    error_token = tokens[idx] if idx < len(tokens) else None
+    post_error_tokens = tokens[idx+1:end_context]
+    
+    prefix_str = " ".join([_get_readable_value(t) for t in pre_error_tokens])
+    error_str = _get_readable_value(error_token) if error_token else "EOF"
+    suffix_str = " ".join([_get_readable_value(t) for t in post_error_tokens])
+    
+    start_dots = "... " if start_context > 0 else ""
+    end_dots = " ..." if end_context < len(tokens) else ""
+    
+    full_context_line = f"{start_dots}{prefix_str} {error_str} {suffix_str}{end_dots}"
+    
+    caret_offset = len(start_dots) + len(prefix_str) + 1
+    if not prefix_str: caret_offset -= 1
+
+    print(f"Error Location (Index): {idx}")
+    print(f"Context: {full_context_line}")
+    print(" " * (9 + caret_offset) + "^ ERROR HERE")
+    print("-" * 50)
+    
+    expected_val = _get_readable_value(expected)
+    found_val = _get_readable_value(found)
     
-    parser = ParserRoot()
-    error_ctx = ParseErrorContext()
+    from parser2 import Terminal
+    if isinstance(expected, Terminal) and expected.nilai is None:
+        expected_val = f"Any {expected.tipe}"
+
+    print(f"Expected : {expected_val}")
+    print(f"Found    : {found_val}")
+    print(f"Rule     : {rule_name}")
+
+def _print_parse_tree(root):
+    print("Parsing berhasil!")
+    print("-" * 30)
+    print("Concrete Syntax Tree (CST) Structure:")
+    print(root.cetak())
+
+def run_syntax_analysis(tokens, recover=False, parser_backend="parser2", budget=None, strict=False):
+    from parser2 import ParseBudgetExceeded
+    from parse_driver import parse_tokens_budgeted
+    _print_stage_header("Syntax Analysis (Parse Tree / CST)")
+
+    if parser_backend == "fast":
+        # parser cepat tidak mencatat error: hanya parse lengkap yang dipakai,
+        # selain itu parse diulang dengan parser2 agar pesan error tetap sama
+        from parser import Parser
+        success, end_idx, root = Parser(tokens).parse()
+        if success and end_idx == len(tokens):
+            _print_parse_tree(root)
+            return root
     
-    success, end_idx = parser.parse(tokens, 0, error_ctx)
+    # dua fase: ParseErrorContext hanya dibuat jika parse gagal (atau mode recovery)
+    try:
+        parser, success, end_idx, error_ctx = parse_tokens_budgeted(tokens, recover=recover, budget=budget, strict=strict)
+    except ParseBudgetExceeded as e:
+        _print_stage_header("SYNTAX ERROR FOUND")
+        print(f"Parse dihentikan: {e}")
+        sys.exit(1)
+    except RecursionError:
+        _print_stage_header("SYNTAX ERROR FOUND")
+        print("Parse dihentikan: program terlalu dalam (recursion limit)")
+        sys.exit(1)
+
+    if success and error_ctx.errors:
+        error_ctx.max_index = -1
+        if end_idx < len(tokens):
+            error_ctx.errors.append((end_idx, "EOF", tokens[end_idx], "ProgramNode"))
+        _print_syntax_error(tokens, error_ctx)
 
     if success:
         if end_idx == len(tokens):
-            print("Parsing berhasil!")
-            print("-" * 30)
-            print("Concrete Syntax Tree (CST) Structure:")
-            print(parser.cetak())
+            _print_parse_tree(parser)
             return parser
         else:
             print(f"Parsing Incomplete. Berhenti di index {end_idx} dari {len(tokens)} token.")
@@ -94,6 +128,7 @@ def run_ast_generation(parse_tree_root):
     _print_stage_header("AST Generation (Abstract Syntax Tree)")
 
     try:
+        from ast_transformer import ASTTransformer
         transformer = ASTTransformer()
         ast_root = transformer.transform(parse_tree_root)
 
@@ -110,9 +145,26 @@ def run_ast_generation(parse_tree_root):
         sys.exit(1)
 
 
-def run_semantic_analysis(ast_root):
+def run_semantic_analysis(ast_root, all_errors=False, max_errors=None):
+    from ast_analyzer import SemanticAnalyzer, DEFAULT_MAX_ERRORS
     _print_stage_header("Semantic Analysis (Symbol Tables)")
-    
+
+    if max_errors is None:
+        max_errors = DEFAULT_MAX_ERRORS
+
+    if all_errors:
+        analyzer = SemanticAnalyzer(collect_errors=True, max_errors=max_errors)
+        errors = analyzer.analyze_all(ast_root)
+        if not errors:
+            analyzer.print_tables()
+            return
+        for msg in errors:
+            print(msg)
+        if len(errors) >= max_errors:
+            print(f"Analisis dihentikan: batas {max_errors} error tercapai")
+        print(f"Ditemukan {len(errors)} semantic error")
+        sys.exit(1)
+
     try:
         analyzer = SemanticAnalyzer()
         analyzer.analyze(ast_root)
@@ -126,19 +178,75 @@ def run_semantic_analysis(ast_root):
         sys.exit(1)
 
 
+LEXER_BACKENDS = ("codegen", "dfa", "regex", "mmap", "parallel")
+PARSER_BACKENDS = ("parser2", "fast")
+
+def _print_usage():
+    from ast_analyzer import DEFAULT_MAX_ERRORS
+    from parser2 import DEFAULT_MAX_ATTEMPTS_PER_TOKEN, DEFAULT_MAX_DEPTH, DEFAULT_MAX_NODES
+    print("Penggunaan: python compiler.py <input_file> [--lexer-only] [--lexer=codegen|dfa|regex|mmap|parallel] [--parser=parser2|fast] [--all-errors] [--max-errors=N] [--parse-budget=A,D,N|off]")
+    print("  <input_file>   : file .pas (source code) atau .txt (hasil tokenisasi)")
+    print("  --lexer-only   : hanya melakukan lexical analysis (hanya untuk .pas)")
+    print("  --lexer=B      : backend lexer: codegen (default, kode hasil generate dari DFA),")
+    print("                   dfa (interpreter tabel DFA), regex (master regex),")
+    print("                   mmap (DFA per byte pada file yang di-mmap),")
+    print("                   parallel (chunk per baris di process pool, untuk file besar)")
+    print("  --parser=P     : parser2 (default, backtracking) atau fast (recursive-descent")
+    print("                   dengan lookahead, CST sama; error tetap dilaporkan parser2)")
+    print("  --all-errors   : laporkan semua syntax/semantic error dalam satu kali analisis")
+    print(f"  --max-errors=N : batas jumlah error pada mode --all-errors, N >= 1 (default {DEFAULT_MAX_ERRORS})")
+    print("  --parse-budget=A,D,N : batas parser2: percobaan rule per token, kedalaman parse,")
+    print(f"                   node CST (default {DEFAULT_MAX_ATTEMPTS_PER_TOKEN},{DEFAULT_MAX_DEPTH},{DEFAULT_MAX_NODES}); off = tanpa batas")
+
+def _usage_error(message):
+    print(f"Error: {message}")
+    _print_usage()
+    sys.exit(1)
+
 def main():
     lexer_only = False
+    lexer_backend = "codegen"
+    parser_backend = "parser2"
+    all_errors = False
+    max_errors = None
+    budget_spec = ""
     source_file = None
 
     if len(sys.argv) < 2:
-        print("Penggunaan: python compiler.py <input_file> [--lexer-only]")
-        print("  <input_file> : file .pas (source code) atau .txt (hasil tokenisasi)")
-        print("  --lexer-only : hanya melakukan lexical analysis (hanya untuk .pas)")
+        _print_usage()
         sys.exit(1)
 
     for arg in sys.argv[1:]:
         if arg == "--lexer-only":
             lexer_only = True
+        elif arg.startswith("--lexer="):
+            lexer_backend = arg.split("=", 1)[1]
+            if lexer_backend not in LEXER_BACKENDS:
+                _usage_error(f"backend lexer tidak dikenal: {lexer_backend}")
+        elif arg.startswith("--parser="):
+            parser_backend = arg.split("=", 1)[1]
+            if parser_backend not in PARSER_BACKENDS:
+                _usage_error(f"backend parser tidak dikenal: {parser_backend}")
+        elif arg == "--all-errors":
+            all_errors = True
+        elif arg.startswith("--max-errors="):
+            value = arg.split("=", 1)[1]
+            try:
+                max_errors = int(value)
+            except ValueError:
+                max_errors = 0
+            if max_errors < 1:
+                _usage_error(f"--max-errors harus bilangan bulat >= 1, bukan {value!r}")
+        elif arg.startswith("--parse-budget="):
+            budget_spec = arg.split("=", 1)[1]
+            if budget_spec != "off":
+                from parser2 import ParseBudget
+                try:
+                    ParseBudget.from_spec(budget_spec)
+                except ValueError as e:
+                    _usage_error(str(e))
+        elif arg.startswith("--"):
+            _usage_error(f"opsi tidak dikenal: {arg}")
         elif arg.endswith(".pas") or arg.endswith(".txt"):
             source_file = arg
 
@@ -161,32 +269,64 @@ def main():
         print("Compile dari Source Code (.pas)")
         print()
         dfa = load_dfa_rules()
-        with open(source_file, "r", encoding="utf-8") as f:
-            source_code = f.read()
+        if lexer_backend != "mmap":
+            with open(source_file, "r", encoding="utf-8") as f:
+                source_code = f.read()
 
         _print_stage_header("Lexical Analysis")
-        return_code, raw_tokens = tokenize(source_code, dfa)
+        if lexer_backend == "mmap":
+            from mmap_lexer import tokenize_file
+            return_code, raw_tokens = tokenize_file(source_file, dfa)
+        elif lexer_backend == "codegen":
+            from lexer_codegen import tokenize as codegen_tokenize
+            return_code, raw_tokens = codegen_tokenize(source_code, dfa)
+        elif lexer_backend == "parallel":
+            from parallel_lexer import tokenize_parallel
+            return_code, raw_tokens = tokenize_parallel(source_code, dfa)
+        elif lexer_backend == "regex":
+            from regex_lexer import tokenize as regex_tokenize
+            return_code, raw_tokens = regex_tokenize(source_code, dfa)
+        else:
+            return_code, raw_tokens = tokenize(source_code, dfa)
         
         if return_code == 1:
             print("Error: token tidak valid ditemukan")
+            if lexer_backend == "mmap":
+                with open(source_file, "r", encoding="utf-8") as f:
+                    source_code = f.read()
+            from lexer_recovery import lexical_errors, format_errors
+            errors = lexical_errors(source_code, dfa)
+            for line in format_errors(source_code, errors):
+                print(line)
+            print(f"Ditemukan {len(errors)} lexical error")
             sys.exit(1)
             
         print_tokens(raw_tokens, source_file)
     
-    tokens = [Token(t[0], t[1]) for t in raw_tokens]
     print("-" * 50)
-    print(f"Berhasil memproses {len(tokens)} token")
+    print(f"Berhasil memproses {len(raw_tokens)} token")
 
     if lexer_only:
         print("\nMode: Lexical Analysis Only. Program berhenti.")
         return
 
-    parse_tree_root = run_syntax_analysis(tokens)
+    from parser2 import Token, ParseBudget
+    tokens = [Token(t[0], t[1]) for t in raw_tokens]
+    # rantai tail list (StatementListTailNode, ...) memakan satu frame per elemen,
+    # sehingga program datar yang panjang melewati limit default; kedalaman sarang
+    # tetap dibatasi ParseBudget
+    sys.setrecursionlimit(100000)
+    budget = None if budget_spec == "off" else ParseBudget.from_spec(budget_spec)
+    # dengan budget default, program yang ditolak budget dan parser cepat diparse
+    # ulang tanpa budget agar syntax error aslinya yang dilaporkan (lihat parse_driver.py)
+    strict = bool(budget_spec)
+
+    parse_tree_root = run_syntax_analysis(tokens, all_errors, parser_backend, budget, strict)
     
     ast_root = run_ast_generation(parse_tree_root)
     
     if ast_root:
-        run_semantic_analysis(ast_root)
+        run_semantic_analysis(ast_root, all_errors, max_errors)
 
 
 if __name__ == "__main__":
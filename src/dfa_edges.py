@@ -0,0 +1,66 @@
+# Analisis bentuk DFA dari dfa_rules.json yang dipakai bersama oleh backend
+# lexer hasil generate (regex_lexer.py dan lexer_codegen.py).
+#
+# Tabel transisi ASCII tiap state dihitung dengan lexer.step(), jadi prioritas
+# karakter eksak > kelas > any_not_ sama persis dengan lexer DFA. Hasilnya per
+# state: state tujuan -> CharSet (karakter ASCII yang menuju ke sana, ditambah
+# tanda `other` jika semua karakter non-ASCII juga menuju ke sana lewat
+# any_not_). Bentuk yang tidak bisa dinyatakan dengan himpunan ASCII
+# (transisi non-ASCII) menghasilkan UnsupportedDFA, dan pemanggil kembali ke
+# lexer DFA.
+
+from lexer import step
+
+ASCII = [chr(i) for i in range(128)]
+CLASS_KEYS = ("letter", "digit", "space")
+
+class UnsupportedDFA(Exception):
+    pass
+
+class CharSet:
+    def __init__(self, chars=(), other=False):
+        self.chars = set(chars)
+        self.other = other      # True: juga semua karakter non-ASCII
+
+    def union(self, other):
+        return type(self)(self.chars | other.chars, self.other or other.other)
+
+class EdgeTable:
+    # charset: kelas himpunan karakter yang dibuat edges(); subclass boleh
+    # menggantinya (mis. regex_lexer menambah method regex())
+    charset = CharSet
+
+    def __init__(self, dfa):
+        self.transitions = dfa["transitions"]
+        self.start = dfa["start_state"]
+        self.final_states = dfa["final_states"]
+        self._edges = {}
+
+    def edges(self, state):
+        # state tujuan -> CharSet, berdasarkan lexer.step()
+        if state in self._edges:
+            return self._edges[state]
+        table = self.transitions.get(state, {})
+        for key in table:
+            if len(key) == 1 and not key.isascii():
+                raise UnsupportedDFA(f"transisi non-ASCII di {state}")
+            if key.startswith("any_not_") and not key[len("any_not_"):].isascii():
+                raise UnsupportedDFA(f"any_not_ non-ASCII di {state}")
+
+        groups = {}
+        for c in ASCII:
+            if state == self.start and c.isspace():
+                continue
+            nxt = step(state, c, self.transitions)
+            if nxt:
+                groups.setdefault(nxt, self.charset()).chars.add(c)
+
+        # karakter non-ASCII: kelas (letter/digit/space) tidak bisa dinyatakan
+        # tepat dengan himpunan ASCII, jadi state seperti itu berhenti (scanner gagal)
+        if not any(k in table for k in CLASS_KEYS):
+            for key, target in table.items():
+                if key.startswith("any_not_"):
+                    groups.setdefault(target, self.charset()).other = True
+                    break
+        self._edges[state] = groups
+        return groups
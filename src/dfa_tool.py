@@ -0,0 +1,328 @@
+# Validasi dan minimisasi dfa_rules.json.
+#
+#   python src/dfa_tool.py            # validasi, minimisasi, tulis dfa_rules.min.json, laporan
+#   python src/dfa_tool.py --check    # hanya validasi (exit 1 jika ada error atau tabel
+#                                     # optimasi sudah tidak sesuai dfa_rules.json)
+#
+# Validasi: key duplikat dalam satu state, state tujuan yang tidak didefinisikan,
+# key yang tidak dikenal lexer, karakter yang cocok dengan key eksak sekaligus
+# kelas (letter/digit/space) atau wildcard any_not_* (lexer diam-diam memilih key
+# eksak), lebih dari satu any_not_* di satu state, state yang tidak terjangkau,
+# dan state mati (tidak bisa mencapai state final maupun kembali ke state awal).
+#
+# Minimisasi (Hopcroft) dilakukan atas alfabet kelas karakter: setiap karakter
+# eksak yang disebut di tabel, ditambah satu wakil untuk huruf, digit, spasi,
+# dan karakter lain. Partisi awal membedakan state awal (whitespace dilewati),
+# state komentar (karakter tidak masuk lexeme), dan tipe token state final.
+#
+# Tabel minimal ditulis ke dfa_rules.min.json (key tiap state diurutkan: eksak,
+# kelas, wildcard -- urutan yang sama dengan pemeriksaan lexer.step()).
+# lexer.load_dfa_rules() memakai tabel ini selama source_crc-nya sama dengan
+# CRC32 dfa_rules.json; jika dfa_rules.json diedit, tabel lama diabaikan sampai
+# tool ini dijalankan lagi.
+#
+# Catatan: menjabarkan transisi ASCII menjadi key eksak justru memperlambat lexer
+# DFA (~0.55x), karena step() yang gagal menelusuri semua key untuk mencari
+# any_not_*; jadi tabel tidak dijabarkan.
+
+import json
+import os
+import sys
+import time
+import zlib
+
+from lexer import step, in_comment_state, classify_char, tokenize
+
+CLASS_KEYS = ("letter", "digit", "space")
+SINK = None
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+DFA_PATH = os.path.join(SRC_DIR, "dfa_rules.json")
+MIN_PATH = os.path.join(SRC_DIR, "dfa_rules.min.json")
+
+def _reject_duplicates(pairs, problems):
+    seen = {}
+    for key, value in pairs:
+        if key in seen:
+            problems.append(f"key duplikat {key!r} (nilai terakhir yang dipakai json)")
+        seen[key] = value
+    return seen
+
+def load_raw(path=DFA_PATH):
+    with open(path, "rb") as f:
+        raw = f.read()
+    problems = []
+    dfa = json.loads(raw, object_pairs_hook=lambda pairs: _reject_duplicates(pairs, problems))
+    return raw, dfa, problems
+
+def _is_known_key(key):
+    if len(key) == 1 or key in CLASS_KEYS:
+        return True
+    return key.startswith("any_not_") and len(key) == len("any_not_") + 1
+
+def _targets(table):
+    return set(table.values())
+
+def reachable_states(dfa):
+    start = dfa["start_state"]
+    transitions = dfa["transitions"]
+    seen = {start}
+    stack = [start]
+    while stack:
+        state = stack.pop()
+        for target in _targets(transitions.get(state, {})):
+            if target not in seen:
+                seen.add(target)
+                stack.append(target)
+    return seen
+
+def validate(dfa, problems=()):
+    # (errors, warnings)
+    errors = list(problems)
+    warnings = []
+    start = dfa.get("start_state")
+    transitions = dfa.get("transitions", {})
+    final_states = dfa.get("final_states", {})
+    defined = set(transitions) | set(final_states) | {start}
+
+    if start not in transitions:
+        errors.append(f"state awal {start!r} tidak punya transisi")
+    for state in final_states:
+        if state not in transitions and state not in reachable_states(dfa):
+            errors.append(f"state final {state!r} tidak pernah dipakai")
+
+    for state, table in transitions.items():
+        for key, target in table.items():
+            if not _is_known_key(key):
+                errors.append(f"{state}: key {key!r} tidak dikenal (karakter tunggal, letter/digit/space, any_not_X)")
+            if target not in defined:
+                errors.append(f"{state}: transisi {key!r} ke state tidak terdefinisi {target!r}")
+
+        exact = [k for k in table if len(k) == 1]
+        wildcards = [k for k in table if k.startswith("any_not_")]
+        if len(wildcards) > 1:
+            errors.append(f"{state}: lebih dari satu wildcard {wildcards} (hanya yang pertama berlaku)")
+        for c in exact:
+            cls = classify_char(c)
+            if cls in CLASS_KEYS and cls in table:
+                msg = f"{state}: {c!r} cocok dengan key eksak dan kelas '{cls}'"
+                (warnings if table[c] == table[cls] else errors).append(msg)
+            for w in wildcards:
+                if c != w[len("any_not_"):]:
+                    msg = f"{state}: {c!r} cocok dengan key eksak dan wildcard '{w}'"
+                    (warnings if table[c] == table[w] else errors).append(msg)
+        for w in wildcards:
+            for cls in CLASS_KEYS:
+                if cls in table:
+                    warnings.append(f"{state}: kelas '{cls}' dan wildcard '{w}' tumpang tindih (kelas didahulukan)")
+
+    reachable = reachable_states(dfa)
+    for state in transitions:
+        if state not in reachable:
+            warnings.append(f"state {state!r} tidak terjangkau dari {start!r}")
+
+    # state mati: tidak bisa mencapai state final atau kembali ke state awal
+    alive = set(final_states) | {start}
+    changed = True
+    while changed:
+        changed = False
+        for state, table in transitions.items():
+            if state not in alive and _targets(table) & alive:
+                alive.add(state)
+                changed = True
+    for state in reachable:
+        if state not in alive:
+            errors.append(f"state {state!r} mati: tidak bisa mencapai state final maupun {start!r}")
+    return errors, warnings
+
+def alphabet(dfa):
+    # satu karakter wakil per kelas karakter yang perilakunya identik di semua state
+    exact = set()
+    for table in dfa["transitions"].values():
+        for key in table:
+            if len(key) == 1:
+                exact.add(key)
+            elif key.startswith("any_not_"):
+                exact.add(key[len("any_not_"):])
+    candidates = {
+        "letter": "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_é",
+        "digit": "0123456789٣",
+        "space": " \t\n\r\x0b\x0c ",
+        "other": "!#$%&?@^`|~\"\\\x00§",
+    }
+    symbols = sorted(exact)
+    for cls, chars in candidates.items():
+        rep = next((c for c in chars if c not in exact and (classify_char(c) == cls or
+                    (cls == "other" and classify_char(c) == c))), None)
+        if rep is None:
+            raise ValueError(f"tidak ada karakter wakil untuk kelas {cls}")
+        symbols.append(rep)
+    return symbols
+
+def minimize(dfa):
+    # (dfa minimal, {wakil: [state yang digabung]}, [state tidak terjangkau])
+    start = dfa["start_state"]
+    transitions = dfa["transitions"]
+    final_states = dfa["final_states"]
+    order = [start] + [s for s in transitions if s != start]
+    order += [s for s in final_states if s not in order]
+    reachable = reachable_states(dfa)
+    unreachable = [s for s in order if s not in reachable]
+    states = [s for s in order if s in reachable]
+    symbols = alphabet(dfa)
+
+    delta = {}
+    for s in states + [SINK]:
+        for a in symbols:
+            t = step(s, a, transitions) if s is not SINK else None
+            delta[s, a] = t if t else SINK
+
+    def signature(s):
+        if s is SINK:
+            return ("sink",)
+        return (s == start, in_comment_state(s), final_states.get(s))
+
+    blocks = {}
+    for s in states + [SINK]:
+        blocks.setdefault(signature(s), set()).add(s)
+    partition = list(blocks.values())
+    work = [set(b) for b in partition]
+
+    inverse = {}
+    for (s, a), t in delta.items():
+        inverse.setdefault((t, a), set()).add(s)
+
+    while work:
+        splitter = work.pop()
+        for a in symbols:
+            x = set()
+            for t in splitter:
+                x |= inverse.get((t, a), set())
+            if not x:
+                continue
+            refined = []
+            for block in partition:
+                inside = block & x
+                outside = block - x
+                if inside and outside:
+                    refined += [inside, outside]
+                    if block in work:
+                        work.remove(block)
+                        work += [inside, outside]
+                    else:
+                        work.append(inside if len(inside) <= len(outside) else outside)
+                else:
+                    refined.append(block)
+            partition = refined
+
+    rep = {}
+    groups = {}
+    for block in partition:
+        if SINK in block:
+            if len(block) > 1:
+                raise ValueError(f"state {sorted(block - {SINK})} ekuivalen dengan sink")
+            continue
+        members = [s for s in states if s in block]
+        groups[members[0]] = members
+        for s in members:
+            rep[s] = members[0]
+
+    new_transitions = {}
+    for leader in (s for s in states if rep.get(s) == s):
+        table = transitions.get(leader)
+        if table is not None:
+            new_transitions[leader] = {k: rep[v] for k, v in table.items()}
+    new_final = {s: t for s, t in final_states.items() if rep.get(s) == s}
+
+    minimal = {k: v for k, v in dfa.items() if k not in ("transitions", "final_states")}
+    minimal["final_states"] = new_final
+    minimal["transitions"] = new_transitions
+    return minimal, {k: v for k, v in groups.items() if len(v) > 1}, unreachable
+
+def _key_order(key):
+    if len(key) == 1:
+        return (0, key)
+    if key in CLASS_KEYS:
+        return (1, CLASS_KEYS.index(key))
+    return (2, key)
+
+def optimized_table(raw, dfa):
+    minimal, merged, unreachable = minimize(dfa)
+    table = {"source_crc": f"{zlib.crc32(raw):08x}", "generated_by": "src/dfa_tool.py"}
+    table.update(minimal)
+    table["transitions"] = {state: dict(sorted(keys.items(), key=lambda item: _key_order(item[0])))
+                            for state, keys in minimal["transitions"].items()}
+    return table, minimal, merged, unreachable
+
+def _throughput(source, dfa, repeat=5):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        tokenize(source, dfa)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return len(source) / best
+
+def _test_sources():
+    root = os.path.dirname(SRC_DIR)
+    sources = []
+    for dirpath, _, files in os.walk(os.path.join(root, "test")):
+        for name in sorted(files):
+            if name.endswith(".pas"):
+                with open(os.path.join(dirpath, name), encoding="utf-8") as f:
+                    sources.append(f.read())
+    return sources
+
+def main():
+    check_only = "--check" in sys.argv
+    raw, dfa, problems = load_raw()
+    errors, warnings = validate(dfa, problems)
+    for w in warnings:
+        print(f"Peringatan: {w}")
+    for e in errors:
+        print(f"Error: {e}")
+    if errors:
+        sys.exit(1)
+    print(f"dfa_rules.json valid ({len(dfa['transitions'])} state bertransisi, {len(dfa['final_states'])} state final)")
+
+    table, minimal, merged, unreachable = optimized_table(raw, dfa)
+    if check_only:
+        try:
+            with open(MIN_PATH, encoding="utf-8") as f:
+                current = json.load(f)
+        except OSError:
+            current = None
+        if current != table:
+            print("dfa_rules.min.json tidak sesuai dfa_rules.json: jalankan python src/dfa_tool.py")
+            sys.exit(1)
+        print("dfa_rules.min.json sesuai")
+        return
+
+    before = len(reachable_states(dfa) | set(dfa["transitions"]))
+    after = len(reachable_states(minimal))
+    print(f"\nJumlah state: {before} -> {after}")
+    for state in unreachable:
+        print(f"  dihapus (tidak terjangkau): {state}")
+    for leader, members in merged.items():
+        print(f"  digabung ke {leader}: {', '.join(members[1:])}")
+
+    with open(MIN_PATH, "w", encoding="utf-8") as f:
+        json.dump(table, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    print(f"Tabel optimasi ditulis ke {os.path.relpath(MIN_PATH)}")
+
+    sources = _test_sources()
+    for source in sources:
+        if tokenize(source, dfa) != tokenize(source, table):
+            print("Error: hasil tokenisasi tabel optimasi berbeda dari dfa_rules.json")
+            sys.exit(1)
+    # throughput hanya pada file yang lolos lexer (file dengan error berhenti di awal)
+    source = "\n".join(s for s in sources if tokenize(s, dfa)[0] == 0) * 5
+    rate_before = _throughput(source, dfa)
+    rate_after = _throughput(source, table)
+    print(f"\nLexer DFA, {len(sources)} file test dengan token identik; throughput pada {len(source)} karakter:")
+    print(f"  dfa_rules.json     : {rate_before / 1e6:.2f} Mchar/s")
+    print(f"  dfa_rules.min.json : {rate_after / 1e6:.2f} Mchar/s ({rate_after / rate_before:.2f}x)")
+
+if __name__ == "__main__":
+    main()
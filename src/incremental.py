@@ -0,0 +1,282 @@
+# Kompilasi inkremental untuk integrasi editor.
+#
+#   session = IncrementalCompiler(source)
+#   session.update(new_source)              # atau session.apply_edit(start, end, text)
+#   session.errors, session.last_mode
+#
+# Setelah kompilasi penuh pertama, file dipecah pada batas SubprogramDeclarationNode
+# tingkat atas (prosedur/fungsi milik program utama). Edit yang seluruhnya berada di
+# dalam satu subprogram hanya me-lex dan me-parse ulang subprogram itu, lalu:
+#
+#   "body"      -> header (nama, parameter, tipe kembalian) tidak berubah: semantic
+#                  analyzer hanya dijalankan ulang untuk blok btab subprogram tsb
+#   "signature" -> header berubah: pemanggil di scope lain ikut terpengaruh, jadi
+#                  semantic analysis dijalankan ulang penuh (tanpa parse ulang)
+#   "full"      -> edit di luar subprogram, lintas subprogram, atau file sebelumnya
+#                  tidak valid: lex/parse/analisis ulang seluruh file
+
+from lexer import load_dfa_rules
+from lexer_codegen import tokenize
+from parser2 import SubprogramDeclarationNode, BlockNode, Token, parse_tokens
+from ast_transformer import ASTTransformer
+from ast_analyzer import SemanticAnalyzer, SemanticError, TooManyErrors, DEFAULT_MAX_ERRORS, T_NOTYPE
+
+_CHUNK = 4096
+
+def _common_prefix(a, b, limit):
+    i = 0
+    while i + _CHUNK <= limit and a[i:i + _CHUNK] == b[i:i + _CHUNK]:
+        i += _CHUNK
+    while i < limit and a[i] == b[i]:
+        i += 1
+    return i
+
+def _common_suffix(a, b, limit):
+    n, m = len(a), len(b)
+    i = 0
+    while i + _CHUNK <= limit and a[n - i - _CHUNK:n - i] == b[m - i - _CHUNK:m - i]:
+        i += _CHUNK
+    while i < limit and a[n - i - 1] == b[m - i - 1]:
+        i += 1
+    return i
+
+def _leaves(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Token):
+            yield node
+        else:
+            stack.extend(reversed(node.children))
+
+def _count_tokens(node):
+    return sum(1 for _ in _leaves(node))
+
+def _header(decl):
+    # token sebelum BlockNode: kata kunci, nama, parameter, tipe kembalian
+    header = []
+    for child in decl.children[0].children:
+        if isinstance(child, BlockNode):
+            break
+        header.extend((t.tipe, t.nilai) for t in _leaves(child))
+    return tuple(header)
+
+class _Region:
+    def __init__(self, start, end, tok_start, tok_count, header, cst_section, ast_section):
+        self.start = start              # offset karakter token pertama
+        self.end = end                  # offset setelah ';' penutup
+        self.tok_start = tok_start
+        self.tok_count = tok_count
+        self.header = header
+        self.cst_section = cst_section  # parser2.SubprogramSectionNode, children[0] = deklarasi
+        self.ast_section = ast_section  # ast_nodes.SubprogramSectionNode
+        self.tab_idx = None             # entry tab subprogram (None: gagal dideklarasikan)
+        self.err_start = 0              # rentang error subprogram di analyzer.errors
+        self.err_end = 0
+        self.rows = 0                   # jumlah baris tab yang dibuat saat analisis
+
+class _ScopeTrackingAnalyzer(SemanticAnalyzer):
+    def __init__(self, max_errors):
+        super().__init__(collect_errors=True, max_errors=max_errors)
+        self.scopes = []
+        # tab subprogram -> btab bloknya; setelah analisis ulang menunjuk blok baru
+        self.subprogram_blocks = {}
+
+    def _analyze_subprogram(self, node, subprog_idx):
+        self.subprogram_blocks[subprog_idx] = len(self.btab)
+        super()._analyze_subprogram(node, subprog_idx)
+
+    def visit_SubprogramSectionNode(self, node):
+        decl = node.subprogram_declaration
+        if self.level != 1 or decl is None:
+            return super().visit_SubprogramSectionNode(node)
+        tab_idx, err_start = len(self.tab), len(self.errors)
+        self._recover(self.analyze, decl)
+        entered = (tab_idx < len(self.tab) and self.tab[tab_idx].lev == 1
+                   and self.tab[tab_idx].name == decl.identifier)
+        self.scopes.append((tab_idx if entered else None, err_start, len(self.errors), len(self.tab) - tab_idx))
+        self.analyze(node.next_section)
+        return T_NOTYPE
+
+    def reanalyze_subprogram(self, decl, tab_idx):
+        # scope dibuat sama seperti saat deklarasi: blok program berakhir di
+        # entry subprogram ini (subprogram sesudahnya belum terlihat)
+        program_block = self.btab[self.display[1]]
+        saved_last = program_block.last
+        self.tab.signatures.pop(tab_idx, None)
+        err_start, rows = len(self.errors), len(self.tab)
+        program_block.last = tab_idx
+        self.level = 1
+        try:
+            self._recover(lambda node: self._analyze_subprogram(node, tab_idx), decl)
+        finally:
+            program_block.last = saved_last
+            self.level = 0
+        new_errors = self.errors[err_start:]
+        del self.errors[err_start:]
+        return new_errors, len(self.tab) - rows
+
+class IncrementalCompiler:
+    def __init__(self, source, dfa=None, max_errors=DEFAULT_MAX_ERRORS):
+        self.dfa = dfa if dfa is not None else load_dfa_rules()
+        self.max_errors = max_errors
+        self.last_mode = None
+        self._full(source)
+
+    @property
+    def ok(self):
+        return not self.lexical_error and self.syntax_error is None and not self.errors
+
+    @property
+    def errors(self):
+        return self.analyzer.errors if self.analyzer else []
+
+    def update(self, new_source):
+        old = self.source
+        limit = min(len(old), len(new_source))
+        a = _common_prefix(old, new_source, limit)
+        suffix = _common_suffix(old, new_source, limit - a)
+        return self._apply(a, len(old) - suffix, new_source[a:len(new_source) - suffix], new_source)
+
+    def apply_edit(self, start, end, text):
+        return self._apply(start, end, text, self.source[:start] + text + self.source[end:])
+
+    def _apply(self, a, b, text, new_source):
+        region = self._region_of(a, b)
+        if region is None:
+            return self._full(new_source)
+
+        delta = len(text) - (b - a)
+        region_text = new_source[region.start:region.end + delta]
+        positions = []
+        code, raw = tokenize(region_text, self.dfa, positions)
+        # region harus berakhir tepat setelah ';' (lexer kembali ke state awal)
+        if code != 0 or not raw or raw[-1][0] != "SEMICOLON" or region_text[positions[-1] + 1:].strip():
+            return self._full(new_source)
+
+        tokens = [Token(t, v) for t, v in raw]
+        decl = SubprogramDeclarationNode()
+        success, end_idx = decl.parse(tokens, 0)
+        if not success or end_idx != len(tokens):
+            return self._full(new_source)
+
+        # splice token, parse tree, dan AST
+        self.source = new_source
+        self.tokens[region.tok_start:region.tok_start + region.tok_count] = tokens
+        tok_delta = len(tokens) - region.tok_count
+        following = self.regions[self.regions.index(region) + 1:]
+        for r in following:
+            r.start += delta
+            r.end += delta
+            r.tok_start += tok_delta
+        region.start, region.end = region.start + positions[0], region.start + positions[-1] + 1
+        region.tok_count = len(tokens)
+        region.cst_section.children[0] = decl
+        region.ast_section.subprogram_declaration = ASTTransformer().transform(decl)
+
+        header = _header(decl)
+        if header != region.header or region.tab_idx is None:
+            region.header = header
+            self._analyze()
+            self.last_mode = "signature"
+            return self
+
+        self._reanalyze(region, following)
+        self.last_mode = "body"
+        return self
+
+    def _region_of(self, a, b):
+        for region in self.regions:
+            if region.start <= a and b <= region.end:
+                return region
+        return None
+
+    def _full(self, source):
+        self.source = source
+        self.tokens = []
+        self.parse_tree = None
+        self.ast = None
+        self.analyzer = None
+        self.regions = []
+        self.lexical_error = False
+        self.syntax_error = None
+        self.last_mode = "full"
+
+        positions = []
+        code, raw = tokenize(source, self.dfa, positions)
+        if code != 0:
+            self.lexical_error = True
+            return self
+        self.tokens = [Token(t, v) for t, v in raw]
+
+        root, success, end_idx, error_ctx = parse_tokens(self.tokens)
+        if not success:
+            self.syntax_error = (error_ctx.max_index, error_ctx.expected, error_ctx.found, error_ctx.rule_name)
+            return self
+        if end_idx != len(self.tokens):
+            self.syntax_error = (end_idx, "EOF", self.tokens[end_idx], "ProgramNode")
+            return self
+
+        self.parse_tree = root
+        self.ast = ASTTransformer().transform(root)
+
+        # pecah file pada batas subprogram tingkat atas
+        decl_part = root.children[1]
+        tok_idx = _count_tokens(root.children[0]) + sum(_count_tokens(c) for c in decl_part.children[:3])
+        cst_section = decl_part.children[3]
+        ast_section = self.ast.declaration_part.subprogram_section
+        while cst_section.children:
+            decl = cst_section.children[0]
+            count = _count_tokens(decl)
+            self.regions.append(_Region(positions[tok_idx], positions[tok_idx + count - 1] + 1,
+                                        tok_idx, count, _header(decl), cst_section, ast_section))
+            tok_idx += count
+            cst_section = cst_section.children[1]
+            ast_section = ast_section.next_section
+
+        self._analyze()
+        return self
+
+    def _analyze(self):
+        self.analyzer = _ScopeTrackingAnalyzer(self.max_errors)
+        self.dead_rows = 0
+        try:
+            self.analyzer.analyze(self.ast)
+        except (SemanticError, TooManyErrors):
+            pass
+        scopes = self.analyzer.scopes
+        if len(scopes) != len(self.regions):
+            # batas error tercapai di tengah jalan: tidak ada info scope yang lengkap
+            for region in self.regions:
+                region.tab_idx = None
+            return
+        for region, (tab_idx, err_start, err_end, rows) in zip(self.regions, scopes):
+            region.tab_idx = tab_idx
+            region.err_start = err_start
+            region.err_end = err_end
+            region.rows = rows
+
+    def _reanalyze(self, region, following):
+        analyzer = self.analyzer
+        decl = region.ast_section.subprogram_declaration
+        try:
+            new_errors, rows = analyzer.reanalyze_subprogram(decl, region.tab_idx)
+        except TooManyErrors:
+            self._analyze()
+            return
+
+        # baris tab blok lama tidak lagi terjangkau; analisis penuh jika sudah terlalu banyak
+        self.dead_rows += region.rows
+        region.rows = rows
+        if self.dead_rows > len(analyzer.tab) // 2:
+            self._analyze()
+            return
+
+        err_delta = len(new_errors) - (region.err_end - region.err_start)
+        analyzer.errors[region.err_start:region.err_end] = new_errors
+        region.err_end = region.err_start + len(new_errors)
+        for r in following:
+            r.err_start += err_delta
+            r.err_end += err_delta
+        if len(analyzer.errors) >= self.max_errors:
+            self._analyze()
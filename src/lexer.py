@@ -1,11 +1,53 @@
-import json
+import marshal
 import os
+import zlib
+
+# Snapshot DFA: hasil parse dfa_rules.json disimpan sebagai file marshal di
+# __pycache__. Nama file memuat CRC32 isi JSON, jadi snapshot otomatis dibuat
+# ulang setiap kali dfa_rules.json berubah, dan modul json (beserta re/enum)
+# tidak perlu di-import pada start-up.
+#
+# Jika ada dfa_rules.min.json (tabel minimal hasil src/dfa_tool.py) yang
+# source_crc-nya cocok dengan dfa_rules.json, tabel itulah yang dipakai.
+
+def _dfa_snapshot_path(current_dir, raw, min_raw):
+    crc = zlib.crc32(min_raw, zlib.crc32(raw))
+    return os.path.join(current_dir, "__pycache__", f"dfa_rules.{crc:08x}.marshal")
 
 def load_dfa_rules():
     current_dir = os.path.dirname(__file__)
     dfa_path = os.path.join(current_dir, "dfa_rules.json")
-    with open(dfa_path, "r") as f:
-        return json.load(f)
+    with open(dfa_path, "rb") as f:
+        raw = f.read()
+    try:
+        with open(os.path.join(current_dir, "dfa_rules.min.json"), "rb") as f:
+            min_raw = f.read()
+    except OSError:
+        min_raw = b""
+
+    snapshot_path = _dfa_snapshot_path(current_dir, raw, min_raw)
+    try:
+        with open(snapshot_path, "rb") as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    import json
+    dfa = json.loads(raw)
+    if min_raw:
+        optimized = json.loads(min_raw)
+        if optimized.get("source_crc") == f"{zlib.crc32(raw):08x}":
+            dfa = optimized
+    try:
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            marshal.dump(dfa, f)
+        os.replace(tmp_path, snapshot_path)
+    except OSError:
+        # direktori tidak bisa ditulis: tetap jalan tanpa snapshot
+        pass
+    return dfa
 
 def classify_char(c):
     if c.isalpha() or c == '_':
@@ -34,26 +76,27 @@ def step(current_state, c, transitions):
                 return v
     return None
 
-def finalize_identifier(token_type, word, keywords, logical_ops, arith_keywords):
-    wl = word.lower()
-    if wl in keywords:
-        return "KEYWORD"
-    if wl in logical_ops:
-        return "LOGICAL_OPERATOR"
-    if wl in arith_keywords:
-        return "ARITHMETIC_OPERATOR"
-    return token_type
+def keyword_table(dfa):
+    # satu tabel lexeme (huruf kecil) -> tipe token untuk keyword, operator logika,
+    # dan operator aritmetika kata; prioritas keyword > logika > aritmetika (entry
+    # yang ditulis terakhir menang), jadi satu lookup dict menggantikan tiga set
+    table = {}
+    for key, token_type in (("arithmetic_keywords", "ARITHMETIC_OPERATOR"),
+                            ("logical_operators", "LOGICAL_OPERATOR"),
+                            ("keywords", "KEYWORD")):
+        for word in dfa.get(key, []):
+            table[word] = token_type
+    return table
 
 def in_comment_state(s):
     return s.startswith("S_COMMENT")
 
-def tokenize(source_code, dfa):
+def tokenize(source_code, dfa, positions=None):
+    # positions (opsional): diisi offset karakter awal tiap token
     start_state = dfa["start_state"]
     final_states = dfa["final_states"]
     transitions = dfa["transitions"]
-    keywords = set(dfa.get("keywords", []))
-    logical_ops = set(dfa.get("logical_operators", []))
-    arith_keywords = set(dfa.get("arithmetic_keywords", []))
+    special = keyword_table(dfa)
 
     tokens = []
     state = start_state
@@ -72,13 +115,15 @@ def tokenize(source_code, dfa):
                 state = nxt
                 i += 1
                 continue
+            if positions is not None and not current_token:
+                positions.append(i)
             current_token += c
             state = nxt
             i += 1
             continue
         if state in final_states:
             lexeme = current_token 
-            token_type = finalize_identifier(final_states[state] ,lexeme, keywords, logical_ops, arith_keywords)
+            token_type = special.get(lexeme.lower(), final_states[state])
             tokens.append((token_type, lexeme))
             current_token = ""
             state = start_state
@@ -89,7 +134,7 @@ def tokenize(source_code, dfa):
         # flush last token
         if state in final_states:
             lexeme = current_token
-            token_type = finalize_identifier(final_states[state], lexeme, keywords, logical_ops, arith_keywords)
+            token_type = special.get(lexeme.lower(), final_states[state])
             tokens.append((token_type, lexeme))
         else:
             return (1,None)
@@ -0,0 +1,325 @@
+# Generator lexer Python khusus dari dfa_rules.json.
+#
+# Transisi DFA tidak diinterpretasi saat runtime: setiap state dijadikan kode
+# lurus (if bersarang per karakter, loop while untuk self-loop dengan himpunan
+# karakter frozenset, str.find untuk badan komentar/string), lexeme diambil
+# dengan slicing, dan klasifikasi keyword memakai satu dict. Analisis bentuk DFA
+# (tabel transisi ASCII via lexer.step, cincin komentar, pasangan state string)
+# sama dengan regex_lexer.py; tabel transisinya dari dfa_edges.py.
+#
+# Kode hasil generate disimpan di __pycache__ sebagai dfa_lexer.<key>.py beserta
+# code object marshal-nya; key adalah CRC32 isi DFA, source generator, dan magic
+# number bytecode interpreter, jadi modul dibuat ulang otomatis setiap kali
+# dfa_rules.json atau generator berubah, dan code object tidak pernah dimuat oleh
+# versi Python lain (format marshal code object berbeda antar versi).
+#
+# Seperti regex_lexer, kode hasil generate hanya menangani jalur sukses untuk
+# teks ASCII di luar komentar/string; kasus lain (token tidak valid, komentar
+# atau string tidak tertutup, karakter non-ASCII) di-lex ulang dengan DFA.
+#
+#   python src/lexer_codegen.py [-o file.py]     # cetak / simpan kode hasil generate
+
+import importlib.util
+import marshal
+import os
+import sys
+import zlib
+
+from lexer import load_dfa_rules, step, keyword_table, tokenize as dfa_tokenize
+from dfa_edges import ASCII, EdgeTable, UnsupportedDFA
+
+_SOURCES = ("lexer_codegen.py", "dfa_edges.py")
+
+class _Generator:
+    def __init__(self, dfa):
+        self.builder = EdgeTable(dfa)
+        self.ascii = ASCII
+        self.start = dfa["start_state"]
+        self.final_states = dfa["final_states"]
+        self.transitions = dfa["transitions"]
+        self.special = keyword_table(dfa)
+        self.keyword_states = self._keyword_states()
+        self.constants = {}
+
+    def _keyword_states(self):
+        # state final tempat keyword (dalam huruf apa pun) bisa berakhir
+        states = set()
+        for word in self.special:
+            for variant in (word, word.upper(), word.capitalize()):
+                state = self.start
+                for c in variant:
+                    state = step(state, c, self.transitions)
+                    if not state:
+                        break
+                if state in self.final_states:
+                    states.add(state)
+        return states
+
+    def charset(self, chars):
+        key = frozenset(chars)
+        if key not in self.constants:
+            self.constants[key] = f"SET{len(self.constants)}"
+        return self.constants[key]
+
+    def test(self, cs, var):
+        # ekspresi Python: apakah karakter `var` termasuk CharSet cs
+        if cs.other:
+            rest = [c for c in self.ascii if c not in cs.chars]
+            if len(rest) == 1:
+                return f"{var} != {rest[0]!r}"
+            return f"{var} not in {self.charset(rest)}"
+        if len(cs.chars) == 1:
+            return f"{var} == {next(iter(cs.chars))!r}"
+        return f"{var} in {self.charset(cs.chars)}"
+
+    def run(self, cs, ind):
+        # majukan j selama src[j] anggota cs
+        return [f"{ind}while j < n and {self.test(cs, 'src[j]')}:",
+                f"{ind}    j += 1"]
+
+    def run_to_exit(self, loop, exit_set, ind):
+        # loop lalu konsumsi satu karakter exit_set; gagal (None) jika input habis
+        # atau karakter berikutnya bukan anggota keduanya
+        if loop is not None and loop.other and not exit_set.other and len(exit_set.chars) == 1:
+            rest = [c for c in self.ascii if c not in loop.chars]
+            if rest == list(exit_set.chars):
+                return [f"{ind}j = src.find({rest[0]!r}, j)",
+                        f"{ind}if j < 0:",
+                        f"{ind}    return None",
+                        f"{ind}j += 1"]
+        out = self.run(loop, ind) if loop else []
+        return out + [f"{ind}if j >= n or not ({self.test(exit_set, 'src[j]')}):",
+                      f"{ind}    return None",
+                      f"{ind}j += 1"]
+
+    def covers(self, a, b):
+        # a dan b bersama-sama mencakup semua karakter
+        return (a.other or b.other) and all(c in a.chars or c in b.chars for c in self.ascii)
+
+    def emit(self, state, ind):
+        token_type = self.final_states[state]
+        classify = f"SPECIAL.get(lexeme.lower(), {token_type!r})"
+        plain = classify if state in self.keyword_states else repr(token_type)
+        return [
+            f"{ind}lexeme = src[start:j]",
+            f"{ind}if carry:",
+            f"{ind}    lexeme = carry + lexeme",
+            f"{ind}    carry = ''",
+            f"{ind}    if positions is not None:",
+            f"{ind}        positions.append(carry_pos)",
+            f"{ind}    append(({classify}, lexeme))",
+            f"{ind}else:",
+            f"{ind}    if positions is not None:",
+            f"{ind}        positions.append(start)",
+            f"{ind}    append(({plain}, lexeme))",
+            f"{ind}i = j",
+            f"{ind}continue",
+        ]
+
+    def ring(self, entry, ind):
+        # badan komentar dari state `entry` sampai kembali ke state awal
+        edges = dict(self.builder.edges(entry))
+        loop = edges.pop(entry, None)
+        if len(edges) != 1:
+            raise UnsupportedDFA(f"bentuk komentar {entry}")
+        (target, exit_set), = edges.items()
+        body = self.run_to_exit(loop, exit_set, ind + "    ")
+        if target == self.start:
+            return [f"{ind}while True:"] + body + [f"{ind}    break"]
+
+        wait = dict(self.builder.edges(target))
+        close = wait.pop(self.start, None)
+        back = wait.pop(entry, None)
+        if close is None or wait:
+            raise UnsupportedDFA(f"bentuk komentar {target}")
+        body += [f"{ind}    if j >= n:",
+                 f"{ind}        return None",
+                 f"{ind}    c = src[j]",
+                 f"{ind}    j += 1",
+                 f"{ind}    if {self.test(close, 'c')}:",
+                 f"{ind}        break"]
+        if back is None:
+            body += [f"{ind}    return None"]
+        elif not self.covers(close, back):
+            body += [f"{ind}    if not ({self.test(back, 'c')}):",
+                     f"{ind}        return None"]
+        return [f"{ind}while True:"] + body
+
+    def quoted(self, inner, closing, exit_set, back, ind):
+        # string: state `inner` <-> `closing` (mis. '...' dengan '' sebagai escape)
+        edges = dict(self.builder.edges(inner))
+        loop = edges.pop(inner, None)
+        if set(edges) != {closing} or set(self.builder.edges(closing)) != {inner} \
+                or closing not in self.final_states or inner in self.final_states:
+            raise UnsupportedDFA(f"bentuk string {inner}")
+        body = self.run_to_exit(loop, exit_set, ind + "    ")
+        body += [f"{ind}    if j < n and {self.test(back, 'src[j]')}:",
+                 f"{ind}        j += 1",
+                 f"{ind}        continue",
+                 f"{ind}    break"]
+        return [f"{ind}while True:"] + body + self.emit(closing, ind)
+
+    def state(self, state, ind, visited):
+        # prasyarat: src[start:j] sudah dikonsumsi dan DFA berada di `state`
+        from lexer import in_comment_state
+        if state in visited:
+            raise UnsupportedDFA(f"siklus di {state}")
+        visited = visited | {state}
+        edges = dict(self.builder.edges(state))
+        loop = edges.pop(state, None)
+
+        for target in edges:
+            back = self.builder.edges(target).get(state)
+            if back is not None and not in_comment_state(target):
+                return self.quoted(state, target, edges[target], back, ind)
+
+        out = self.run(loop, ind) if loop else []
+        if edges:
+            out += [f"{ind}if j < n:", f"{ind}    c = src[j]"]
+            for target, cs in edges.items():
+                out.append(f"{ind}    if {self.test(cs, 'c')}:")
+                inner = ind + "        "
+                if target == self.start:
+                    raise UnsupportedDFA(f"{state} kembali ke state awal")
+                if in_comment_state(target):
+                    # karakter token sebelum komentar tetap di current_token lexer DFA
+                    out += [f"{inner}if not carry:",
+                            f"{inner}    carry_pos = start",
+                            f"{inner}carry += src[start:j]",
+                            f"{inner}j += 1"]
+                    out += self.ring(target, inner)
+                    out += [f"{inner}i = j", f"{inner}continue"]
+                else:
+                    out.append(f"{inner}j += 1")
+                    out += self.state(target, inner, visited)
+        if state in self.final_states:
+            out += self.emit(state, ind)
+        else:
+            out.append(f"{ind}return None")
+        return out
+
+    def generate(self):
+        from lexer import in_comment_state
+        space = [c for c in self.ascii if c.isspace()]
+        edges = self.builder.edges(self.start)
+        # kelas besar (huruf, digit) paling sering muncul: dicek lebih dulu
+        order = sorted(edges.items(), key=lambda item: (-len(item[1].chars), sorted(item[1].chars)))
+
+        body = []
+        ind = "        "
+        for target, cs in order:
+            body.append(f"{ind}if {self.test(cs, 'c')}:")
+            if in_comment_state(target):
+                body += self.ring(target, ind + "    ")
+                body += [f"{ind}    i = j", f"{ind}    continue"]
+            else:
+                body += self.state(target, ind + "    ", frozenset([self.start]))
+
+        space_name = self.charset(space)
+        lines = [
+            "# Dihasilkan oleh lexer_codegen.py dari dfa_rules.json -- jangan diedit.",
+            "",
+            f"SPECIAL = {self.special!r}",
+        ]
+        lines += [f"{name} = frozenset({''.join(sorted(chars))!r})"
+                  for chars, name in self.constants.items()]
+        lines.append(f"SPACE = {space_name}")
+        lines += [
+            "",
+            "def tokenize(src, positions=None):",
+            "    # daftar token, atau None jika input harus diserahkan ke lexer DFA",
+            "    tokens = []",
+            "    append = tokens.append",
+            "    n = len(src)",
+            "    i = 0",
+            "    carry = ''",
+            "    carry_pos = 0",
+            "    while i < n:",
+            "        c = src[i]",
+            "        if c in SPACE:",
+            "            i += 1",
+            "            continue",
+            "        start = i",
+            "        j = i + 1",
+        ]
+        lines += body
+        lines += [
+            "        return None",
+            "    if carry:",
+            "        return None",
+            "    return tokens",
+            "",
+        ]
+        return "\n".join(lines)
+
+def generate_source(dfa):
+    return _Generator(dfa).generate()
+
+def _cache_key(dfa):
+    crc = zlib.crc32(importlib.util.MAGIC_NUMBER)
+    crc = zlib.crc32(marshal.dumps(dfa), crc)
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in _SOURCES:
+        with open(os.path.join(current_dir, name), "rb") as f:
+            crc = zlib.crc32(f.read(), crc)
+    return f"{crc:08x}"
+
+def load_generated(dfa):
+    # fungsi tokenize hasil generate untuk dfa ini, atau None jika bentuk DFA
+    # tidak didukung generator
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    base = os.path.join(current_dir, "__pycache__", f"dfa_lexer.{_cache_key(dfa)}")
+    try:
+        with open(base + ".marshal", "rb") as f:
+            code = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        try:
+            source = generate_source(dfa)
+        except UnsupportedDFA:
+            return None
+        code = compile(source, base + ".py", "exec")
+        try:
+            os.makedirs(os.path.dirname(base), exist_ok=True)
+            for path, data in ((base + ".py", source.encode("utf-8")), (base + ".marshal", marshal.dumps(code))):
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+        except OSError:
+            # direktori tidak bisa ditulis: tetap jalan tanpa cache
+            pass
+    namespace = {"__name__": "dfa_lexer"}
+    exec(code, namespace)
+    return namespace["tokenize"]
+
+_cache = (None, None)
+
+def get_tokenizer(dfa):
+    global _cache
+    if _cache[0] is not dfa:
+        _cache = (dfa, load_generated(dfa))
+    return _cache[1]
+
+def tokenize(source_code, dfa, positions=None):
+    # antarmuka sama dengan lexer.tokenize: (0, tokens) atau (1, None)
+    generated = get_tokenizer(dfa)
+    if generated is not None:
+        mark = len(positions) if positions is not None else 0
+        tokens = generated(source_code, positions)
+        if tokens is not None:
+            return (0, tokens)
+        if positions is not None:
+            del positions[mark:]
+    return dfa_tokenize(source_code, dfa, positions)
+
+def main():
+    source = generate_source(load_dfa_rules())
+    if len(sys.argv) > 2 and sys.argv[1] == "-o":
+        with open(sys.argv[2], "w", encoding="utf-8") as f:
+            f.write(source)
+        print(f"Lexer hasil generate ditulis ke {sys.argv[2]}")
+    else:
+        sys.stdout.write(source)
+
+if __name__ == "__main__":
+    main()
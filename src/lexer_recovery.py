@@ -0,0 +1,175 @@
+# Lexing toleran error: setiap potongan tidak valid menjadi token ERROR dengan
+# offset-nya, lexer kembali ke state awal, dan lexing berlanjut, sehingga semua
+# lexical error dilaporkan dalam satu kali jalan.
+#
+# Aturan resinkronisasi (di atas DFA yang sama dengan lexer.tokenize):
+#   - macet di state non-final dengan current_token tidak kosong (mis. carry '('
+#     dari '(*' diikuti karakter tidak valid): current_token menjadi ERROR di
+#     offset awal token, lalu karakter yang sama diproses lagi dari state awal;
+#   - macet di state awal: karakter itu beserta karakter berikutnya yang juga
+#     tidak bisa memulai token (bukan whitespace) menjadi satu ERROR;
+#   - EOF di state non-final (string tidak tertutup, '(*' tidak tertutup):
+#     current_token menjadi ERROR.
+# Untuk input tanpa error hasilnya sama persis dengan tokenize().
+#
+# Kecepatan: input dicoba dulu dengan fungsi hasil generate lexer_codegen (tanpa
+# fallback ke DFA). Jika gagal, input dipotong menjadi chunk yang berakhir
+# setelah '\n' atau spasi (lihat parallel_lexer.lex_chunk); chunk yang bersih tetap di-lex dengan kode hasil
+# generate, dan hanya chunk yang gagal (error, atau karakter non-ASCII yang
+# memang hanya ditangani DFA) yang di-lex dengan DFA toleran di bawah ini
+# sampai lexer kembali ke state awal.
+#
+#   python src/lexer_recovery.py <file.pas>     # daftar semua lexical error
+
+import sys
+
+from lexer import load_dfa_rules, step, in_comment_state, keyword_table
+from lexer_codegen import get_tokenizer
+from parallel_lexer import lex_chunk, _sentinel_is_sound
+
+ERROR = "ERROR"
+CHUNK_CHARS = 1024
+SEPARATORS = "\n "
+
+def _recover(source, i, stop, dfa, tokens, positions):
+    # DFA toleran dari offset i (state awal, token kosong) sampai state awal
+    # bersih pertama setelah token ERROR atau di offset >= stop; mengembalikan
+    # offset tersebut
+    start_state = dfa["start_state"]
+    final_states = dfa["final_states"]
+    transitions = dfa["transitions"]
+    special = keyword_table(dfa)
+
+    state = start_state
+    current_token = ""
+    token_start = i
+    n = len(source)
+    recovered = False
+
+    while i < n:
+        if (i >= stop or recovered) and state == start_state and not current_token:
+            return i
+        c = source[i]
+        if state == start_state and c.isspace():
+            i += 1
+            continue
+        nxt = step(state, c, transitions)
+        if nxt:
+            if in_comment_state(state) or in_comment_state(nxt):
+                state = nxt
+                i += 1
+                continue
+            if not current_token:
+                token_start = i
+            current_token += c
+            state = nxt
+            i += 1
+            continue
+        if state in final_states:
+            tokens.append((special.get(current_token.lower(), final_states[state]), current_token))
+        elif current_token:
+            tokens.append((ERROR, current_token))
+            recovered = True
+        else:
+            j = i + 1
+            while j < n and not source[j].isspace() and not step(start_state, source[j], transitions):
+                j += 1
+            tokens.append((ERROR, source[i:j]))
+            recovered = True
+            token_start = i
+            i = j
+        if positions is not None:
+            positions.append(token_start)
+        current_token = ""
+        state = start_state
+
+    if current_token:
+        if state in final_states:
+            token_type = special.get(current_token.lower(), final_states[state])
+        else:
+            token_type = ERROR
+        tokens.append((token_type, current_token))
+        if positions is not None:
+            positions.append(token_start)
+    return n
+
+def _generated_only(source_code, dfa, positions):
+    # antarmuka lexer.tokenize, tetapi gagal langsung tanpa lexing ulang dengan DFA
+    mark = len(positions)
+    tokens = get_tokenizer(dfa)(source_code, positions)
+    if tokens is None:
+        del positions[mark:]
+        return (1, None)
+    return (0, tokens)
+
+def _tokenize_chunks(source_code, dfa, positions, chunk_chars):
+    tokens = []
+    n = len(source_code)
+    sound = get_tokenizer(dfa) is not None and _sentinel_is_sound(dfa, SEPARATORS)
+    i = 0
+    while i < n:
+        if not sound:
+            _recover(source_code, i, n, dfa, tokens, positions)
+            break
+        end = n
+        for sep in SEPARATORS:
+            cut = source_code.find(sep, i + chunk_chars - 1, end)
+            if cut >= 0:
+                end = cut + 1
+        clean, chunk_tokens, chunk_positions = lex_chunk(source_code[i:end], dfa, end == n, _generated_only)
+        if clean:
+            tokens.extend(chunk_tokens)
+            if positions is not None:
+                positions.extend(p + i for p in chunk_positions)
+            i = end
+        else:
+            i = _recover(source_code, i, end, dfa, tokens, positions)
+    code = 1 if any(token_type == ERROR for token_type, _ in tokens) else 0
+    return (code, tokens)
+
+def tokenize_tolerant(source_code, dfa, positions=None, chunk_chars=CHUNK_CHARS):
+    # (0, tokens) tanpa error, atau (1, tokens) dengan token ("ERROR", lexeme);
+    # positions (opsional) juga berisi offset token ERROR
+    generated = get_tokenizer(dfa)
+    if generated is not None:
+        mark = len(positions) if positions is not None else 0
+        tokens = generated(source_code, positions)
+        if tokens is not None:
+            return (0, tokens)
+        if positions is not None:
+            del positions[mark:]
+    return _tokenize_chunks(source_code, dfa, positions, chunk_chars)
+
+def lexical_errors(source_code, dfa):
+    # [(offset, lexeme)] untuk setiap token ERROR; dipakai setelah tokenize() gagal
+    positions = []
+    _, tokens = _tokenize_chunks(source_code, dfa, positions, CHUNK_CHARS)
+    return [(offset, lexeme) for (token_type, lexeme), offset in zip(tokens, positions) if token_type == ERROR]
+
+def line_col(source_code, offset):
+    line = source_code.count("\n", 0, offset) + 1
+    col = offset - (source_code.rfind("\n", 0, offset) + 1) + 1
+    return line, col
+
+def format_errors(source_code, errors):
+    lines = []
+    for offset, lexeme in errors:
+        line, col = line_col(source_code, offset)
+        shown = lexeme if len(lexeme) <= 20 else lexeme[:17] + "..."
+        lines.append(f"Lexical Error: baris {line}, kolom {col} (index {offset}): token tidak valid {shown!r}")
+    return lines
+
+def main():
+    if len(sys.argv) != 2:
+        print("Penggunaan: python src/lexer_recovery.py <file.pas>")
+        sys.exit(1)
+    with open(sys.argv[1], "r", encoding="utf-8") as f:
+        source = f.read()
+    errors = lexical_errors(source, load_dfa_rules())
+    for line in format_errors(source, errors):
+        print(line)
+    print(f"Ditemukan {len(errors)} lexical error")
+    sys.exit(1 if errors else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# Lexer DFA yang bekerja langsung pada bytes file yang di-mmap.
+#
+# lexer.tokenize() membutuhkan seluruh file sebagai str (baca + decode UTF-8),
+# lalu classify_char memanggil isalpha/isdigit/isspace untuk setiap karakter.
+# Di sini file di-mmap dan DFA dijalankan per byte dengan tabel transisi 256
+# entri per state. Tabel dibangun dari tabel kelas byte: 128 byte ASCII
+# dikelompokkan menurut perilakunya di semua state (lexer.step(), termasuk
+# "whitespace dilewati di S0"), jadi prioritas eksak > kelas > any_not_ sama
+# persis dengan lexer DFA. Hanya lexeme yang di-decode.
+#
+# Byte >= 0x80 (UTF-8 non-ASCII) dan '\r' di luar whitespace S0 tidak punya
+# transisi di tabel; begitu salah satunya ditemui, file dibaca ulang sebagai
+# teks (open(..., "r", encoding="utf-8"), sama dengan compiler.py) dan di-lex
+# dengan lexer_codegen, sehingga hasil dan error selalu identik. '\r' di S0
+# hanya whitespace; '\r\n' dihitung agar offset di `positions` tetap offset
+# karakter teks hasil universal newline.
+#
+#   python src/mmap_lexer.py <file.pas>     # bandingkan dengan lexer teks
+
+import mmap
+import sys
+
+from lexer import load_dfa_rules, step, in_comment_state, keyword_table
+
+_CR = 13
+_CR_BYTE = b"\r"
+
+class ByteTables:
+    def __init__(self, dfa):
+        start = dfa["start_state"]
+        transitions = dfa["transitions"]
+        final_states = dfa["final_states"]
+        names = [start]
+        for state, table in transitions.items():
+            names.append(state)
+            names.extend(table.values())
+        names.extend(final_states)
+        names = list(dict.fromkeys(names))
+        ids = {name: i for i, name in enumerate(names)}
+
+        # kelas byte: byte ASCII dengan perilaku sama di semua state
+        behaviour = {}
+        classes = [0] * 256
+        members = []
+        for b in range(128):
+            c = chr(b)
+            key = (b == _CR, c.isspace(), tuple(step(s, c, transitions) for s in names))
+            if key not in behaviour:
+                behaviour[key] = len(members)
+                members.append(c)
+            classes[b] = behaviour[key]
+        nonascii = len(members)
+        for b in range(128, 256):
+            classes[b] = nonascii
+        self.classes = bytes(classes)
+        self.class_count = nonascii + 1
+
+        # trans[state][byte] -> state berikutnya, -1 jika tidak ada transisi
+        self.trans = []
+        for s in names:
+            by_class = []
+            for c in members:
+                nxt = step(s, c, transitions)
+                by_class.append(ids[nxt] if nxt and ord(c) != _CR else -1)
+            by_class.append(-1)
+            self.trans.append([by_class[k] for k in classes])
+        # state "cincin" (isi komentar/string) yang hanya keluar lewat satu byte
+        # ASCII: isinya dilompati dengan data.find()
+        self.run_exit = []
+        for sid, row in enumerate(self.trans):
+            exits = [b for b in range(128) if row[b] != sid and b != _CR]
+            self.run_exit.append(bytes(exits) if len(exits) == 1 and row[_CR] < 0 else None)
+        self.loops = [sid in row for sid, row in enumerate(self.trans)]
+        self.skip = [chr(b).isspace() for b in range(128)] + [False] * 128
+        self.comment = [in_comment_state(s) for s in names]
+        self.final = [final_states.get(s) for s in names]
+
+        self.special = keyword_table(dfa)
+
+_cache = (None, None)
+
+def get_tables(dfa):
+    global _cache
+    if _cache[0] is not dfa:
+        _cache = (dfa, ByteTables(dfa))
+    return _cache[1]
+
+def tokenize_bytes(data, dfa, positions=None):
+    # data: bytes/mmap. (0, tokens), (1, None), atau None jika data memuat
+    # byte non-ASCII/'\r' yang harus ditangani lexer teks
+    tables = get_tables(dfa)
+    trans = tables.trans
+    skip = tables.skip
+    comment = tables.comment
+    final = tables.final
+    special = tables.special
+    run_exit = tables.run_exit
+    loops = tables.loops
+
+    tokens = []
+    append = tokens.append
+    state = 0
+    start = -1          # awal potongan lexeme di data, -1 jika belum ada
+    carry = b""         # bagian lexeme sebelum komentar (mis. '(' dari '(*')
+    shift = 0           # jumlah '\r\n' yang sudah dilewati
+    i = 0
+    n = len(data)
+
+    while i < n:
+        b = data[i]
+        if state == 0 and skip[b]:
+            if b == _CR:
+                if positions is not None and i + 1 < n and data[i + 1] == 10:
+                    shift += 1
+            i += 1
+            continue
+        nxt = trans[state][b]
+        if nxt >= 0:
+            if comment[state] or comment[nxt]:
+                if start >= 0:
+                    carry += data[start:i]
+                    start = -1
+            elif start < 0:
+                if positions is not None and not carry:
+                    positions.append(i - shift)
+                start = i
+            state = nxt
+            i += 1
+            exit_byte = run_exit[state]
+            if exit_byte is not None:
+                j = data.find(exit_byte, i)
+                if j < 0:
+                    j = n
+                run = data[i:j]
+                if not run.isascii() or _CR_BYTE in run:
+                    return None
+                i = j
+            elif loops[state]:
+                row = trans[state]
+                while i < n and row[data[i]] == state:
+                    i += 1
+            continue
+        if b >= 0x80 or b == _CR:
+            return None
+        token_type = final[state]
+        if token_type is None:
+            return (1, None)
+        lexeme = (carry + data[start:i] if carry else data[start:i]).decode("ascii")
+        append((special.get(lexeme.lower(), token_type), lexeme))
+        carry = b""
+        start = -1
+        state = 0
+
+    if start >= 0 or carry:
+        token_type = final[state]
+        if token_type is None:
+            return (1, None)
+        lexeme = (carry + data[start:] if start >= 0 else carry).decode("ascii")
+        append((special.get(lexeme.lower(), token_type), lexeme))
+    return (0, tokens)
+
+def _tokenize_text(path, dfa, positions):
+    from lexer_codegen import tokenize
+    with open(path, "r", encoding="utf-8") as f:
+        return tokenize(f.read(), dfa, positions)
+
+def tokenize_file(path, dfa, positions=None):
+    # antarmuka sama dengan lexer.tokenize, tetapi menerima path file
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # file kosong tidak bisa di-mmap
+            mm = None
+        if mm is not None:
+            mark = len(positions) if positions is not None else 0
+            with mm:
+                result = tokenize_bytes(mm, dfa, positions)
+            if result is not None:
+                return result
+            if positions is not None:
+                del positions[mark:]
+    return _tokenize_text(path, dfa, positions)
+
+def main():
+    if len(sys.argv) != 2:
+        print("Penggunaan: python src/mmap_lexer.py <file.pas>")
+        sys.exit(1)
+    path = sys.argv[1]
+    dfa = load_dfa_rules()
+    tables = get_tables(dfa)
+    positions = []
+    result = tokenize_file(path, dfa, positions)
+    expected_positions = []
+    expected = _tokenize_text(path, dfa, expected_positions)
+    same = result == expected and (result[0] != 0 or positions == expected_positions)
+    print(f"{tables.class_count} kelas byte, {len(tables.trans)} state")
+    print(f"kode {result[0]}, {len(result[1] or [])} token, {'identik' if same else 'BERBEDA'} dengan lexer teks")
+    sys.exit(0 if same else 1)
+
+if __name__ == "__main__":
+    main()
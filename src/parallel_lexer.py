@@ -0,0 +1,204 @@
+# Lexing paralel untuk file besar.
+#
+# Input dipotong menjadi chunk yang selalu berakhir tepat setelah '\n'. Setiap
+# chunk di-lex secara spekulatif (seolah mulai dari state awal dengan token
+# kosong) di process pool memakai lexer_codegen. Di batas chunk lexer
+# sekuensial bisa saja berada di dalam komentar { ... } / (* ... *), di dalam
+# string, atau membawa carry '(' dari '(*'. Untuk mengetahuinya, chunk di-lex
+# dengan sentinel "x" di belakangnya: batas "bersih" (state awal, token kosong)
+# jika dan hanya jika token terakhir adalah "x" yang mulai tepat di offset
+# sentinel. Di komentar "x" tidak menjadi token, di string/carry "x" menjadi
+# bagian token yang mulai lebih awal.
+#
+# Rekonsiliasi di proses induk: hasil spekulatif chunk k sah jika batas
+# sebelumnya bersih. Jika batas akhir chunk k tidak bersih (atau chunk error,
+# yang bisa disebabkan string yang berlanjut ke chunk berikutnya), chunk k
+# digabung dengan chunk berikutnya (1, 3, 7, ... chunk, ukuran berlipat) dan
+# di-lex ulang sampai batasnya bersih atau input habis. Hasil akhirnya selalu
+# sama persis dengan tokenize() sekuensial.
+#
+# Sentinel hanya sah jika '\n' tidak pernah membawa DFA ke state token yang
+# macet pada "x" (lihat _sentinel_is_sound); jika tidak, lexing sekuensial.
+#
+#   python src/parallel_lexer.py <file.pas> [--procs N] [--chunk-chars N]
+
+import argparse
+import os
+import sys
+import time
+from array import array
+from operator import itemgetter
+
+from lexer import load_dfa_rules, step, in_comment_state
+from lexer_codegen import tokenize as seq_tokenize
+
+SENTINEL = "x"
+DEFAULT_CHUNK_CHARS = 1 << 20
+
+def _sentinel_is_sound(dfa, separators="\n"):
+    # chunk berakhir tepat setelah salah satu karakter `separators`
+    start = dfa["start_state"]
+    transitions = dfa["transitions"]
+    code, tokens = seq_tokenize(SENTINEL, dfa)
+    if code != 0 or [t[1] for t in tokens] != [SENTINEL]:
+        return False
+    states = set(transitions) | set(dfa["final_states"])
+    for state in states:
+        if in_comment_state(state):
+            continue
+        for sep in separators:
+            nxt = step(state, sep, transitions)
+            if nxt and nxt != start and not in_comment_state(nxt) and not step(nxt, SENTINEL, transitions):
+                return False
+    return True
+
+def split_points(source, chunk_chars):
+    # offset awal tiap chunk; setiap chunk kecuali yang terakhir berakhir dengan '\n'
+    starts = [0]
+    n = len(source)
+    pos = chunk_chars
+    while pos < n:
+        cut = source.find("\n", pos - 1)
+        if cut < 0 or cut + 1 >= n:
+            break
+        starts.append(cut + 1)
+        pos = cut + 1 + chunk_chars
+    return starts
+
+def lex_chunk(text, dfa, last, tokenize=seq_tokenize):
+    # (bersih?, tokens, positions); bersih = batas akhir chunk di state awal
+    positions = []
+    if last:
+        code, tokens = tokenize(text, dfa, positions)
+        return code == 0, tokens, positions
+    code, tokens = tokenize(text + SENTINEL, dfa, positions)
+    if code != 0 or not tokens or tokens[-1][1] != SENTINEL or positions[-1] != len(text):
+        return False, None, None
+    tokens.pop()
+    positions.pop()
+    return True, tokens, positions
+
+_worker_source = None
+_worker_dfa = None
+
+def _init_worker(source, dfa):
+    global _worker_source, _worker_dfa
+    _worker_source = source
+    _worker_dfa = dfa
+
+def _lex_range(args):
+    # hasil dikemas ringkas: pickle jutaan tuple kembali ke induk sama mahalnya
+    # dengan lexing itu sendiri
+    start, end, last, want_positions = args
+    clean, tokens, positions = lex_chunk(_worker_source[start:end], _worker_dfa, last)
+    if not clean:
+        return None
+    return pack(tokens, positions if want_positions else [], start)
+
+def pack(tokens, positions, base):
+    # (kode tipe per token, nama tipe, lexeme digabung '\0', offset absolut)
+    # atau list token apa adanya jika ada lexeme yang memuat '\0'
+    names = {}
+    for token_type in set(map(itemgetter(0), tokens)):
+        names[token_type] = len(names)
+    if len(names) > 256:
+        return tokens, array("q", map(base.__add__, positions))
+    joined = "\0".join(map(itemgetter(1), tokens))
+    if joined.count("\0") != max(len(tokens) - 1, 0):
+        return tokens, array("q", map(base.__add__, positions))
+    codes = bytes(map(names.__getitem__, map(itemgetter(0), tokens)))
+    return codes, list(names), joined, array("q", map(base.__add__, positions))
+
+def unpack(packed):
+    if len(packed) == 2:
+        tokens, positions = packed
+        return tokens, positions.tolist()
+    codes, names, joined, positions = packed
+    if not codes:
+        return [], []
+    return list(zip(map(names.__getitem__, codes), joined.split("\0"))), positions.tolist()
+
+def tokenize_parallel(source_code, dfa, positions=None, procs=None, chunk_chars=DEFAULT_CHUNK_CHARS):
+    # antarmuka sama dengan lexer.tokenize; procs=1 menjalankan chunk di proses
+    # ini (untuk pengecekan), procs=None memakai semua CPU
+    if procs is None:
+        procs = os.cpu_count() or 1
+        if procs == 1:
+            return seq_tokenize(source_code, dfa, positions)
+    starts = split_points(source_code, chunk_chars)
+    if len(starts) == 1 or not _sentinel_is_sound(dfa):
+        return seq_tokenize(source_code, dfa, positions)
+    ends = starts[1:] + [len(source_code)]
+    count = len(starts)
+    jobs = [(starts[k], ends[k], k == count - 1, positions is not None) for k in range(count)]
+
+    if procs > 1:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(min(procs, count), mp_context=context,
+                                 initializer=_init_worker, initargs=(source_code, dfa)) as pool:
+            results = [(False, None, None) if packed is None else (True, *unpack(packed))
+                       for packed in pool.map(_lex_range, jobs)]
+    else:
+        results = []
+        for a, b, last, _ in jobs:
+            clean, chunk_tokens, chunk_positions = lex_chunk(source_code[a:b], dfa, last)
+            if clean and positions is not None:
+                chunk_positions = [p + a for p in chunk_positions]
+            results.append((clean, chunk_tokens, chunk_positions))
+
+    tokens = []
+    out_positions = []
+    k = 0
+    while k < count:
+        clean, chunk_tokens, chunk_positions = results[k]
+        span = 1
+        while not clean and k + span < count:
+            span = min(span * 2 + 1, count - k)
+            last = k + span == count
+            base = starts[k]
+            clean, chunk_tokens, chunk_positions = lex_chunk(source_code[base:ends[k + span - 1]], dfa, last)
+            if clean and positions is not None:
+                chunk_positions = [p + base for p in chunk_positions]
+        if not clean:
+            return (1, None)
+        tokens.extend(chunk_tokens)
+        if positions is not None:
+            out_positions.extend(chunk_positions)
+        k += span
+    if positions is not None:
+        positions.extend(out_positions)
+    return (0, tokens)
+
+def main():
+    ap = argparse.ArgumentParser(description="Lexing paralel per chunk baris, dibandingkan dengan lexer sekuensial")
+    ap.add_argument("file")
+    ap.add_argument("--procs", type=int, default=None)
+    ap.add_argument("--chunk-chars", type=int, default=DEFAULT_CHUNK_CHARS)
+    args = ap.parse_args()
+
+    dfa = load_dfa_rules()
+    with open(args.file, "r", encoding="utf-8") as f:
+        source = f.read()
+
+    t0 = time.perf_counter()
+    expected_positions = []
+    expected = seq_tokenize(source, dfa, expected_positions)
+    t_seq = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    positions = []
+    result = tokenize_parallel(source, dfa, positions, args.procs, args.chunk_chars)
+    t_par = time.perf_counter() - t0
+
+    same = result == expected and (result[0] != 0 or positions == expected_positions)
+    chunks = len(split_points(source, args.chunk_chars))
+    print(f"{len(source)} karakter, {chunks} chunk, {args.procs or os.cpu_count()} proses")
+    print(f"sekuensial {t_seq * 1000:.1f} ms, paralel {t_par * 1000:.1f} ms")
+    print("identik" if same else "BERBEDA")
+    sys.exit(0 if same else 1)
+
+if __name__ == "__main__":
+    main()
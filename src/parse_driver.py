@@ -0,0 +1,31 @@
+# Parse program untuk compiler.py dan server.py: parser2 dengan ParseBudget,
+# dengan parser cepat (parser.py) sebagai cadangan untuk program valid.
+#
+#   root, success, end_idx, error_ctx = parse_tokens_budgeted(tokens, recover, budget, strict)
+#
+# Budget membatasi percobaan rule per token, dan program valid yang
+# backtracking-nya eksponensial (mis. kurung bersarang) juga melampauinya.
+# Sebelum ParseBudgetExceeded diteruskan, token diparse ulang dengan parser
+# cepat (linear); parse lengkap berarti program valid, sehingga hasilnya sama
+# dengan parse_tokens tanpa budget. Jika parser cepat juga menolaknya, strict=False
+# (compiler.py dengan budget default) memparse ulang tanpa budget agar syntax
+# error yang dilaporkan sama dengan parse_tokens; strict=True (server, atau
+# --parse-budget eksplisit) meneruskan ParseBudgetExceeded. Batas kedalaman
+# selalu diteruskan: yang dihitung hanya sarang program (lihat _is_list_tail di
+# parser2.py), dan program sedalam itu tidak diparse ulang tanpa batas.
+
+from parser2 import ParseBudgetExceeded, ParseErrorContext, parse_tokens
+from parser import Parser
+
+def parse_tokens_budgeted(tokens, recover=False, budget=None, strict=True):
+    try:
+        return parse_tokens(tokens, recover=recover, budget=budget)
+    except ParseBudgetExceeded as e:
+        if e.kind == "kedalaman parse":
+            raise
+        success, end_idx, root = Parser(tokens).parse()
+        if success and end_idx == len(tokens):
+            return root, success, end_idx, ParseErrorContext(recover=recover)
+        if not strict:
+            return parse_tokens(tokens, recover=recover)
+        raise
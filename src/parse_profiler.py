@@ -0,0 +1,148 @@
+# Profiling parser2: statistik per (kelas grammar, indeks alternatif).
+#
+#   profiler = ParseProfiler()
+#   ProgramNode().parse(tokens, 0, None, profiler)     # profiler sebagai monitor parse
+#   print(profiler.report())
+#
+# Untuk setiap alternatif dicatat: jumlah percobaan, jumlah berhasil, token yang
+# sudah dikonsumsi sebelum alternatif gagal (pekerjaan yang terbuang karena
+# backtracking), waktu total (inklusif, rekursi tidak dihitung dua kali), dan
+# waktu sendiri (tanpa waktu alternatif anak). Dengan folded=True juga dibuat
+# stack "folded" (Rule[alt];Rule[alt] mikrodetik) untuk flamegraph.pl/speedscope.
+#
+#   python src/parse_profiler.py <file.pas> [--sort self|total|attempts|wasted] [--top N] [--folded out.txt]
+
+import argparse
+import sys
+import time
+
+from lexer import load_dfa_rules, tokenize
+from parser2 import ProgramNode, Token
+
+SORT_KEYS = {
+    "self": lambda row: row[5],
+    "total": lambda row: row[4],
+    "attempts": lambda row: row[0],
+    "wasted": lambda row: row[2],
+}
+
+class ParseProfiler:
+    def __init__(self, folded=False):
+        # (kelas, alt) -> [percobaan, berhasil, token terbuang, gagal, total s, self s]
+        self.stats = {}
+        self.folded = {} if folded else None
+        self._stack = []        # [key, t0, waktu anak, path folded]
+        self._active = {}       # key -> kedalaman rekursi aktif
+        self._alts = []         # indeks alternatif yang sedang dicoba per node
+
+    # hook monitor ParseNode.parse
+
+    def enter_node(self, node, start_idx):
+        self._alts.append(-1)
+
+    def enter_alt(self, node, start_idx):
+        self._alts[-1] += 1
+        self.enter(node.name, self._alts[-1])
+
+    def exit_alt(self, node, success, consumed):
+        self.exit(success, consumed)
+
+    def exit_node(self, node, success, start_idx):
+        self._alts.pop()
+
+    def enter(self, rule, alt):
+        key = (rule, alt)
+        path = None
+        if self.folded is not None:
+            label = f"{rule}[{alt}]"
+            path = f"{self._stack[-1][3]};{label}" if self._stack else label
+        self._active[key] = self._active.get(key, 0) + 1
+        self._stack.append([key, time.perf_counter(), 0.0, path])
+
+    def exit(self, success, consumed):
+        key, t0, child_time, path = self._stack.pop()
+        elapsed = time.perf_counter() - t0
+        row = self.stats.get(key)
+        if row is None:
+            row = self.stats[key] = [0, 0, 0, 0, 0.0, 0.0]
+        row[0] += 1
+        if success:
+            row[1] += 1
+        else:
+            row[2] += consumed
+            row[3] += 1
+
+        self._active[key] -= 1
+        if self._active[key] == 0:
+            row[4] += elapsed
+        row[5] += elapsed - child_time
+        if self._stack:
+            self._stack[-1][2] += elapsed
+        if path is not None:
+            self.folded[path] = self.folded.get(path, 0.0) + elapsed - child_time
+
+    def rows(self, sort="self"):
+        rows = [(rule, alt, *row) for (rule, alt), row in self.stats.items()]
+        order = SORT_KEYS[sort]
+        rows.sort(key=lambda r: order(r[2:]), reverse=True)
+        return rows
+
+    def report(self, sort="self", top=None):
+        rows = self.rows(sort)
+        if top:
+            rows = rows[:top]
+        lines = [f"{'rule':<32} {'alt':>3} {'attempts':>9} {'success':>9} {'failed':>9} "
+                 f"{'wasted tok':>10} {'total ms':>10} {'self ms':>10}"]
+        for rule, alt, attempts, successes, wasted, failed, total, own in rows:
+            lines.append(f"{rule:<32} {alt:>3} {attempts:>9} {successes:>9} {failed:>9} "
+                         f"{wasted:>10} {total * 1000:>10.2f} {own * 1000:>10.2f}")
+        attempts = sum(row[0] for row in self.stats.values())
+        wasted = sum(row[2] for row in self.stats.values())
+        lines.append(f"\n{len(self.stats)} alternatif, {attempts} percobaan, {wasted} token terbuang karena backtracking")
+        return "\n".join(lines)
+
+    def write_folded(self, f):
+        for path, seconds in sorted(self.folded.items()):
+            micros = int(round(seconds * 1e6))
+            if micros > 0:
+                f.write(f"{path} {micros}\n")
+
+def profile_source(source, dfa=None, folded=False):
+    if dfa is None:
+        dfa = load_dfa_rules()
+    code, raw_tokens = tokenize(source, dfa)
+    if code != 0:
+        raise ValueError("lexical error")
+    tokens = [Token(t, v) for t, v in raw_tokens]
+
+    profiler = ParseProfiler(folded=folded)
+    success, end_idx = ProgramNode().parse(tokens, 0, None, profiler)
+    return profiler, success and end_idx == len(tokens)
+
+def main():
+    ap = argparse.ArgumentParser(description="Profil backtracking parser2 per rule dan alternatif")
+    ap.add_argument("file")
+    ap.add_argument("--sort", choices=sorted(SORT_KEYS), default="self")
+    ap.add_argument("--top", type=int, default=30)
+    ap.add_argument("--folded", help="tulis stack folded (flamegraph) ke file ini")
+    args = ap.parse_args()
+
+    sys.setrecursionlimit(100000)
+    with open(args.file, "r", encoding="utf-8") as f:
+        source = f.read()
+    try:
+        profiler, ok = profile_source(source, folded=args.folded is not None)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if not ok:
+        print("Peringatan: program tidak lolos parsing, statistik tetap ditampilkan\n")
+
+    print(profiler.report(args.sort, args.top))
+    if args.folded:
+        with open(args.folded, "w", encoding="utf-8") as f:
+            profiler.write_folded(f)
+        print(f"Stack folded ditulis ke {args.folded}")
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,59 @@
-class Token:
-    def __init__(self, tipe, nilai):
-        self.tipe = tipe
-        self.nilai = nilai
-
-    def __repr__(self):
-        return f"{self.tipe}({self.nilai})"
-
-class NodePohonParsing:
-    def __init__(self, nama, anak=None):
-        self.nama = nama
-        self.anak = anak if anak is not None else []
-
-    def tambah_anak(self, node):
-        self.anak.append(node)
-
-    def cetak(self, level=0, prefix=""):
-        hasil = ""
-        if level == 0:
-            hasil += f"{prefix}{self.nama}\n"
-        else:
-            hasil += f"{prefix}{self.nama}\n"
-
-        jumlah_anak = len(self.anak)
-        for i, anak in enumerate(self.anak):
-            adalah_terakhir = (i == jumlah_anak - 1)
-            if level == 0:
-                prefix_baru = ""
-            else:
-                prefix_baru = prefix
-
-            if adalah_terakhir:
-                hasil += anak.cetak(level + 1, prefix_baru + "└── ")
-            else:
-                hasil += anak.cetak(level + 1, prefix_baru + "├── ")
-
-        return hasil
+# Parser recursive-descent berbasis indeks (compiler.py --parser=fast).
+#
+# Grammar dan CST-nya sama persis dengan parser2: setiap node adalah instance
+# kelas node parser2 dengan children yang sama (Token dan node anak), sehingga
+# ASTTransformer, cetak(), dan tahap berikutnya tidak membedakan kedua parser.
+# Bedanya, parser2 mencoba setiap alternatif satu per satu (membuat node baru di
+# setiap percobaan), sedangkan di sini:
+#   - alternatif dipilih dari lookahead 1-3 token;
+#   - prefix bersama hanya diparse sekali (simple-expression pada expression,
+#     'jika .. maka statement' pada if, bagian awal prosedur/fungsi);
+#   - node tail kanan-rekursif (statement-list-tail, term-tail, section, ...)
+#     dibangun dengan loop, bukan rekursi.
+#
+# Semantik pilihan berurutan parser2 tetap dijaga, termasuk kasus tepinya:
+# alternatif yang gagal di tengah jalan jatuh ke alternatif berikutnya (mis.
+# statement yang gagal menjadi empty-statement, 'a < ?' menjadi expression 'a'),
+# dan nonterminal yang dipanggil setelah token habis selalu gagal. Backtracking
+# memakai exception SyntaxError dan menyimpan/mengembalikan self.posisi.
+#
+# Parser ini tidak mengumpulkan informasi error: jika parse tidak lengkap,
+# compiler.py mengulang parse dengan parser2 untuk pesan error.
+
+from parser2 import (
+    ProgramNode, ProgramHeaderNode, DeclarationPartNode,
+    ConstSectionNode, ConstDeclarationNode, ConstItemNode, ConstItemTailNode,
+    TypeSectionNode, TypeDeclarationNode, TypeItemNode, TypeItemTailNode,
+    VarSectionNode, VarDeclarationNode, VarItemNode, VarItemTailNode,
+    IdentifierListNode, IdentifierListTailNode,
+    TypeDefinitionNode, TypeNode, ArrayTypeNode, RangeNode,
+    RecordTypeNode, FieldListNode, FieldListTailNode,
+    SubprogramSectionNode, SubprogramDeclarationNode,
+    ProcedureDeclarationNode, FunctionDeclarationNode,
+    FormalParameterListNode, ParameterGroupNode, ParameterGroupTailNode, ParameterModifierNode,
+    BlockNode, CompoundStatementNode, StatementListNode, StatementListTailNode,
+    StatementNode, AssignmentStatementNode, IfStatementNode, WhileStatementNode,
+    ForStatementNode, RepeatStatementNode, CaseStatementNode,
+    CaseListNode, CaseListTailNode, CaseElementNode,
+    ExpressionStatementNode, EmptyStatementNode,
+    ExpressionNode, SimpleExpressionNode, SimpleExpressionTailNode,
+    TermNode, TermTailNode, FactorNode, CallNode, ParameterListNode, ParameterListTailNode,
+    ValueNode, NumberNode, FieldAccessNode, FieldAccessTailNode,
+    RelationalOperatorNode, AdditiveOperatorNode, MultiplicativeOperatorNode,
+)
+
+TIPE_DASAR = ("integer", "real", "boolean", "char")
+RELATIONAL = ("<>", "<", "<=", ">", ">=", "=")
+ADDITIVE = {"LOGICAL_OPERATOR": ("atau",), "ARITHMETIC_OPERATOR": ("+", "-")}
+MULTIPLICATIVE = {"ARITHMETIC_OPERATOR": ("*", "/", "bagi", "mod"), "LOGICAL_OPERATOR": ("dan",)}
+AWAL_EXPRESSION = ("IDENTIFIER", "NUMBER", "CHAR_LITERAL", "STRING_LITERAL", "LPARENTHESIS")
+
+def _node(cls, children):
+    # sama dengan node parser2 setelah parse() berhasil, tanpa memanggil __init__
+    node = cls.__new__(cls)
+    node.name = cls.__name__
+    node.children = children
+    return node
 
 class SyntaxError(Exception):
     def __init__(self, pesan):
@@ -43,562 +62,650 @@ class SyntaxError(Exception):
 
 class Parser:
     def __init__(self, tokens):
-        self.tokens = [Token(t[0], t[1]) for t in tokens]
+        # tokens: list Token parser2 (sudah dibuat dari hasil lexer)
+        self.tokens = tokens
+        self.tipe = [t.tipe for t in tokens]
+        self.nilai = [t.nilai for t in tokens]
+        self.n = len(tokens)
         self.posisi = 0
-        self.token_sekarang = self.tokens[0] if len(self.tokens) > 0 else None
 
-    def ambil_token(self):
-        return self.token_sekarang
+        self.statement_keyword = {
+            "jika": self.parse_if_statement,
+            "selama": self.parse_while_statement,
+            "untuk": self.parse_for_statement,
+            "ulangi": self.parse_repeat_statement,
+            "kasus": self.parse_case_statement,
+            "mulai": self.parse_compound_statement,
+        }
 
-    def maju(self):
-        self.posisi += 1
-        if self.posisi < len(self.tokens):
-            self.token_sekarang = self.tokens[self.posisi]
-        else:
-            self.token_sekarang = None
+    # Utilitas token
 
-    def cocokkan(self, tipe_token, nilai_token=None):
-        if self.token_sekarang is None:
-            raise SyntaxError(f"error: token tidak ditemukan, diharapkan {tipe_token}, posisi {self.posisi}")
+    def cek(self, tipe_token, nilai_token=None, offset=0):
+        i = self.posisi + offset
+        if i >= self.n or self.tipe[i] != tipe_token:
+            return False
+        return nilai_token is None or self.nilai[i] == nilai_token
 
-        if self.token_sekarang.tipe != tipe_token:
-            raise SyntaxError(f"error: token tidak sesuai, ditemukan {self.token_sekarang.tipe}({self.token_sekarang.nilai}) di posisi {self.posisi}, diharapkan {tipe_token}")
+    def cek_keyword(self, nilai_token, offset=0):
+        return self.cek("KEYWORD", nilai_token, offset)
 
-        if nilai_token is not None and self.token_sekarang.nilai != nilai_token:
-            raise SyntaxError(f"error: nilai token tidak sesuai, ditemukan {self.token_sekarang.nilai} di posisi {self.posisi}, diharapkan {nilai_token}")
+    def cocokkan(self, tipe_token, nilai_token=None):
+        i = self.posisi
+        if i >= self.n:
+            raise SyntaxError(f"error: token tidak ditemukan, diharapkan {tipe_token}, posisi {i}")
+        if self.tipe[i] != tipe_token or (nilai_token is not None and self.nilai[i] != nilai_token):
+            raise SyntaxError(f"error: token tidak sesuai di posisi {i}, diharapkan {nilai_token or tipe_token}")
+        self.posisi = i + 1
+        return self.tokens[i]
+
+    def cek_akhir(self):
+        # nonterminal tidak pernah dipanggil parser2 setelah token habis
+        if self.posisi >= self.n:
+            raise SyntaxError(f"error: token habis di posisi {self.posisi}")
+
+    def awal_expression(self):
+        i = self.posisi
+        if i >= self.n:
+            return False
+        tipe = self.tipe[i]
+        if tipe in AWAL_EXPRESSION:
+            return True
+        nilai = self.nilai[i]
+        if tipe == "KEYWORD":
+            return nilai == "benar" or nilai == "salah"
+        if tipe == "LOGICAL_OPERATOR":
+            return nilai == "tidak"
+        return tipe == "ARITHMETIC_OPERATOR" and (nilai == "+" or nilai == "-")
+
+    def operator(self, cls, tabel):
+        i = self.posisi
+        if i < self.n and self.nilai[i] in tabel.get(self.tipe[i], ()):
+            self.posisi = i + 1
+            return _node(cls, [self.tokens[i]])
+        return None
+
+    def parse_tail(self, cls, langkah, semicolon=False):
+        # tail kanan-rekursif T => prefix T | (SEMICOLON) | epsilon, dibangun dengan loop.
+        # langkah() mem-parse prefix dan mengembalikan children-nya, None jika
+        # lookahead tidak cocok, atau melempar SyntaxError jika gagal di tengah.
+        # T yang dipanggil di akhir token gagal, sehingga level sebelumnya jatuh
+        # ke alternatif pendeknya.
+        mulai = self.posisi
+        if mulai < self.n and not semicolon:
+            # kasus paling sering: tail langsung kosong
+            try:
+                children = langkah()
+            except SyntaxError:
+                self.posisi = mulai
+                return _node(cls, [])
+            if children is None:
+                return _node(cls, [])
+            levels = [(mulai, children)]
+        else:
+            levels = []
+        while True:
+            mulai = self.posisi
+            if mulai >= self.n:
+                if not levels:
+                    raise SyntaxError(f"error: token habis di posisi {mulai}")
+                mulai = levels.pop()[0]
+                break
+            try:
+                children = langkah()
+            except SyntaxError:
+                break
+            if children is None:
+                break
+            levels.append((mulai, children))
 
-        node = NodePohonParsing(f"{self.token_sekarang.tipe}({self.token_sekarang.nilai})")
-        self.maju()
+        self.posisi = mulai
+        children = []
+        if semicolon and self.cek("SEMICOLON"):
+            children.append(self.tokens[mulai])
+            self.posisi = mulai + 1
+        node = _node(cls, children)
+        for _, children in reversed(levels):
+            children.append(node)
+            node = _node(cls, children)
         return node
 
+    # Program dan deklarasi
+
     def parse_program(self):
         # program => program-header declaration-part compound-statement DOT
-        node = NodePohonParsing("<program>")
-        node.tambah_anak(self.parse_program_header())
-        node.tambah_anak(self.parse_declaration_part())
-        node.tambah_anak(self.parse_compound_statement())
-        node.tambah_anak(self.cocokkan("DOT"))
-
-        return node
+        return _node(ProgramNode, [
+            self.parse_program_header(),
+            self.parse_declaration_part(),
+            self.parse_compound_statement(),
+            self.cocokkan("DOT"),
+        ])
 
     def parse_program_header(self):
         # program-header => KEYWORD(program) IDENTIFIER SEMICOLON
-        node = NodePohonParsing("<program-header>")
-        node.tambah_anak(self.cocokkan("KEYWORD", "program"))
-        node.tambah_anak(self.cocokkan("IDENTIFIER"))
-        node.tambah_anak(self.cocokkan("SEMICOLON"))
-
-        return node
+        return _node(ProgramHeaderNode, [
+            self.cocokkan("KEYWORD", "program"),
+            self.cocokkan("IDENTIFIER"),
+            self.cocokkan("SEMICOLON"),
+        ])
 
     def parse_declaration_part(self):
-        # declaration-part => (const-declaration)* (type-declaration)* (var-declaration)* (subprogram-declaration)*
-        node = NodePohonParsing("<declaration-part>")
-
-        # parse const declarations
-        while self.token_sekarang and self.token_sekarang.tipe == "KEYWORD" and self.token_sekarang.nilai == "konstanta":
-            node.tambah_anak(self.parse_const_declaration())
-
-        # parse type declarations
-        while self.token_sekarang and self.token_sekarang.tipe == "KEYWORD" and self.token_sekarang.nilai == "tipe":
-            node.tambah_anak(self.parse_type_declaration())
-
-        # parse var declarations
-        while self.token_sekarang and self.token_sekarang.tipe == "KEYWORD" and self.token_sekarang.nilai == "variabel":
-            node.tambah_anak(self.parse_var_declaration())
-
-        # parse subprogram declarations
-        while self.token_sekarang and self.token_sekarang.tipe == "KEYWORD" and (self.token_sekarang.nilai == "prosedur" or self.token_sekarang.nilai == "fungsi"):
-            node.tambah_anak(self.parse_subprogram_declaration())
-
-        return node
+        # declaration-part => const-section type-section var-section subprogram-section
+        return _node(DeclarationPartNode, [
+            self.parse_tail(ConstSectionNode, self.langkah_const_section),
+            self.parse_tail(TypeSectionNode, self.langkah_type_section),
+            self.parse_tail(VarSectionNode, self.langkah_var_section),
+            self.parse_tail(SubprogramSectionNode, self.langkah_subprogram_section),
+        ])
+
+    def langkah_const_section(self):
+        if self.cek_keyword("konstanta"):
+            return [self.parse_const_declaration()]
+        return None
+
+    def langkah_type_section(self):
+        if self.cek_keyword("tipe"):
+            return [self.parse_type_declaration()]
+        return None
+
+    def langkah_var_section(self):
+        if self.cek_keyword("variabel"):
+            return [self.parse_var_declaration()]
+        return None
+
+    def langkah_subprogram_section(self):
+        if self.cek_keyword("prosedur") or self.cek_keyword("fungsi"):
+            return [self.parse_subprogram_declaration()]
+        return None
 
     def parse_const_declaration(self):
-        # const-declaration => KEYWORD(konstanta) (IDENTIFIER = value SEMICOLON)+
-        node = NodePohonParsing("<const-declaration>")
-        node.tambah_anak(self.cocokkan("KEYWORD", "konstanta"))
-
-        # minimal satu deklarasi konstanta
-        while True:
-            node.tambah_anak(self.cocokkan("IDENTIFIER"))
-            node.tambah_anak(self.cocokkan("RELATIONAL_OPERATOR", "="))
-
-            # value bisa berupa NUMBER atau CHAR_LITERAL atau STRING_LITERAL atau IDENTIFIER
-            if self.token_sekarang.tipe == "NUMBER":
-                node.tambah_anak(self.cocokkan("NUMBER"))
-            elif self.token_sekarang.tipe == "STRING_LITERAL":
-                node.tambah_anak(self.cocokkan("STRING_LITERAL"))
-            elif self.token_sekarang.tipe == "IDENTIFIER":
-                node.tambah_anak(self.cocokkan("IDENTIFIER"))
-            else:
-                raise SyntaxError(f"error: nilai konstanta tidak valid")
-
-            node.tambah_anak(self.cocokkan("SEMICOLON"))
-
-            # cek apakah masih ada deklarasi konstanta lagi
-            if not (self.token_sekarang and self.token_sekarang.tipe == "IDENTIFIER" and
-                    self.posisi + 1 < len(self.tokens) and
-                    self.tokens[self.posisi + 1].tipe == "RELATIONAL_OPERATOR" and
-                    self.tokens[self.posisi + 1].nilai == "="):
-                break
-
-        return node
+        # const-declaration => KEYWORD(konstanta) const-item (const-item)*
+        return _node(ConstDeclarationNode, [
+            self.cocokkan("KEYWORD", "konstanta"),
+            self.parse_const_item(),
+            self.parse_tail(ConstItemTailNode, self.langkah_const_item),
+        ])
+
+    def langkah_const_item(self):
+        if self.cek("IDENTIFIER"):
+            return [self.parse_const_item()]
+        return None
+
+    def parse_const_item(self):
+        # const-item => IDENTIFIER RELATIONAL_OPERATOR(=) value SEMICOLON
+        return _node(ConstItemNode, [
+            self.cocokkan("IDENTIFIER"),
+            self.cocokkan("RELATIONAL_OPERATOR", "="),
+            self.parse_value(),
+            self.cocokkan("SEMICOLON"),
+        ])
 
     def parse_type_declaration(self):
-        # type-declaration => KEYWORD(tipe) (IDENTIFIER = type-definition SEMICOLON)+
-        node = NodePohonParsing("<type-declaration>")
-        node.tambah_anak(self.cocokkan("KEYWORD", "tipe"))
-
-        while True:
-            node.tambah_anak(self.cocokkan("IDENTIFIER"))
-            node.tambah_anak(self.cocokkan("RELATIONAL_OPERATOR", "="))
-            node.tambah_anak(self.parse_type())
-            node.tambah_anak(self.cocokkan("SEMICOLON"))
-
-            # cek apakah masih ada deklarasi tipe lagi
-            if not (self.token_sekarang and self.token_sekarang.tipe == "IDENTIFIER" and
-                    self.posisi + 1 < len(self.tokens) and
-                    self.tokens[self.posisi + 1].tipe == "RELATIONAL_OPERATOR" and
-                    self.tokens[self.posisi + 1].nilai == "="):
-                break
-
-        return node
+        # type-declaration => KEYWORD(tipe) type-item (type-item)*
+        return _node(TypeDeclarationNode, [
+            self.cocokkan("KEYWORD", "tipe"),
+            self.parse_type_item(),
+            self.parse_tail(TypeItemTailNode, self.langkah_type_item),
+        ])
+
+    def langkah_type_item(self):
+        if self.cek("IDENTIFIER"):
+            return [self.parse_type_item()]
+        return None
+
+    def parse_type_item(self):
+        # type-item => IDENTIFIER RELATIONAL_OPERATOR(=) type-definition SEMICOLON
+        return _node(TypeItemNode, [
+            self.cocokkan("IDENTIFIER"),
+            self.cocokkan("RELATIONAL_OPERATOR", "="),
+            self.parse_type_definition(),
+            self.cocokkan("SEMICOLON"),
+        ])
 
     def parse_var_declaration(self):
-        # var-declaration => KEYWORD(variabel) (identifier-list COLON type SEMICOLON)+
-        node = NodePohonParsing("<var-declaration>")
-        node.tambah_anak(self.cocokkan("KEYWORD", "variabel"))
-        while True:
-            node.tambah_anak(self.parse_identifier_list())
-            node.tambah_anak(self.cocokkan("COLON"))
-            node.tambah_anak(self.parse_type())
-            node.tambah_anak(self.cocokkan("SEMICOLON"))
-
-            # cek apakah masih ada deklarasi variabel lagi
-            if not (self.token_sekarang and self.token_sekarang.tipe == "IDENTIFIER"):
-                break
-
-            # pastikan bukan awal dari compound statement
-            if self.token_sekarang.tipe == "KEYWORD" and self.token_sekarang.nilai == "mulai":
-                break
-
-            # pastikan bukan awal dari subprogram declaration
-            if self.token_sekarang.tipe == "KEYWORD" and (self.token_sekarang.nilai == "prosedur" or self.token_sekarang.nilai == "fungsi"):
-                break
-
-        return node
+        # var-declaration => KEYWORD(variabel) var-item (var-item)*
+        return _node(VarDeclarationNode, [
+            self.cocokkan("KEYWORD", "variabel"),
+            self.parse_var_item(),
+            self.parse_tail(VarItemTailNode, self.langkah_var_item),
+        ])
+
+    def langkah_var_item(self):
+        if self.cek("IDENTIFIER"):
+            return [self.parse_var_item()]
+        return None
+
+    def parse_var_item(self):
+        # var-item => identifier-list COLON type-definition SEMICOLON
+        return _node(VarItemNode, [
+            self.parse_identifier_list(),
+            self.cocokkan("COLON"),
+            self.parse_type_definition(),
+            self.cocokkan("SEMICOLON"),
+        ])
 
     def parse_identifier_list(self):
         # identifier-list => IDENTIFIER (COMMA IDENTIFIER)*
-        node = NodePohonParsing("<identifier-list>")
-        node.tambah_anak(self.cocokkan("IDENTIFIER"))
-        while self.token_sekarang and self.token_sekarang.tipe == "COMMA":
-            node.tambah_anak(self.cocokkan("COMMA"))
-            node.tambah_anak(self.cocokkan("IDENTIFIER"))
+        return _node(IdentifierListNode, [
+            self.cocokkan("IDENTIFIER"),
+            self.parse_tail(IdentifierListTailNode, self.langkah_identifier_list),
+        ])
 
-        return node
+    def langkah_identifier_list(self):
+        if self.cek("COMMA"):
+            return [self.cocokkan("COMMA"), self.cocokkan("IDENTIFIER")]
+        return None
 
-    def parse_type(self):
-        # type => KEYWORD(integer|real|boolean|char) atau array-type
-        node = NodePohonParsing("<type>")
-        if self.token_sekarang and self.token_sekarang.tipe == "KEYWORD":
-            if self.token_sekarang.nilai in ["integer", "real", "boolean", "char"]:
-                node.tambah_anak(self.cocokkan("KEYWORD"))
-            elif self.token_sekarang.nilai == "larik":
-                node.tambah_anak(self.parse_array_type())
-            else:
-                raise SyntaxError(f"error: tipe data tidak valid: {self.token_sekarang.nilai}")
-        elif self.token_sekarang and self.token_sekarang.tipe == "IDENTIFIER":
-            # custom type
-            node.tambah_anak(self.cocokkan("IDENTIFIER"))
-        else:
-            raise SyntaxError(f"error: tipe data tidak valid")
+    # Tipe
 
-        return node
+    def parse_type_definition(self):
+        # type-definition => type | array-type | record-type
+        # (array-type sudah tercakup oleh type)
+        if self.cek_keyword("rekaman"):
+            return _node(TypeDefinitionNode, [self.parse_record_type()])
+        return _node(TypeDefinitionNode, [self.parse_type()])
+
+    def parse_type(self):
+        # type => KEYWORD(integer|real|boolean|char) | array-type | IDENTIFIER
+        i = self.posisi
+        if i < self.n:
+            tipe = self.tipe[i]
+            if tipe == "KEYWORD":
+                if self.nilai[i] in TIPE_DASAR:
+                    self.posisi = i + 1
+                    return _node(TypeNode, [self.tokens[i]])
+                if self.nilai[i] == "larik":
+                    return _node(TypeNode, [self.parse_array_type()])
+            elif tipe == "IDENTIFIER":
+                self.posisi = i + 1
+                return _node(TypeNode, [self.tokens[i]])
+        raise SyntaxError(f"error: tipe data tidak valid di posisi {i}")
 
     def parse_array_type(self):
         # array-type => KEYWORD(larik) LBRACKET range RBRACKET KEYWORD(dari) type
-        node = NodePohonParsing("<array-type>")
-        node.tambah_anak(self.cocokkan("KEYWORD", "larik"))
-        node.tambah_anak(self.cocokkan("LBRACKET"))
-        node.tambah_anak(self.parse_range())
-        node.tambah_anak(self.cocokkan("RBRACKET"))
-        node.tambah_anak(self.cocokkan("KEYWORD", "dari"))
-        node.tambah_anak(self.parse_type())
-
-        return node
+        return _node(ArrayTypeNode, [
+            self.cocokkan("KEYWORD", "larik"),
+            self.cocokkan("LBRACKET"),
+            self.parse_range(),
+            self.cocokkan("RBRACKET"),
+            self.cocokkan("KEYWORD", "dari"),
+            self.parse_type(),
+        ])
 
     def parse_range(self):
-        # range => expression RANGE_OPERATOR(..) expression
-        node = NodePohonParsing("<range>")
-        node.tambah_anak(self.parse_expression())
-        node.tambah_anak(self.cocokkan("RANGE_OPERATOR"))
-        node.tambah_anak(self.parse_expression())
-
-        return node
+        # range => expression RANGE_OPERATOR expression
+        return _node(RangeNode, [
+            self.parse_expression(),
+            self.cocokkan("RANGE_OPERATOR"),
+            self.parse_expression(),
+        ])
+
+    def parse_record_type(self):
+        # record-type => KEYWORD(rekaman) field-list KEYWORD(selesai)
+        return _node(RecordTypeNode, [
+            self.cocokkan("KEYWORD", "rekaman"),
+            self.parse_field_list(),
+            self.cocokkan("KEYWORD", "selesai"),
+        ])
+
+    def parse_field_list(self):
+        # field-list => identifier-list COLON type-definition (SEMICOLON field-list)?
+        children = [
+            self.parse_identifier_list(),
+            self.cocokkan("COLON"),
+            self.parse_type_definition(),
+        ]
+        self.cek_akhir()
+        mulai = self.posisi
+        tail = []
+        if self.cek("SEMICOLON"):
+            self.posisi = mulai + 1
+            try:
+                tail = [self.tokens[mulai], self.parse_field_list()]
+            except SyntaxError:
+                self.posisi = mulai
+        children.append(_node(FieldListTailNode, tail))
+        return _node(FieldListNode, children)
+
+    # Subprogram
 
     def parse_subprogram_declaration(self):
-        # subprogram-declaration => procedure-declaration atau function-declaration
-        node = NodePohonParsing("<subprogram-declaration>")
-        if self.token_sekarang.nilai == "prosedur":
-            node.tambah_anak(self.parse_procedure_declaration())
-        elif self.token_sekarang.nilai == "fungsi":
-            node.tambah_anak(self.parse_function_declaration())
-        else:
-            raise SyntaxError(f"error: deklarasi subprogram tidak valid")
-
-        return node
+        # subprogram-declaration => procedure-declaration | function-declaration
+        if self.cek_keyword("prosedur"):
+            return _node(SubprogramDeclarationNode, [self.parse_procedure_declaration()])
+        if self.cek_keyword("fungsi"):
+            return _node(SubprogramDeclarationNode, [self.parse_function_declaration()])
+        raise SyntaxError(f"error: deklarasi subprogram tidak valid di posisi {self.posisi}")
 
     def parse_procedure_declaration(self):
         # procedure-declaration => KEYWORD(prosedur) IDENTIFIER (formal-parameter-list)? SEMICOLON block SEMICOLON
-        node = NodePohonParsing("<procedure-declaration>")
-        node.tambah_anak(self.cocokkan("KEYWORD", "prosedur"))
-        node.tambah_anak(self.cocokkan("IDENTIFIER"))
-        if self.token_sekarang and self.token_sekarang.tipe == "LPARENTHESIS":
-            node.tambah_anak(self.parse_formal_parameter_list())
-
-        node.tambah_anak(self.cocokkan("SEMICOLON"))
-        node.tambah_anak(self.parse_block())
-        node.tambah_anak(self.cocokkan("SEMICOLON"))
-
-        return node
+        children = [self.cocokkan("KEYWORD", "prosedur"), self.cocokkan("IDENTIFIER")]
+        if self.cek("LPARENTHESIS"):
+            children.append(self.parse_formal_parameter_list())
+        children.append(self.cocokkan("SEMICOLON"))
+        children.append(self.parse_block())
+        children.append(self.cocokkan("SEMICOLON"))
+        return _node(ProcedureDeclarationNode, children)
 
     def parse_function_declaration(self):
         # function-declaration => KEYWORD(fungsi) IDENTIFIER (formal-parameter-list)? COLON type SEMICOLON block SEMICOLON
-        node = NodePohonParsing("<function-declaration>")
-        node.tambah_anak(self.cocokkan("KEYWORD", "fungsi"))
-        node.tambah_anak(self.cocokkan("IDENTIFIER"))
-        if self.token_sekarang and self.token_sekarang.tipe == "LPARENTHESIS":
-            node.tambah_anak(self.parse_formal_parameter_list())
-        node.tambah_anak(self.cocokkan("COLON"))
-        node.tambah_anak(self.parse_type())
-        node.tambah_anak(self.cocokkan("SEMICOLON"))
-        node.tambah_anak(self.parse_block())
-        node.tambah_anak(self.cocokkan("SEMICOLON"))
-
-        return node
+        children = [self.cocokkan("KEYWORD", "fungsi"), self.cocokkan("IDENTIFIER")]
+        if self.cek("LPARENTHESIS"):
+            children.append(self.parse_formal_parameter_list())
+        children.append(self.cocokkan("COLON"))
+        children.append(self.parse_type())
+        children.append(self.cocokkan("SEMICOLON"))
+        children.append(self.parse_block())
+        children.append(self.cocokkan("SEMICOLON"))
+        return _node(FunctionDeclarationNode, children)
 
     def parse_formal_parameter_list(self):
-        # formal-parameter-list => LPARENTHESIS parameter-group (SEMICOLON parameter-group)* RPARENTHESIS
-        node = NodePohonParsing("<formal-parameter-list>")
-        node.tambah_anak(self.cocokkan("LPARENTHESIS"))
-        node.tambah_anak(self.parse_parameter_group())
-
-        while self.token_sekarang and self.token_sekarang.tipe == "SEMICOLON":
-            # simpan posisi untuk backtrack
-            posisi_simpan = self.posisi
-            self.maju()
-
-            # cek apakah ada parameter group berikutnya atau sudah closing parenthesis
-            if self.token_sekarang and self.token_sekarang.tipe == "RPARENTHESIS":
-                # backtrack
-                self.posisi = posisi_simpan
-                self.token_sekarang = self.tokens[self.posisi]
-                break
-            else:
-                # backtrack lalu parse sebagai bagian dari parameter group
-                self.posisi = posisi_simpan
-                self.token_sekarang = self.tokens[self.posisi]
-                node.tambah_anak(self.cocokkan("SEMICOLON"))
-                node.tambah_anak(self.parse_parameter_group())
-        node.tambah_anak(self.cocokkan("RPARENTHESIS"))
-
-        return node
+        # formal-parameter-list => LPARENTHESIS parameter-group (SEMICOLON parameter-group)* (SEMICOLON)? RPARENTHESIS
+        return _node(FormalParameterListNode, [
+            self.cocokkan("LPARENTHESIS"),
+            self.parse_parameter_group(),
+            self.parse_tail(ParameterGroupTailNode, self.langkah_parameter_group, semicolon=True),
+            self.cocokkan("RPARENTHESIS"),
+        ])
+
+    def langkah_parameter_group(self):
+        if self.cek("SEMICOLON"):
+            return [self.cocokkan("SEMICOLON"), self.parse_parameter_group()]
+        return None
 
     def parse_parameter_group(self):
         # parameter-group => (KEYWORD(variabel))? identifier-list COLON type
-        node = NodePohonParsing("<parameter-group>")
-        if self.token_sekarang and self.token_sekarang.tipe == "KEYWORD" and self.token_sekarang.nilai == "variabel":
-            node.tambah_anak(self.cocokkan("KEYWORD", "variabel"))
-        node.tambah_anak(self.parse_identifier_list())
-        node.tambah_anak(self.cocokkan("COLON"))
-        node.tambah_anak(self.parse_type())
-
-        return node
+        self.cek_akhir()
+        modifier = []
+        if self.cek_keyword("variabel"):
+            modifier.append(self.cocokkan("KEYWORD", "variabel"))
+        return _node(ParameterGroupNode, [
+            _node(ParameterModifierNode, modifier),
+            self.parse_identifier_list(),
+            self.cocokkan("COLON"),
+            self.parse_type(),
+        ])
 
     def parse_block(self):
         # block => declaration-part compound-statement
-        node = NodePohonParsing("<block>")
-        node.tambah_anak(self.parse_declaration_part())
-        node.tambah_anak(self.parse_compound_statement())
+        return _node(BlockNode, [self.parse_declaration_part(), self.parse_compound_statement()])
 
-        return node
+    # Statement
 
     def parse_compound_statement(self):
         # compound-statement => KEYWORD(mulai) statement-list KEYWORD(selesai)
-        node = NodePohonParsing("<compound-statement>")
-        node.tambah_anak(self.cocokkan("KEYWORD", "mulai"))
-        node.tambah_anak(self.parse_statement_list())
-        node.tambah_anak(self.cocokkan("KEYWORD", "selesai"))
-
-        return node
+        return _node(CompoundStatementNode, [
+            self.cocokkan("KEYWORD", "mulai"),
+            self.parse_statement_list(),
+            self.cocokkan("KEYWORD", "selesai"),
+        ])
 
     def parse_statement_list(self):
         # statement-list => statement (SEMICOLON statement)*
-        # trailing semicolon sebelum selesai diizinkan dengan empty statement
-        node = NodePohonParsing("<statement-list>")
-        node.tambah_anak(self.parse_statement())
+        return _node(StatementListNode, [
+            self.parse_statement(),
+            self.parse_tail(StatementListTailNode, self.langkah_statement_list),
+        ])
 
-        while self.token_sekarang and self.token_sekarang.tipe == "SEMICOLON":
-            node.tambah_anak(self.cocokkan("SEMICOLON"))
-
-            # cek apakah ada statement berikutnya atau sudah end
-            if self.token_sekarang and (self.token_sekarang.tipe == "KEYWORD" and self.token_sekarang.nilai == "selesai"):
-                # tambahkan empty statement untuk trailing semicolon
-                node.tambah_anak(NodePohonParsing("<empty-statement>"))
-                break
-            elif self.token_sekarang:
-                # ada statement berikutnya
-                node.tambah_anak(self.parse_statement())
-            else:
-                # end of tokens
-                break
-
-        return node
+    def langkah_statement_list(self):
+        if self.cek("SEMICOLON"):
+            return [self.cocokkan("SEMICOLON"), self.parse_statement()]
+        return None
 
     def parse_statement(self):
-        # statement bisa berupa assignment, if, while, for, procedure-call, compound, repeat, atau empty
-        if not self.token_sekarang:
-            return NodePohonParsing("<empty-statement>")
-        if self.token_sekarang.tipe == "KEYWORD":
-            if self.token_sekarang.nilai == "jika":
-                return self.parse_if_statement()
-            elif self.token_sekarang.nilai == "selama":
-                return self.parse_while_statement()
-            elif self.token_sekarang.nilai == "untuk":
-                return self.parse_for_statement()
-            elif self.token_sekarang.nilai == "mulai":
-                return self.parse_compound_statement()
-            elif self.token_sekarang.nilai == "ulangi":
-                return self.parse_repeat_statement()
-            elif self.token_sekarang.nilai == "kasus":
-                return self.parse_case_statement()
-
-        if self.token_sekarang.tipe == "IDENTIFIER":
-            # bisa assignment atau procedure call
-            # cek token berikutnya
-            if self.posisi + 1 < len(self.tokens):
-                token_berikut = self.tokens[self.posisi + 1]
-                if token_berikut.tipe == "ASSIGN_OPERATOR":
-                    return self.parse_assignment_statement()
-                elif token_berikut.tipe == "LPARENTHESIS" or token_berikut.tipe == "SEMICOLON" or (token_berikut.tipe == "KEYWORD" and token_berikut.nilai == "selesai"):
-                    return self.parse_procedure_call()
-            else:
-                return self.parse_procedure_call()
-
-        # empty statement
-        return NodePohonParsing("<empty-statement>")
+        # statement => assignment | if | while | for | repeat | case | compound | expression | empty
+        # statement yang gagal diparse jatuh ke alternatif berikutnya, terakhir
+        # empty-statement (tanpa token)
+        self.cek_akhir()
+        mulai = self.posisi
+        tipe = self.tipe[mulai]
+        if tipe == "KEYWORD":
+            cabang = self.statement_keyword.get(self.nilai[mulai])
+            if cabang is not None:
+                try:
+                    return _node(StatementNode, [cabang()])
+                except SyntaxError:
+                    self.posisi = mulai
+                return _node(StatementNode, [_node(EmptyStatementNode, [])])
+        elif tipe == "IDENTIFIER":
+            try:
+                return _node(StatementNode, [self.parse_assignment_statement()])
+            except SyntaxError:
+                self.posisi = mulai
+        if self.awal_expression():
+            try:
+                return _node(StatementNode, [_node(ExpressionStatementNode, [self.parse_expression()])])
+            except SyntaxError:
+                self.posisi = mulai
+        return _node(StatementNode, [_node(EmptyStatementNode, [])])
 
     def parse_assignment_statement(self):
-        # assignment-statement => IDENTIFIER ASSIGN_OPERATOR expression
-        node = NodePohonParsing("<assignment-statement>")
-
-        node.tambah_anak(self.cocokkan("IDENTIFIER"))
-        node.tambah_anak(self.cocokkan("ASSIGN_OPERATOR"))
-        node.tambah_anak(self.parse_expression())
-
-        return node
+        # assignment-statement => (IDENTIFIER | field-access) ASSIGN_OPERATOR expression
+        if self.cek("ASSIGN_OPERATOR", offset=1):
+            target = self.cocokkan("IDENTIFIER")
+        else:
+            target = self.parse_field_access()
+        return _node(AssignmentStatementNode, [
+            target,
+            self.cocokkan("ASSIGN_OPERATOR"),
+            self.parse_expression(),
+        ])
 
     def parse_if_statement(self):
         # if-statement => KEYWORD(jika) expression KEYWORD(maka) statement (KEYWORD(selain-itu) statement)?
-        node = NodePohonParsing("<if-statement>")
-        node.tambah_anak(self.cocokkan("KEYWORD", "jika"))
-        node.tambah_anak(self.parse_expression())
-        node.tambah_anak(self.cocokkan("KEYWORD", "maka"))
-        node.tambah_anak(self.parse_statement())
-        if self.token_sekarang and self.token_sekarang.tipe == "KEYWORD" and self.token_sekarang.nilai == "selain-itu":
-            node.tambah_anak(self.cocokkan("KEYWORD", "selain-itu"))
-            node.tambah_anak(self.parse_statement())
-
-        return node
+        children = [
+            self.cocokkan("KEYWORD", "jika"),
+            self.parse_expression(),
+            self.cocokkan("KEYWORD", "maka"),
+            self.parse_statement(),
+        ]
+        mulai = self.posisi
+        if self.cek_keyword("selain-itu"):
+            self.posisi = mulai + 1
+            try:
+                children += [self.tokens[mulai], self.parse_statement()]
+            except SyntaxError:
+                self.posisi = mulai
+        return _node(IfStatementNode, children)
 
     def parse_while_statement(self):
         # while-statement => KEYWORD(selama) expression KEYWORD(lakukan) statement
-        node = NodePohonParsing("<while-statement>")
-        node.tambah_anak(self.cocokkan("KEYWORD", "selama"))
-        node.tambah_anak(self.parse_expression())
-        node.tambah_anak(self.cocokkan("KEYWORD", "lakukan"))
-        node.tambah_anak(self.parse_statement())
-
-        return node
+        return _node(WhileStatementNode, [
+            self.cocokkan("KEYWORD", "selama"),
+            self.parse_expression(),
+            self.cocokkan("KEYWORD", "lakukan"),
+            self.parse_statement(),
+        ])
 
     def parse_for_statement(self):
         # for-statement => KEYWORD(untuk) IDENTIFIER ASSIGN_OPERATOR expression (KEYWORD(ke)|KEYWORD(turun-ke)) expression KEYWORD(lakukan) statement
-        node = NodePohonParsing("<for-statement>")
-        node.tambah_anak(self.cocokkan("KEYWORD", "untuk"))
-        node.tambah_anak(self.cocokkan("IDENTIFIER"))
-        node.tambah_anak(self.cocokkan("ASSIGN_OPERATOR"))
-        node.tambah_anak(self.parse_expression())
-
-        if self.token_sekarang and self.token_sekarang.tipe == "KEYWORD":
-            if self.token_sekarang.nilai == "ke":
-                node.tambah_anak(self.cocokkan("KEYWORD", "ke"))
-            elif self.token_sekarang.nilai == "turun-ke":
-                node.tambah_anak(self.cocokkan("KEYWORD", "turun-ke"))
-            else:
-                raise SyntaxError(f"error: diharapkan 'ke' atau 'turun-ke'")
+        children = [
+            self.cocokkan("KEYWORD", "untuk"),
+            self.cocokkan("IDENTIFIER"),
+            self.cocokkan("ASSIGN_OPERATOR"),
+            self.parse_expression(),
+        ]
+        if self.cek_keyword("turun-ke"):
+            children.append(self.cocokkan("KEYWORD", "turun-ke"))
         else:
-            raise SyntaxError(f"error: diharapkan 'ke' atau 'turun-ke'")
-
-        node.tambah_anak(self.parse_expression())
-        node.tambah_anak(self.cocokkan("KEYWORD", "lakukan"))
-        node.tambah_anak(self.parse_statement())
-
-        return node
+            children.append(self.cocokkan("KEYWORD", "ke"))
+        children.append(self.parse_expression())
+        children.append(self.cocokkan("KEYWORD", "lakukan"))
+        children.append(self.parse_statement())
+        return _node(ForStatementNode, children)
 
     def parse_repeat_statement(self):
         # repeat-statement => KEYWORD(ulangi) statement-list KEYWORD(sampai) expression
-        node = NodePohonParsing("<repeat-statement>")
-
-        node.tambah_anak(self.cocokkan("KEYWORD", "ulangi"))
-        node.tambah_anak(self.parse_statement_list())
-        node.tambah_anak(self.cocokkan("KEYWORD", "sampai"))
-        node.tambah_anak(self.parse_expression())
-
-        return node
+        return _node(RepeatStatementNode, [
+            self.cocokkan("KEYWORD", "ulangi"),
+            self.parse_statement_list(),
+            self.cocokkan("KEYWORD", "sampai"),
+            self.parse_expression(),
+        ])
 
     def parse_case_statement(self):
         # case-statement => KEYWORD(kasus) expression KEYWORD(dari) case-list KEYWORD(selesai)
-        node = NodePohonParsing("<case-statement>")
-        node.tambah_anak(self.cocokkan("KEYWORD", "kasus"))
-        node.tambah_anak(self.parse_expression())
-        node.tambah_anak(self.cocokkan("KEYWORD", "dari"))
-
-        # case-list minimal satu
-        while True:
-            # case-element => constant-list COLON statement
-            node.tambah_anak(self.parse_expression())
-            node.tambah_anak(self.cocokkan("COLON"))
-            node.tambah_anak(self.parse_statement())
-
-            # cek apakah ada semicolon untuk case berikutnya
-            if self.token_sekarang and self.token_sekarang.tipe == "SEMICOLON":
-                node.tambah_anak(self.cocokkan("SEMICOLON"))
-
-                # setelah semicolon, cek apakah selesai atau ada case lagi
-                if self.token_sekarang and self.token_sekarang.tipe == "KEYWORD" and self.token_sekarang.nilai == "selesai":
-                    break
-                # jika bukan selesai, lanjut loop untuk parse case element berikutnya
-            else:
-                break
-
-        node.tambah_anak(self.cocokkan("KEYWORD", "selesai"))
-
-        return node
-
-    def parse_procedure_call(self):
-        # procedure-call => IDENTIFIER (LPARENTHESIS parameter-list RPARENTHESIS)?
-        node = NodePohonParsing("<procedure-call>")
-        node.tambah_anak(self.cocokkan("IDENTIFIER"))
-
-        if self.token_sekarang and self.token_sekarang.tipe == "LPARENTHESIS":
-            node.tambah_anak(self.cocokkan("LPARENTHESIS"))
-            node.tambah_anak(self.parse_parameter_list())
-            node.tambah_anak(self.cocokkan("RPARENTHESIS"))
-
-        return node
-
-    def parse_parameter_list(self):
-        # parameter-list => expression (COMMA expression)*
-        node = NodePohonParsing("<parameter-list>")
-        node.tambah_anak(self.parse_expression())
-        while self.token_sekarang and self.token_sekarang.tipe == "COMMA":
-            node.tambah_anak(self.cocokkan("COMMA"))
-            node.tambah_anak(self.parse_expression())
-
-        return node
+        return _node(CaseStatementNode, [
+            self.cocokkan("KEYWORD", "kasus"),
+            self.parse_expression(),
+            self.cocokkan("KEYWORD", "dari"),
+            _node(CaseListNode, [
+                self.parse_case_element(),
+                self.parse_tail(CaseListTailNode, self.langkah_case_list, semicolon=True),
+            ]),
+            self.cocokkan("KEYWORD", "selesai"),
+        ])
+
+    def langkah_case_list(self):
+        if self.cek("SEMICOLON"):
+            return [self.cocokkan("SEMICOLON"), self.parse_case_element()]
+        return None
+
+    def parse_case_element(self):
+        # case-element => expression COLON statement
+        return _node(CaseElementNode, [
+            self.parse_expression(),
+            self.cocokkan("COLON"),
+            self.parse_statement(),
+        ])
+
+    # Expression
 
     def parse_expression(self):
         # expression => simple-expression (relational-operator simple-expression)?
-        node = NodePohonParsing("<expression>")
-        node.tambah_anak(self.parse_simple_expression())
-        if self.token_sekarang and self.token_sekarang.tipe == "RELATIONAL_OPERATOR":
-            node.tambah_anak(self.cocokkan("RELATIONAL_OPERATOR"))
-            node.tambah_anak(self.parse_simple_expression())
-
-        return node
+        children = [self.parse_simple_expression()]
+        mulai = self.posisi
+        if self.cek("RELATIONAL_OPERATOR") and self.nilai[mulai] in RELATIONAL:
+            self.posisi = mulai + 1
+            try:
+                kanan = self.parse_simple_expression()
+                children += [_node(RelationalOperatorNode, [self.tokens[mulai]]), kanan]
+            except SyntaxError:
+                self.posisi = mulai
+        return _node(ExpressionNode, children)
 
     def parse_simple_expression(self):
         # simple-expression => (ARITHMETIC_OPERATOR(+|-))? term (additive-operator term)*
-        node = NodePohonParsing("<simple-expression>")
-
-        if self.token_sekarang and self.token_sekarang.tipe == "ARITHMETIC_OPERATOR" and self.token_sekarang.nilai in ["+", "-"]:
-            node.tambah_anak(self.cocokkan("ARITHMETIC_OPERATOR"))
-
-        node.tambah_anak(self.parse_term())
-        while self.token_sekarang and (
-            (self.token_sekarang.tipe == "ARITHMETIC_OPERATOR" and self.token_sekarang.nilai in ["+", "-"]) or
-            (self.token_sekarang.tipe == "LOGICAL_OPERATOR" and self.token_sekarang.nilai == "atau")
-        ):
-            if self.token_sekarang.tipe == "ARITHMETIC_OPERATOR":
-                node.tambah_anak(self.cocokkan("ARITHMETIC_OPERATOR"))
-            else:
-                node.tambah_anak(self.cocokkan("LOGICAL_OPERATOR"))
-            node.tambah_anak(self.parse_term())
-        return node
+        children = []
+        i = self.posisi
+        if self.cek("ARITHMETIC_OPERATOR") and self.nilai[i] in ("+", "-"):
+            children.append(self.tokens[i])
+            self.posisi = i + 1
+        children.append(self.parse_term())
+        children.append(self.parse_tail(SimpleExpressionTailNode, self.langkah_simple_expression))
+        return _node(SimpleExpressionNode, children)
+
+    def langkah_simple_expression(self):
+        op = self.operator(AdditiveOperatorNode, ADDITIVE)
+        if op is None:
+            return None
+        return [op, self.parse_term()]
 
     def parse_term(self):
         # term => factor (multiplicative-operator factor)*
-        node = NodePohonParsing("<term>")
-        node.tambah_anak(self.parse_factor())
-        while self.token_sekarang and (
-            (self.token_sekarang.tipe == "ARITHMETIC_OPERATOR" and self.token_sekarang.nilai in ["*", "/", "bagi", "mod"]) or
-            (self.token_sekarang.tipe == "LOGICAL_OPERATOR" and self.token_sekarang.nilai == "dan")
-        ):
-            if self.token_sekarang.tipe == "ARITHMETIC_OPERATOR":
-                node.tambah_anak(self.cocokkan("ARITHMETIC_OPERATOR"))
-            else:
-                node.tambah_anak(self.cocokkan("LOGICAL_OPERATOR"))
-
-            node.tambah_anak(self.parse_factor())
+        return _node(TermNode, [
+            self.parse_factor(),
+            self.parse_tail(TermTailNode, self.langkah_term),
+        ])
 
-        return node
+    def langkah_term(self):
+        op = self.operator(MultiplicativeOperatorNode, MULTIPLICATIVE)
+        if op is None:
+            return None
+        return [op, self.parse_factor()]
 
     def parse_factor(self):
-        # factor => IDENTIFIER | NUMBER | STRING_LITERAL | (LPARENTHESIS expression RPARENTHESIS) | LOGICAL_OPERATOR(tidak) factor | function-call
-        node = NodePohonParsing("<factor>")
-        if not self.token_sekarang:
-            raise SyntaxError(f"error: token tidak ditemukan")
-        if self.token_sekarang.tipe == "NUMBER":
-            node.tambah_anak(self.cocokkan("NUMBER"))
-        elif self.token_sekarang.tipe == "STRING_LITERAL":
-            node.tambah_anak(self.cocokkan("STRING_LITERAL"))
-        elif self.token_sekarang.tipe == "LPARENTHESIS":
-            node.tambah_anak(self.cocokkan("LPARENTHESIS"))
-            node.tambah_anak(self.parse_expression())
-            node.tambah_anak(self.cocokkan("RPARENTHESIS"))
-        elif self.token_sekarang.tipe == "LOGICAL_OPERATOR" and self.token_sekarang.nilai == "tidak":
-            node.tambah_anak(self.cocokkan("LOGICAL_OPERATOR"))
-            node.tambah_anak(self.parse_factor())
-        elif self.token_sekarang.tipe == "IDENTIFIER":
-            # bisa identifier biasa atau function call
-            if self.posisi + 1 < len(self.tokens) and self.tokens[self.posisi + 1].tipe == "LPARENTHESIS":
-                node.tambah_anak(self.parse_function_call())
-            else:
-                node.tambah_anak(self.cocokkan("IDENTIFIER"))
-        else:
-            raise SyntaxError(f"error: faktor tidak valid, ditemukan {self.token_sekarang.tipe}({self.token_sekarang.nilai})")
-
-        return node
+        # factor => call | value | LPARENTHESIS expression RPARENTHESIS | LOGICAL_OPERATOR(tidak) factor
+        mulai = self.posisi
+        if mulai < self.n:
+            tipe = self.tipe[mulai]
+            if tipe == "IDENTIFIER" and self.cek("LPARENTHESIS", offset=1):
+                try:
+                    return _node(FactorNode, [self.parse_call()])
+                except SyntaxError:
+                    self.posisi = mulai
+            elif tipe == "LPARENTHESIS":
+                return _node(FactorNode, [
+                    self.cocokkan("LPARENTHESIS"),
+                    self.parse_expression(),
+                    self.cocokkan("RPARENTHESIS"),
+                ])
+            elif tipe == "LOGICAL_OPERATOR" and self.nilai[mulai] == "tidak":
+                self.posisi = mulai + 1
+                return _node(FactorNode, [self.tokens[mulai], self.parse_factor()])
+        return _node(FactorNode, [self.parse_value()])
+
+    def parse_call(self):
+        # call => IDENTIFIER LPARENTHESIS (parameter-list)? RPARENTHESIS
+        children = [self.cocokkan("IDENTIFIER"), self.cocokkan("LPARENTHESIS")]
+        if not self.cek("RPARENTHESIS"):
+            children.append(self.parse_parameter_list())
+        children.append(self.cocokkan("RPARENTHESIS"))
+        return _node(CallNode, children)
 
-    def parse_function_call(self):
-        # function-call => IDENTIFIER LPARENTHESIS (parameter-list)? RPARENTHESIS
-        node = NodePohonParsing("<function-call>")
-        node.tambah_anak(self.cocokkan("IDENTIFIER"))
-        node.tambah_anak(self.cocokkan("LPARENTHESIS"))
-
-        # parameter list opsional
-        if self.token_sekarang and self.token_sekarang.tipe != "RPARENTHESIS":
-            node.tambah_anak(self.parse_parameter_list())
-
-        node.tambah_anak(self.cocokkan("RPARENTHESIS"))
+    def parse_parameter_list(self):
+        # parameter-list => expression (COMMA expression)*
+        return _node(ParameterListNode, [
+            self.parse_expression(),
+            self.parse_tail(ParameterListTailNode, self.langkah_parameter_list),
+        ])
+
+    def langkah_parameter_list(self):
+        if self.cek("COMMA"):
+            return [self.cocokkan("COMMA"), self.parse_expression()]
+        return None
+
+    def parse_value(self):
+        # value => field-access | number | CHAR_LITERAL | STRING_LITERAL | KEYWORD(benar|salah) | IDENTIFIER
+        i = self.posisi
+        if i >= self.n:
+            raise SyntaxError(f"error: token tidak ditemukan, diharapkan nilai, posisi {i}")
+        tipe = self.tipe[i]
+        if tipe == "IDENTIFIER":
+            if self.cek("DOT", offset=1) or self.cek("LBRACKET", offset=1):
+                try:
+                    return _node(ValueNode, [self.parse_field_access()])
+                except SyntaxError:
+                    self.posisi = i
+            self.posisi = i + 1
+            return _node(ValueNode, [self.tokens[i]])
+        if tipe == "NUMBER":
+            if self.cek("DOT", offset=1) and self.cek("NUMBER", offset=2):
+                self.posisi = i + 3
+                return _node(ValueNode, [_node(NumberNode, self.tokens[i:i + 3])])
+            self.posisi = i + 1
+            return _node(ValueNode, [_node(NumberNode, [self.tokens[i]])])
+        if tipe == "CHAR_LITERAL" or tipe == "STRING_LITERAL" or (
+                tipe == "KEYWORD" and self.nilai[i] in ("benar", "salah")):
+            self.posisi = i + 1
+            return _node(ValueNode, [self.tokens[i]])
+        raise SyntaxError(f"error: faktor tidak valid di posisi {i}, ditemukan {self.tipe[i]}({self.nilai[i]})")
+
+    def parse_field_access(self):
+        # field-access => IDENTIFIER (DOT IDENTIFIER | LBRACKET expression RBRACKET) field-access-tail
+        children = [self.cocokkan("IDENTIFIER")]
+        if self.cek("DOT"):
+            children += [self.cocokkan("DOT"), self.cocokkan("IDENTIFIER")]
+        else:
+            children += [self.cocokkan("LBRACKET"), self.parse_expression(), self.cocokkan("RBRACKET")]
+        children.append(self.parse_tail(FieldAccessTailNode, self.langkah_field_access))
+        return _node(FieldAccessNode, children)
 
-        return node
+    def langkah_field_access(self):
+        if self.cek("DOT"):
+            return [self.cocokkan("DOT"), self.cocokkan("IDENTIFIER")]
+        if self.cek("LBRACKET"):
+            return [self.cocokkan("LBRACKET"), self.parse_expression(), self.cocokkan("RBRACKET")]
+        return None
 
     def parse(self):
+        # (True, indeks akhir, ProgramNode) atau (False, 0, None), sama dengan
+        # ProgramNode().parse(tokens, 0) di parser2; indeks akhir < len(tokens)
+        # berarti masih ada token setelah DOT. Program yang terlalu dalam untuk
+        # stack juga dianggap gagal, sehingga compiler.py mengulang dengan
+        # parser2 (yang dibatasi ParseBudget)
+        self.posisi = 0
         try:
             pohon = self.parse_program()
-            if self.token_sekarang is not None:
-                raise SyntaxError(f"error: masih ada token yang tersisa setelah parsing selesai")
-            return pohon
-        except SyntaxError as e:
-            raise e
\ No newline at end of file
+        except (SyntaxError, RecursionError):
+            return False, 0, None
+        return True, self.posisi, pohon
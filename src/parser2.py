@@ -1,30 +1,48 @@
 import sys
 
+from symbols import (NO_CODE, OPEN_TYPES, OTHER_CODE, TYPE_CODES, intern_name, lexeme_code,
+                     register_lexeme, register_type)
+
 # Kelas utama
 
 class Token:
     def __init__(self, tipe, nilai):
+        if tipe == "IDENTIFIER":
+            nilai = intern_name(nilai)
         self.tipe = tipe
         self.nilai = nilai
+        # kode integer untuk pencocokan Terminal (lihat symbols.py)
+        self.kode_tipe = TYPE_CODES.get(tipe, OTHER_CODE)
+        self.kode = lexeme_code(tipe, nilai)
     def __repr__(self):
         return f"{self.tipe}({self.nilai})"
 
 class Terminal:
     def __init__(self, tipe, nilai=None):
+        if nilai is not None and tipe in OPEN_TYPES:
+            raise ValueError(f"Terminal {tipe} tidak dapat dicocokkan per nilai")
         self.tipe = tipe
         self.nilai = nilai
+        self.kode_tipe = register_type(tipe)
+        self.kode = NO_CODE if nilai is None else register_lexeme(nilai)
     def __repr__(self):
         if self.nilai:
             return f"'{self.nilai}'"
         return self.tipe
 
 class ParseErrorContext:
-    def __init__(self):
+    def __init__(self, recover=False):
         self.max_index = -1
         self.expected = None
         self.found = None
         self.rule_name = None
 
+        # mode recovery (panic mode): error yang sudah dipulihkan disimpan di errors
+        self.recover = recover
+        self.errors = []
+        self.recovered = set()
+        self.memo = {}
+
     def report(self, index, expected, found, rule_name):
         if index >= self.max_index:
             self.max_index = index
@@ -32,6 +50,21 @@ class ParseErrorContext:
             self.found = found
             self.rule_name = rule_name
 
+    def commit(self, index, tokens, expected, rule_name):
+        # simpan kegagalan terjauh sebagai satu syntax error, lalu mulai pelacakan baru
+        if self.max_index >= index:
+            self.errors.append((self.max_index, self.expected, self.found, self.rule_name))
+        else:
+            found = tokens[index] if index < len(tokens) else "EOF"
+            self.errors.append((index, expected, found, rule_name))
+        self.recovered.add(index)
+        self.max_index = -1
+        self.expected = None
+        self.found = None
+        self.rule_name = None
+
+_rules_cache = {}
+
 class ParseNode:
     def __init__(self):
         self.name = self.__class__.__name__
@@ -40,56 +73,69 @@ class ParseNode:
     def grammar(self):
         raise NotImplementedError
 
-    def parse(self, tokens, start_idx, error_ctx=None):
-        if error_ctx is None:
-            error_ctx = ParseErrorContext()
-
-        valid_grammars = self.grammar()
-
-        for rule_sequence in valid_grammars:
-            
+    def rules(self):
+        # grammar() statis: dibangun sekali per kelas sehingga objek Terminal
+        # (beserta kode integernya) dipakai ulang di setiap percobaan parse
+        cls = self.__class__
+        rules = _rules_cache.get(cls)
+        if rules is None:
+            rules = _rules_cache[cls] = self.grammar()
+        return rules
+
+    def parse(self, tokens, start_idx, error_ctx=None, monitor=None):
+        # error_ctx None: tanpa pencatatan error sama sekali (lihat parse_tokens).
+        # monitor (ParseBudget, ParseProfiler) menerima hook per node dan per
+        # alternatif untuk parse ini saja; tanpa monitor tidak ada overhead selain
+        # pengecekan None
+        if monitor is not None:
+            monitor.enter_node(self, start_idx)
+
+        for rule_sequence in self.rules():
+            if monitor is not None:
+                monitor.enter_alt(self, start_idx)
             curr_idx = start_idx
             temp_children = []
             rule_failed = False
 
             for element in rule_sequence:
-                
                 if curr_idx >= len(tokens):
-                    if rule_sequence == []: 
-                        break
-                    error_ctx.report(curr_idx, element, "EOF", self.name)
+                    if error_ctx is not None:
+                        error_ctx.report(curr_idx, element, "EOF", self.name)
                     rule_failed = True
                     break
 
                 current_token = tokens[curr_idx]
 
                 if isinstance(element, Terminal):
-                    match_type = (element.tipe == current_token.tipe)
-                    match_value = (element.nilai is None) or (element.nilai == current_token.nilai)
-
-                    if match_type and match_value:
+                    if element.kode_tipe == current_token.kode_tipe and (element.kode == NO_CODE or element.kode == current_token.kode):
                         temp_children.append(current_token)
                         curr_idx += 1
                     else:
-                        error_ctx.report(curr_idx, element, current_token, self.name)
+                        if error_ctx is not None:
+                            error_ctx.report(curr_idx, element, current_token, self.name)
                         rule_failed = True
                         break
 
-                elif issubclass(element, ParseNode):
+                else:
                     child_node = element()
-                    is_success, next_idx = child_node.parse(tokens, curr_idx, error_ctx)
-                    
+                    is_success, next_idx = child_node.parse(tokens, curr_idx, error_ctx, monitor)
                     if is_success:
                         temp_children.append(child_node)
                         curr_idx = next_idx
                     else:
                         rule_failed = True
                         break
-            
+
+            if monitor is not None:
+                monitor.exit_alt(self, not rule_failed, curr_idx - start_idx)
             if not rule_failed:
                 self.children = temp_children
+                if monitor is not None:
+                    monitor.exit_node(self, True, start_idx)
                 return True, curr_idx
 
+        if monitor is not None:
+            monitor.exit_node(self, False, start_idx)
         return False, start_idx
 
     def __repr__(self):
@@ -120,6 +166,155 @@ class ParseNode:
                 
         return hasil
 
+# Batas parse untuk input tidak tepercaya (server, compiler): backtracking
+# parser2 bisa eksponensial (mis. kurung bersarang: setiap ExpressionNode
+# mem-parse SimpleExpressionNode dua kali), dan program yang sangat dalam
+# memakan stack. ParseBudget adalah monitor ParseNode.parse (lihat parse_tokens)
+# yang menghitung percobaan alternatif (dibatasi rata-rata per token), kedalaman
+# sarang (node tail list tidak dihitung, lihat _is_list_tail), dan node yang
+# berhasil diparse (termasuk yang kemudian dibuang oleh backtracking); begitu
+# salah satunya terlampaui, parse berhenti dengan ParseBudgetExceeded. Monitor lain: ParseProfiler di parse_profiler.py.
+
+DEFAULT_MAX_ATTEMPTS_PER_TOKEN = 1000
+DEFAULT_MAX_DEPTH = 500
+DEFAULT_MAX_NODES = 5_000_000
+
+_tail_cache = {}
+
+def _is_list_tail(node):
+    # tail list right-recursive (StatementListTailNode, TermTailNode, ...): salah
+    # satu alternatifnya diakhiri kelasnya sendiri. Rantai tail sepanjang jumlah
+    # elemen list, bukan sarang program, sehingga tidak dihitung sebagai kedalaman
+    cls = node.__class__
+    tail = _tail_cache.get(cls)
+    if tail is None:
+        tail = _tail_cache[cls] = any(seq and seq[-1] is cls for seq in node.rules())
+    return tail
+
+class ParseBudgetExceeded(Exception):
+    def __init__(self, kind, limit, index):
+        self.kind = kind
+        self.limit = limit
+        self.index = index
+        super().__init__(f"batas {kind} terlampaui ({limit}) di token index {index}")
+
+class ParseBudget:
+    def __init__(self, max_attempts_per_token=DEFAULT_MAX_ATTEMPTS_PER_TOKEN,
+                 max_depth=DEFAULT_MAX_DEPTH, max_nodes=DEFAULT_MAX_NODES):
+        self.max_attempts_per_token = max_attempts_per_token
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.reset(0)
+
+    @classmethod
+    def from_spec(cls, spec):
+        # "ATTEMPTS,DEPTH,NODES"; bagian kosong memakai default
+        values = [DEFAULT_MAX_ATTEMPTS_PER_TOKEN, DEFAULT_MAX_DEPTH, DEFAULT_MAX_NODES]
+        parts = spec.split(",")
+        if len(parts) > 3:
+            raise ValueError(f"budget parse tidak valid: {spec}")
+        for i, part in enumerate(parts):
+            if part.strip():
+                try:
+                    values[i] = int(part)
+                except ValueError:
+                    raise ValueError(f"budget parse tidak valid: {spec}") from None
+                if values[i] < 1:
+                    raise ValueError(f"budget parse tidak valid: {spec} (setiap batas minimal 1)")
+        return cls(*values)
+
+    def reset(self, token_count):
+        self.max_attempts = self.max_attempts_per_token * max(token_count, 1)
+        self.attempts = 0
+        self.depth = 0
+        self.nodes = 0
+
+    def enter_node(self, node, start_idx):
+        if not _is_list_tail(node):
+            self.depth += 1
+            if self.depth > self.max_depth:
+                raise ParseBudgetExceeded("kedalaman parse", self.max_depth, start_idx)
+
+    def enter_alt(self, node, start_idx):
+        self.attempts += 1
+        if self.attempts > self.max_attempts:
+            raise ParseBudgetExceeded("percobaan rule", self.max_attempts, start_idx)
+
+    def exit_alt(self, node, success, consumed):
+        pass
+
+    def exit_node(self, node, success, start_idx):
+        if not _is_list_tail(node):
+            self.depth -= 1
+        if success:
+            self.nodes += 1
+            if self.nodes > self.max_nodes:
+                raise ParseBudgetExceeded("node CST", self.max_nodes, start_idx)
+
+# Panic-mode recovery
+
+SYNC_OPEN = ("mulai", "kasus", "rekaman", "ulangi")
+SYNC_CLOSE = ("selesai", "sampai")
+
+def _is_keyword(token, values):
+    return token.tipe == "KEYWORD" and token.nilai in values
+
+def _skip_to_sync(tokens, idx, stop):
+    # lompati token sampai SEMICOLON, penutup blok, atau keyword di stop (di luar blok bersarang)
+    depth = 0
+    while idx < len(tokens):
+        token = tokens[idx]
+        if token.tipe == "SEMICOLON" and depth == 0:
+            return idx
+        if token.tipe == "KEYWORD":
+            if depth == 0 and token.nilai in stop:
+                return idx
+            if token.nilai in SYNC_OPEN:
+                depth += 1
+            elif token.nilai in SYNC_CLOSE:
+                if depth == 0:
+                    return idx
+                depth -= 1
+        idx += 1
+    return idx
+
+class ErrorNode(ParseNode):
+    # hanya dibuat oleh recovery, berisi token yang dilewati
+    def __init__(self, skipped=None):
+        super().__init__()
+        self.children = skipped if skipped is not None else []
+
+    def grammar(self):
+        return []
+
+class RecoveryPoint(ParseNode):
+    # node list/tail yang dapat memulihkan diri: jika token berikutnya bukan
+    # anggota follow, catat error, lompat ke token sinkronisasi (resync), lanjutkan.
+    # Hasil per (kelas, posisi) di-memo sehingga backtracking tidak mengulang recovery.
+    follow = ()
+
+    def parse(self, tokens, start_idx, error_ctx=None, monitor=None):
+        if error_ctx is None or not error_ctx.recover:
+            return super().parse(tokens, start_idx, error_ctx, monitor)
+
+        key = (self.__class__, start_idx)
+        if key in error_ctx.memo:
+            is_success, end_idx, self.children = error_ctx.memo[key]
+            return is_success, end_idx
+
+        is_success, end_idx = super().parse(tokens, start_idx, error_ctx, monitor)
+        if (is_success and end_idx < len(tokens)
+                and not _is_keyword(tokens[end_idx], self.follow)
+                and end_idx not in error_ctx.recovered):
+            error_ctx.commit(end_idx, tokens, Terminal("KEYWORD", self.follow[0]), self.name)
+            end_idx = self.resync(tokens, end_idx, error_ctx, monitor)
+
+        error_ctx.memo[key] = (is_success, end_idx, self.children)
+        return is_success, end_idx
+
+    def resync(self, tokens, idx, error_ctx, monitor=None):
+        raise NotImplementedError
+
 class NumberNode(ParseNode):
     def grammar(self):
         return [
@@ -337,13 +532,24 @@ class StatementNode(ParseNode):
             [EmptyStatementNode]
         ]
 
-class StatementListTailNode(ParseNode):
+class StatementListTailNode(RecoveryPoint):
+    follow = ("selesai", "sampai")
+
     def grammar(self):
         return [
             [Terminal("SEMICOLON"), StatementNode, StatementListTailNode],
             []
         ]
 
+    def resync(self, tokens, idx, error_ctx, monitor=None):
+        sync_idx = _skip_to_sync(tokens, idx, ("prosedur", "fungsi"))
+        self.children = [ErrorNode(tokens[idx:sync_idx])]
+        if sync_idx < len(tokens) and tokens[sync_idx].tipe == "SEMICOLON":
+            tail = StatementListTailNode()
+            _, sync_idx = tail.parse(tokens, sync_idx, error_ctx, monitor)
+            self.children.append(tail)
+        return sync_idx
+
 class StatementListNode(ParseNode):
     def grammar(self):
         return [
@@ -386,13 +592,27 @@ class IdentifierListNode(ParseNode):
             [Terminal("IDENTIFIER"), IdentifierListTailNode]
         ]
 
-class VarItemTailNode(ParseNode):
+class VarItemTailNode(RecoveryPoint):
+    follow = ("variabel", "prosedur", "fungsi", "mulai")
+
     def grammar(self):
         return [
             [VarItemNode, VarItemTailNode],
             []
         ]
 
+    def resync(self, tokens, idx, error_ctx, monitor=None):
+        sync_idx = _skip_to_sync(tokens, idx, self.follow + ("konstanta", "tipe"))
+        if sync_idx < len(tokens) and tokens[sync_idx].tipe == "SEMICOLON":
+            sync_idx += 1
+            tail = VarItemTailNode()
+            self.children = [ErrorNode(tokens[idx:sync_idx])]
+            _, sync_idx = tail.parse(tokens, sync_idx, error_ctx, monitor)
+            self.children.append(tail)
+        else:
+            self.children = [ErrorNode(tokens[idx:sync_idx])]
+        return sync_idx
+
 class VarItemNode(ParseNode):
     def grammar(self):
         return [
@@ -545,13 +765,44 @@ class SubprogramDeclarationNode(ParseNode):
             [FunctionDeclarationNode]
         ]
 
-class SubprogramSectionNode(ParseNode):
+class SubprogramSectionNode(RecoveryPoint):
+    follow = ("mulai",)
+
     def grammar(self):
         return [
             [SubprogramDeclarationNode, SubprogramSectionNode],
             []
         ]
 
+    def resync(self, tokens, idx, error_ctx, monitor=None):
+        # lompat ke prosedur/fungsi berikutnya, atau ke 'mulai' badan subprogram:
+        # jika 'mulai ... selesai ;' berhasil diparse, subprogram dianggap selesai
+        sync_idx = idx + 1
+        skipped = None
+        while sync_idx < len(tokens):
+            token = tokens[sync_idx]
+            if _is_keyword(token, ("prosedur", "fungsi")):
+                break
+            if _is_keyword(token, ("mulai",)):
+                body = CompoundStatementNode()
+                is_success, body_end = body.parse(tokens, sync_idx, error_ctx, monitor)
+                if not (is_success and body_end < len(tokens)
+                        and tokens[body_end].tipe == "SEMICOLON"):
+                    # badan program utama: berhenti di sini
+                    self.children = [ErrorNode(tokens[idx:sync_idx])]
+                    return sync_idx
+                skipped = tokens[idx:sync_idx] + [body, tokens[body_end]]
+                sync_idx = body_end + 1
+                break
+            sync_idx += 1
+
+        if skipped is None:
+            skipped = tokens[idx:sync_idx]
+        section = SubprogramSectionNode()
+        _, sync_idx = section.parse(tokens, sync_idx, error_ctx, monitor)
+        self.children = [ErrorNode(skipped), section]
+        return sync_idx
+
 class DeclarationPartNode(ParseNode):
     def grammar(self):
         return [
@@ -569,3 +820,37 @@ class ProgramNode(ParseNode):
         return [
             [ProgramHeaderNode, DeclarationPartNode, CompoundStatementNode, Terminal("DOT")]
         ]
+
+# Semua grammar dibangun sekali saat import, sehingga kode tipe/lexeme setiap
+# Terminal (symbols.py) sudah ada sebelum Token pertama dibuat
+
+def _register_grammar(cls):
+    for sub in cls.__subclasses__():
+        if "grammar" in sub.__dict__:
+            sub().rules()
+        _register_grammar(sub)
+
+_register_grammar(ParseNode)
+
+# Parse dua fase: program yang benar (kasus umum) diparse tanpa ParseErrorContext
+# sehingga kegagalan pada backtracking normal tidak dicatat sama sekali. Hanya jika
+# parse gagal, token diparse ulang dengan ParseErrorContext untuk mendapatkan
+# kegagalan terjauh yang ditampilkan compiler/server. Mode recovery langsung
+# memakai ParseErrorContext karena recovery bekerja selama parse.
+
+def parse_tokens(tokens, root_cls=ProgramNode, recover=False, budget=None):
+    # (root, berhasil?, indeks akhir, error_ctx); dengan budget, setiap fase
+    # dibatasi budget yang sama dan bisa melempar ParseBudgetExceeded
+    if not recover:
+        if budget is not None:
+            budget.reset(len(tokens))
+        root = root_cls()
+        success, end_idx = root.parse(tokens, 0, None, budget)
+        if success:
+            return root, success, end_idx, ParseErrorContext()
+    if budget is not None:
+        budget.reset(len(tokens))
+    root = root_cls()
+    error_ctx = ParseErrorContext(recover=recover)
+    success, end_idx = root.parse(tokens, 0, error_ctx, budget)
+    return root, success, end_idx, error_ctx
@@ -0,0 +1,248 @@
+# Backend lexer berbasis satu master regex yang dibangkitkan dari dfa_rules.json.
+#
+# Tabel transisi ASCII tiap state dihitung di dfa_edges.py (lexer.step(), jadi
+# prioritas karakter eksak > kelas > any_not_ sama dengan lexer DFA). Dari state awal
+# setiap state final menjadi satu named group: jalur dari S0, loop state final
+# (kuantifier posesif, karena DFA tidak pernah backtrack), lalu negative lookahead
+# untuk transisi keluar lainnya. Komentar dan string dikenali sebagai "cincin"
+# dua state:  (?:A|B E)*+ B D  (mis. (?:[^*]|\*[^)])*+\*\) untuk (* ... *)).
+#
+# Token yang masuk komentar dari tengah token, misalnya '(' pada '(*', meninggalkan
+# karakternya di current_token lexer DFA; perilaku itu ditiru lewat "carry".
+#
+# Regex hanya menangani jalur sukses untuk teks ASCII di luar komentar/string.
+# Jika scanner gagal di posisi mana pun (karakter tidak valid, komentar/string
+# tidak tertutup, huruf non-ASCII), atau bentuk DFA tidak dikenali generator,
+# seluruh input di-lex ulang dengan tokenize() DFA sehingga hasil dan error
+# selalu identik dengan lexer DFA.
+#
+#   python src/regex_lexer.py [--show]     # cetak master regex
+
+import re
+import sys
+
+from lexer import load_dfa_rules, in_comment_state, keyword_table, tokenize as dfa_tokenize
+from dfa_edges import ASCII, CharSet, EdgeTable, UnsupportedDFA
+
+TOKEN, CARRY, SKIP = 0, 1, 2
+
+def _char(c):
+    if c.isprintable() and c != " ":
+        return re.escape(c)
+    return f"\\x{ord(c):02x}"
+
+class _CharSet(CharSet):
+    def regex(self):
+        if self.other:
+            rest = [c for c in ASCII if c not in self.chars]
+            if not rest:
+                return r"[\s\S]"
+            return "[^" + _ranges(rest) + "]"
+        chars = sorted(self.chars)
+        if len(chars) == 1:
+            return _char(chars[0])
+        return "[" + _ranges(chars) + "]"
+
+def _ranges(chars):
+    # "0123456789" -> "0-9"
+    out = []
+    i = 0
+    while i < len(chars):
+        j = i
+        while j + 1 < len(chars) and ord(chars[j + 1]) == ord(chars[j]) + 1:
+            j += 1
+        if j - i >= 2:
+            out.append(f"{_char(chars[i])}-{_char(chars[j])}")
+        else:
+            out.extend(_char(c) for c in chars[i:j + 1])
+        i = j + 1
+    return "".join(out)
+
+class _Builder(EdgeTable):
+    charset = _CharSet
+
+    def __init__(self, dfa):
+        super().__init__(dfa)
+        self.alternatives = []      # (pola, jenis, tipe token)
+
+    def ring(self, entry):
+        # pola dari state komentar `entry` sampai kembali ke state awal
+        edges = dict(self.edges(entry))
+        loop = edges.pop(entry, None)
+        piece = [loop.regex()] if loop else []
+        if len(edges) != 1:
+            raise UnsupportedDFA(f"bentuk komentar {entry}")
+        (target, exit_set), = edges.items()
+        if target == self.start:
+            return f"(?:{'|'.join(piece)})*+{exit_set.regex()}" if piece else exit_set.regex()
+
+        wait = dict(self.edges(target))
+        close = wait.pop(self.start, None)
+        back = wait.pop(entry, None)
+        if close is None or wait:
+            raise UnsupportedDFA(f"bentuk komentar {target}")
+        if back is not None:
+            piece.append(exit_set.regex() + back.regex())
+        return f"(?:{'|'.join(piece)})*+{exit_set.regex()}{close.regex()}"
+
+    def walk(self, state, prefix, visited):
+        if state in visited:
+            raise UnsupportedDFA(f"siklus di {state}")
+        visited = visited | {state}
+        edges = dict(self.edges(state))
+        loop = edges.pop(state, None)
+        if loop is not None:
+            prefix += f"{loop.regex()}*+"
+
+        stop = self.charset()
+        for target, chars in edges.items():
+            stop = stop.union(chars)
+            if target == self.start:
+                raise UnsupportedDFA(f"{state} kembali ke state awal")
+            if in_comment_state(target):
+                if state == self.start:
+                    self.alternatives.append((chars.regex() + self.ring(target), SKIP, None))
+                else:
+                    self.alternatives.append((f"(?P<carry>{prefix}){chars.regex()}{self.ring(target)}", CARRY, None))
+                continue
+            back = self.edges(target).get(state)
+            if back is not None:
+                self.quoted(state, target, prefix, loop, chars, back)
+                continue
+            self.walk(target, prefix + chars.regex(), visited)
+
+        if state in self.final_states:
+            pattern = prefix
+            if stop.chars or stop.other:
+                pattern += f"(?!{stop.regex()})"
+            self.alternatives.append((pattern, TOKEN, self.final_states[state]))
+
+    def quoted(self, inner, closing, prefix, loop, exit_set, back):
+        # dua state yang saling menunjuk, mis. string: '...' dengan '' sebagai escape
+        if set(self.edges(closing)) != {inner} or closing not in self.final_states:
+            raise UnsupportedDFA(f"bentuk string {closing}")
+        if set(self.edges(inner)) - {inner, closing}:
+            raise UnsupportedDFA(f"bentuk string {inner}")
+        # prefix sudah memuat loop `inner`; ganti dengan loop yang juga menerima escape
+        if loop is not None:
+            prefix = prefix[:-len(f"{loop.regex()}*+")]
+        piece = ([loop.regex()] if loop else []) + [exit_set.regex() + back.regex()]
+        pattern = f"{prefix}(?:{'|'.join(piece)})*+{exit_set.regex()}"
+        self.alternatives.append((pattern, TOKEN, self.final_states[closing]))
+
+    def build(self):
+        self.space = "[" + _ranges([c for c in ASCII if c.isspace()]) + "]"
+        self.walk(self.start, "", frozenset())
+        return self.alternatives
+
+class RegexScanner:
+    def __init__(self, dfa):
+        builder = _Builder(dfa)
+        alternatives = builder.build()
+        # urutan alternatif tidak mengubah hasil (lookahead membuat semuanya saling
+        # lepas), tetapi mempengaruhi kecepatan: state final dengan loop (identifier,
+        # number) paling sering muncul, jadi dicoba lebih dulu
+        alternatives.sort(key=lambda alt: (alt[1] != TOKEN, not alt[0].endswith("*+")))
+
+        special = keyword_table(dfa)
+        self.special = special
+
+        self.parts = []
+        # kinds[m.lastindex] = (jenis, tipe token, indeks group carry, bisa keyword?)
+        self.kinds = [None]
+        for i, (pattern, kind, token_type) in enumerate(alternatives):
+            carry_idx = None
+            if kind == CARRY:
+                carry_idx = len(self.kinds) + 1
+                pattern = pattern.replace("(?P<carry>", "(", 1)
+            # hanya lexeme yang bisa sama dengan keyword (tanpa carry) perlu dicek
+            maybe_special = any(re.fullmatch(pattern, w, re.IGNORECASE) for w in special)
+            self.kinds.append((kind, token_type, carry_idx, maybe_special))
+            if kind == CARRY:
+                self.kinds.append(None)
+            self.parts.append(f"(?P<g{i}>{pattern})")
+        # whitespace dilewati sebagai awalan setiap match: satu iterasi per token
+        self.pattern = f"{builder.space}*+(?:{'|'.join(self.parts)})"
+        self.regex = re.compile(self.pattern)
+        self.space = re.compile(f"{builder.space}*+")
+        if self.regex.groups != len(self.kinds) - 1:
+            raise UnsupportedDFA("group tambahan di dalam pola")
+
+    def scan(self, source, positions=None):
+        # daftar token, atau None jika input harus diserahkan ke lexer DFA
+        kinds = self.kinds
+        special = self.special
+        tokens = []
+        append = tokens.append
+        carry = ""
+        carry_pos = 0
+        pos = 0
+        for m in self.regex.finditer(source):
+            if m.start() != pos:
+                return None
+            idx = m.lastindex
+            kind, token_type, carry_idx, maybe_special = kinds[idx]
+            if kind == TOKEN:
+                lexeme = m.group(idx)
+                if carry:
+                    lexeme = carry + lexeme
+                    if positions is not None:
+                        positions.append(carry_pos)
+                    carry = ""
+                    token_type = special.get(lexeme.lower(), token_type)
+                else:
+                    if positions is not None:
+                        positions.append(m.start(idx))
+                    if maybe_special:
+                        token_type = special.get(lexeme.lower(), token_type)
+                append((token_type, lexeme))
+            elif kind == CARRY:
+                if not carry:
+                    carry_pos = m.start(idx)
+                carry += m.group(carry_idx)
+            pos = m.end()
+        # sisa whitespace di akhir input
+        pos = self.space.match(source, pos).end()
+        if pos != len(source) or carry:
+            return None
+        return tokens
+
+_cache = (None, None)
+
+def get_scanner(dfa):
+    # satu scanner per objek dfa; None jika DFA tidak bisa dinyatakan sebagai regex
+    global _cache
+    if _cache[0] is dfa:
+        return _cache[1]
+    try:
+        scanner = RegexScanner(dfa)
+    except (UnsupportedDFA, re.error):
+        scanner = None
+    _cache = (dfa, scanner)
+    return scanner
+
+def tokenize(source_code, dfa, positions=None):
+    # antarmuka sama dengan lexer.tokenize: (0, tokens) atau (1, None)
+    scanner = get_scanner(dfa)
+    if scanner is not None:
+        mark = len(positions) if positions is not None else 0
+        tokens = scanner.scan(source_code, positions)
+        if tokens is not None:
+            return (0, tokens)
+        if positions is not None:
+            del positions[mark:]
+    return dfa_tokenize(source_code, dfa, positions)
+
+def main():
+    dfa = load_dfa_rules()
+    scanner = get_scanner(dfa)
+    if scanner is None:
+        print("DFA tidak dapat dinyatakan sebagai master regex; lexer DFA yang dipakai")
+        sys.exit(1)
+    if "--show" in sys.argv:
+        for part in scanner.parts:
+            print(part)
+    print(f"{len(scanner.parts)} alternatif")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+# Compile server: menjaga modul compiler, DFA rules, dan grammar tetap
+# termuat sehingga tiap request tidak membayar start-up Python.
+#
+#   python src/server.py --socket /tmp/pascals.sock [--workers N] [--parse-budget A,D,N] [--root DIR]
+#   python src/server.py --stdio [--workers N] [--parse-budget A,D,N] [--root DIR]
+#
+# Protokol: satu objek JSON per baris (request dan response).
+#
+#   request : {"id": 1, "source": "program p; ..."}   atau {"id": 1, "path": "a.pas"}
+#             ("path" relatif terhadap --root dan tidak boleh keluar darinya;
+#              tanpa --root hanya "source" yang diterima)
+#             opsional: "stage": "lexer" | "parser" | "semantic" (default semantic)
+#                       "all_errors": true/false (default true)
+#                       "max_errors": N
+#             {"id": 2, "op": "ping"}
+#   response: {"id": 1, "ok": true, "tokens": [[tipe, nilai], ...],
+#              "diagnostics": [{"stage": ..., "message": ..., "index": ...}],
+#              (diagnostic lexical juga memuat "offset", "line", "column")
+#              "tables": {"tab": [...], "btab": [...], "atab": [...]}, "ms": 1.23}
+#
+# Front end asyncio melayani banyak klien sekaligus; kompilasi dijalankan di
+# process pool yang worker-nya sudah di-warm-up (lihat _warm_up).
+#
+# Source dari klien tidak tepercaya, jadi parser2 selalu dijalankan dengan
+# ParseBudget (lihat parser2.py); input yang melampaui budget dan tidak bisa
+# diparse parser cepat (lihat parse_driver.py) dijawab
+# dengan diagnostic syntax "Parse dihentikan: ..." tanpa menahan worker.
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lexer import load_dfa_rules
+from lexer_codegen import tokenize
+from lexer_recovery import lexical_errors, line_col
+from parser2 import ProgramNode, Token, Terminal, ParseBudget, ParseBudgetExceeded
+from parse_driver import parse_tokens_budgeted
+from ast_transformer import ASTTransformer
+from ast_analyzer import SemanticAnalyzer, DEFAULT_MAX_ERRORS
+
+_dfa = None
+_budget = ParseBudget()
+_root = None
+
+def _init_worker(budget_spec, root):
+    global _budget, _root
+    # rantai tail list memakan satu frame per elemen; sarang program dibatasi ParseBudget
+    sys.setrecursionlimit(100000)
+    _budget = ParseBudget.from_spec(budget_spec)
+    _root = root
+    _warm_up()
+
+def _warm_up():
+    global _dfa
+    _dfa = load_dfa_rules()
+    # parse program minimal sekali agar semua jalur parser sudah pernah dijalankan
+    code, raw = tokenize("program w; mulai selesai.", _dfa)
+    ProgramNode().parse([Token(t, v) for t, v in raw], 0)
+
+def _readable(obj):
+    if isinstance(obj, (Token, Terminal)):
+        if obj.nilai is not None:
+            return str(obj.nilai)
+        return f"Any {obj.tipe}" if isinstance(obj, Terminal) else str(obj.tipe)
+    return str(obj)
+
+def _syntax_diagnostic(index, expected, found, rule_name):
+    return {
+        "stage": "syntax",
+        "message": f"Syntax Error: expected {_readable(expected)}, found {_readable(found)} ({rule_name})",
+        "index": index,
+    }
+
+def _resolve_path(path):
+    # (path absolut, None) atau (None, pesan error); symlink diikuti sebelum dicek
+    if _root is None:
+        return None, "request \"path\" tidak diizinkan (server dijalankan tanpa --root)"
+    if not isinstance(path, str):
+        return None, "request harus berisi \"source\" atau \"path\" (string)"
+    full = os.path.realpath(os.path.join(_root, path))
+    if os.path.commonpath([_root, full]) != _root:
+        return None, f"path {path!r} berada di luar --root"
+    return full, None
+
+def compile_request(request):
+    if _dfa is None:
+        _warm_up()
+    started = time.perf_counter()
+    stage = request.get("stage", "semantic")
+    all_errors = request.get("all_errors", True)
+    max_errors = request.get("max_errors", DEFAULT_MAX_ERRORS)
+    response = {"id": request.get("id"), "ok": False, "tokens": [], "diagnostics": [], "tables": None}
+
+    try:
+        if "source" in request:
+            source_code = request["source"]
+        else:
+            path, message = _resolve_path(request.get("path"))
+            if path is None:
+                response["diagnostics"].append({"stage": "protocol", "message": message, "index": None})
+                return response
+            with open(path, "r", encoding="utf-8") as f:
+                source_code = f.read()
+
+        return_code, raw_tokens = tokenize(source_code, _dfa)
+        if return_code == 1:
+            for offset, lexeme in lexical_errors(source_code, _dfa):
+                line, col = line_col(source_code, offset)
+                response["diagnostics"].append({"stage": "lexical", "message": f"token tidak valid {lexeme!r}",
+                                                "index": None, "offset": offset, "line": line, "column": col})
+            return response
+        response["tokens"] = [[t, v] for t, v in raw_tokens]
+        if stage == "lexer":
+            response["ok"] = True
+            return response
+
+        tokens = [Token(t, v) for t, v in raw_tokens]
+        try:
+            root, success, end_idx, error_ctx = parse_tokens_budgeted(tokens, recover=all_errors, budget=_budget)
+        except ParseBudgetExceeded as e:
+            response["diagnostics"].append({"stage": "syntax", "message": f"Parse dihentikan: {e}", "index": e.index})
+            return response
+        for err in error_ctx.errors:
+            response["diagnostics"].append(_syntax_diagnostic(*err))
+        if not success:
+            response["diagnostics"].append(_syntax_diagnostic(
+                error_ctx.max_index, error_ctx.expected, error_ctx.found, error_ctx.rule_name))
+            return response
+        if end_idx != len(tokens):
+            response["diagnostics"].append(_syntax_diagnostic(end_idx, "EOF", tokens[end_idx], "ProgramNode"))
+            return response
+        if error_ctx.errors:
+            return response
+        if stage == "parser":
+            response["ok"] = True
+            return response
+
+        ast_root = ASTTransformer().transform(root)
+        analyzer = SemanticAnalyzer(collect_errors=all_errors, max_errors=max_errors)
+        if all_errors:
+            errors = analyzer.analyze_all(ast_root)
+        else:
+            errors = []
+            try:
+                analyzer.analyze(ast_root)
+            except Exception as e:
+                msg = str(e)
+                errors = [msg if msg.startswith("Semantic Error") else "Semantic Error: " + msg]
+        for msg in errors:
+            response["diagnostics"].append({"stage": "semantic", "message": msg, "index": None})
+        response["tables"] = analyzer.dump_tables()
+        response["ok"] = not errors
+        return response
+
+    except RecursionError:
+        response["diagnostics"].append({"stage": "internal", "message": "program terlalu dalam (recursion limit)", "index": None})
+        return response
+    except Exception as e:
+        response["diagnostics"].append({"stage": "internal", "message": f"{type(e).__name__}: {e}", "index": None})
+        return response
+    finally:
+        response["ms"] = round((time.perf_counter() - started) * 1000, 3)
+
+def _protocol_error(request_id, message):
+    return {"id": request_id, "ok": False, "diagnostics": [{"stage": "protocol", "message": message, "index": None}]}
+
+class CompileServer:
+    def __init__(self, workers=None, budget_spec="", root=None):
+        self.workers = workers or os.cpu_count() or 1
+        root = os.path.realpath(root) if root is not None else None
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                        initargs=(budget_spec, root))
+
+    async def handle_line(self, line, write):
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            await write(_protocol_error(None, str(e)))
+            return
+        if not isinstance(request, dict):
+            await write(_protocol_error(None, f"request harus objek JSON, bukan {type(request).__name__}"))
+            return
+        if request.get("op") == "ping":
+            await write({"id": request.get("id"), "ok": True, "pong": True})
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            response = await loop.run_in_executor(self.pool, compile_request, request)
+        except Exception as e:
+            # mis. BrokenProcessPool jika worker mati; klien tetap mendapat response
+            response = {"id": request.get("id"), "ok": False, "diagnostics": [
+                {"stage": "internal", "message": f"{type(e).__name__}: {e}", "index": None}]}
+        await write(response)
+
+    async def serve_stream(self, readline, write):
+        # tiap baris diproses sebagai task sendiri: response bisa keluar tidak berurutan (pakai "id")
+        pending = set()
+        while True:
+            line = await readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            task = asyncio.create_task(self.handle_line(line, write))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+
+    async def _client(self, reader, writer):
+        lock = asyncio.Lock()
+
+        async def write(obj):
+            async with lock:
+                writer.write((json.dumps(obj) + "\n").encode("utf-8"))
+                await writer.drain()
+
+        try:
+            await self.serve_stream(reader.readline, write)
+        finally:
+            writer.close()
+
+    async def serve_unix(self, path):
+        if os.path.exists(path):
+            os.unlink(path)
+        server = await asyncio.start_unix_server(self._client, path=path, limit=2 ** 26)
+        print(f"compile server siap di {path}", file=sys.stderr, flush=True)
+        async with server:
+            await server.serve_forever()
+
+    async def serve_stdio(self):
+        loop = asyncio.get_running_loop()
+        lock = asyncio.Lock()
+
+        # stdin bisa berupa pipe maupun file biasa, jadi dibaca lewat thread
+        def readline():
+            return loop.run_in_executor(None, sys.stdin.buffer.readline)
+
+        async def write(obj):
+            async with lock:
+                sys.stdout.write(json.dumps(obj) + "\n")
+                sys.stdout.flush()
+
+        await self.serve_stream(readline, write)
+
+    def warm(self):
+        # paksa semua worker start (dan warm-up) sebelum request pertama
+        futures = [self.pool.submit(_warm_up) for _ in range(self.workers)]
+        for f in futures:
+            f.result()
+
+    def close(self):
+        self.pool.shutdown()
+
+def main():
+    ap = argparse.ArgumentParser(description="Compile server Pascal-S (JSON per baris)")
+    mode = ap.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--socket", help="path Unix socket")
+    mode.add_argument("--stdio", action="store_true", help="baca request dari stdin, tulis ke stdout")
+    ap.add_argument("--workers", type=int, default=None, help="jumlah worker process (default: jumlah CPU)")
+    ap.add_argument("--parse-budget", default="", metavar="A,D,N",
+                    help="batas parser2: percobaan rule per token, kedalaman parse, node CST (default parser2.py)")
+    ap.add_argument("--root", default=None, metavar="DIR",
+                    help="direktori yang boleh dibaca lewat request \"path\" (default: \"path\" ditolak)")
+    args = ap.parse_args()
+    try:
+        ParseBudget.from_spec(args.parse_budget)
+    except ValueError as e:
+        ap.error(str(e))
+    if args.root is not None and not os.path.isdir(args.root):
+        ap.error(f"--root {args.root!r} bukan direktori")
+
+    server = CompileServer(args.workers, args.parse_budget, args.root)
+    server.warm()
+    try:
+        if args.stdio:
+            asyncio.run(server.serve_stdio())
+        else:
+            asyncio.run(server.serve_unix(args.socket))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+if __name__ == "__main__":
+    main()
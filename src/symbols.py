@@ -0,0 +1,48 @@
+# Interning token untuk parser2.
+#
+# Saat Token dibuat (langsung setelah lexing), tipe token dan lexeme keyword/
+# operator dipetakan ke kode integer kecil, sehingga pencocokan Terminal di
+# parser2 cukup membandingkan integer, bukan string. Identifier di-intern di
+# pool simbol (sys.intern): nama yang sama selalu objek str yang sama, jadi
+# lookup dict di SemanticAnalyzer mengenai jalur identitas tanpa membandingkan
+# isi string.
+#
+# Kode hanya dibuat untuk Terminal di grammar parser2 (register_type/
+# register_lexeme, dipanggil saat parser2 di-import), jadi jumlahnya tetap.
+# Token hanya mencari kode: tipe atau lexeme yang tidak ada di grammar
+# (termasuk variasi huruf besar/kecil keyword) mendapat OTHER_CODE dan tidak
+# pernah cocok dengan Terminal yang memakai nilai, sama seperti perbandingan
+# string sebelumnya ("MULAI" bukan "mulai"). Kode hanya berlaku di dalam satu
+# proses.
+
+import sys
+
+# tipe yang lexemenya tidak terbatas: tidak diberi kode lexeme
+OPEN_TYPES = frozenset(("IDENTIFIER", "NUMBER", "STRING_LITERAL", "CHAR_LITERAL"))
+NO_CODE = -1
+OTHER_CODE = -2
+
+TYPE_CODES = {}
+LEXEME_CODES = {}
+
+def register_type(tipe):
+    code = TYPE_CODES.get(tipe)
+    if code is None:
+        code = TYPE_CODES[tipe] = len(TYPE_CODES)
+    return code
+
+def register_lexeme(nilai):
+    code = LEXEME_CODES.get(nilai)
+    if code is None:
+        code = LEXEME_CODES[nilai] = len(LEXEME_CODES)
+    return code
+
+def type_code(tipe):
+    return TYPE_CODES.get(tipe, OTHER_CODE)
+
+def lexeme_code(tipe, nilai):
+    if tipe in OPEN_TYPES:
+        return NO_CODE
+    return LEXEME_CODES.get(nilai, OTHER_CODE)
+
+intern_name = sys.intern
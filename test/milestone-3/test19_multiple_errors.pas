@@ -0,0 +1,36 @@
+program multierror;
+
+konstanta
+    ten = 10;
+
+tipe
+    complex = rekaman
+        re, im: real
+    selesai;
+
+variabel
+    i, j: integer;
+    p: boolean;
+    z: complex;
+    w: undefinedtype;
+
+prosedur dummy(variabel i: integer);
+mulai
+    i := k;
+    i := k + 1;
+    p := i
+selesai;
+
+mulai
+    ten := 5;
+    i := z.nope;
+    selama i lakukan
+        j := j + p;
+    jika p maka
+        i := 'a'
+    selain-itu
+        j := m * 2;
+    w := 3;
+    dummy(i, j);
+    writeln(i)
+selesai.